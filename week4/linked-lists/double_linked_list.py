@@ -1,50 +1,141 @@
 class DoubleNode:
-    def __init__(self, value):
+    __slots__ = ("value", "next", "prev", "owner")
+
+    def __init__(self, value, owner=None):
         self.value = value
         self.next = None  # Points to next node
         self.prev = None  # Points to previous node
+        self.owner = owner  # List the node is linked into, or None
 
 class DoublyLinkedList:
-    def __init__(self):
+    def __init__(self, iterable=()):
         self.head = None
+        self.tail = None  # Last node, so append does not walk the list
+        self._len = 0
+        self.extend(iterable)
 
     def append(self, value):
-        new_node = DoubleNode(value)
-        if self.head is None:  # Empty list
+        """Add value at the tail in O(1); returns its node."""
+        new_node = DoubleNode(value, self)
+        if self.tail is None:  # Empty list
+            self.head = self.tail = new_node
+        else:
+            new_node.prev = self.tail
+            self.tail.next = new_node
+            self.tail = new_node
+        self._len += 1
+        return new_node
+
+    def appendleft(self, value):
+        new_node = DoubleNode(value, self)
+        if self.head is None:
+            self.head = self.tail = new_node
+        else:
+            new_node.next = self.head
+            self.head.prev = new_node
             self.head = new_node
+        self._len += 1
+        return new_node
+
+    def extend(self, iterable):
+        # Link the new nodes locally and publish head/tail/len once at the end.
+        tail = dummy = DoubleNode(None)
+        count = 0
+        for value in iterable:
+            node = DoubleNode(value, self)
+            node.prev = tail
+            tail.next = tail = node
+            count += 1
+        if not count:
             return
+        first = dummy.next
+        first.prev = self.tail
+        if self.tail is None:
+            self.head = first
+        else:
+            self.tail.next = first
+        self.tail = tail
+        self._len += count
+
+    def remove(self, node):
+        """
+        Unlink `node` (a handle returned by append/appendleft) in O(1); returns
+        its value. Raises ValueError for a node of another list or one that
+        was already removed.
+        """
+        if node.owner is not self:
+            raise ValueError("node is not in this list")
+        if node.prev is None:
+            self.head = node.next
+        else:
+            node.prev.next = node.next
+        if node.next is None:
+            self.tail = node.prev
+        else:
+            node.next.prev = node.prev
+        node.prev = node.next = node.owner = None
+        self._len -= 1
+        return node.value
+
+    def pop(self):
+        """Remove and return the last value in O(1)."""
+        if self.tail is None:
+            raise IndexError("pop from empty list")
+        return self.remove(self.tail)
+
+    def popleft(self):
+        """Remove and return the first value in O(1)."""
+        if self.head is None:
+            raise IndexError("pop from empty list")
+        return self.remove(self.head)
+
+    def __len__(self):
+        return self._len
+
+    def __bool__(self):
+        return self.head is not None
+
+    def __iter__(self):
         current = self.head
-        while current.next:
+        while current:
+            yield current.value
             current = current.next
-        current.next = new_node
-        new_node.prev = current
+
+    def __reversed__(self):
+        current = self.tail
+        while current:
+            yield current.value
+            current = current.prev
+
+    def __repr__(self):
+        return f"DoublyLinkedList({list(self)!r})"
 
     def display_forward(self):
         current = self.head
         while current:
             print(current.value, end=" <-> ")
-            last = current
             current = current.next
         print("None")
 
     def display_backward(self):
-        # Go to the last node
-        current = self.head
-        if current is None:
-            print("None")
-            return
-        while current.next:
-            current = current.next
-        # Traverse backwards
+        # Start from the tail pointer and traverse backwards
+        current = self.tail
         while current:
             print(current.value, end=" <-> ")
             current = current.prev
         print("None")
 
-# Example
-dll = DoublyLinkedList()
-dll.append(10)
-dll.append(20)
-dll.append(30)
-dll.display_forward()   # 10 <-> 20 <-> 30 <-> None
-dll.display_backward()  # 30 <-> 20 <-> 10 <-> None
+if __name__ == "__main__":
+    # Example
+    dll = DoublyLinkedList()
+    dll.append(10)
+    middle = dll.append(20)
+    dll.append(30)
+    dll.display_forward()   # 10 <-> 20 <-> 30 <-> None
+    dll.display_backward()  # 30 <-> 20 <-> 10 <-> None
+
+    dll.remove(middle)
+    dll.extend([40, 50])
+    print(len(dll), list(reversed(dll)))  # 4 [50, 40, 30, 10]
+    print(dll.popleft(), dll.pop())       # 10 50
+    dll.display_forward()   # 30 <-> 40 <-> None
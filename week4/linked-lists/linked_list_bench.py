@@ -0,0 +1,90 @@
+# Benchmark of the linked lists against list and collections.deque.
+# Each row times n operations of one kind; ops a container can only do in
+# O(n) per call (list.pop(0), list.remove, SinglyLinkedList.pop) run on a
+# smaller n and are reported per operation, marked with *.
+#
+#   python linked_list_bench.py --n 1e6
+import argparse
+import time
+from collections import deque
+
+from single_list_custom import SinglyLinkedList
+from double_linked_list import DoublyLinkedList
+
+SLOW_N = 20_000  # size used for the O(n)-per-op rows
+
+
+def per_op(fn, ops):
+    t0 = time.perf_counter()
+    fn()
+    return (time.perf_counter() - t0) / ops
+
+
+def bench(make, n):
+    """Per-op seconds for append, extend, iterate, popleft, pop and remove-middle."""
+    rows = {}
+    c = make()
+    rows["append"] = per_op(lambda: [c.append(i) for i in range(n)], n)
+    c = make()
+    rows["extend"] = per_op(lambda: c.extend(range(n)), n)
+    rows["iterate"] = per_op(lambda: sum(1 for _ in c), n)
+    rows["reversed"] = per_op(lambda: sum(1 for _ in reversed(c)), n)
+    slow = isinstance(c, list)
+    k = min(n, SLOW_N) if slow else n
+    if slow:
+        c = make()
+        c.extend(range(k))
+    rows["popleft"] = per_op(lambda: [_popleft(c) for _ in range(k)], k), slow
+    c = make()
+    slow = isinstance(c, SinglyLinkedList)
+    k = min(n, SLOW_N) if slow else n
+    c.extend(range(k))
+    rows["pop"] = per_op(lambda: [c.pop() for _ in range(k)], k), slow
+    rows["remove middle"] = _remove_middle(make, n)
+    return rows
+
+
+def _popleft(c):
+    return c.pop(0) if isinstance(c, list) else c.popleft()
+
+
+def _remove_middle(make, n):
+    # Remove every other element, starting from the middle of the container.
+    c = make()
+    if isinstance(c, DoublyLinkedList):
+        handles = [c.append(i) for i in range(n)]
+        victims = handles[n // 2::2] + handles[1:n // 2:2]
+        return per_op(lambda: [c.remove(h) for h in victims], len(victims)), False
+    if isinstance(c, SinglyLinkedList):
+        handles = [c.append(i) for i in range(n)]
+        before = handles[n // 2 - 1::2][:-1]  # predecessors of the victims
+        return per_op(lambda: [c.remove_after(h) for h in before], len(before)), False
+    k = min(n, SLOW_N)
+    c.extend(range(k))
+    values = list(range(k // 2, k, 2))
+    return per_op(lambda: [c.remove(v) for v in values], len(values)), True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Linked lists vs list vs deque")
+    parser.add_argument("--n", type=float, default=1e6)
+    args = parser.parse_args()
+    n = int(args.n)
+
+    containers = {
+        "list": list,
+        "deque": deque,
+        "SinglyLinkedList": SinglyLinkedList,
+        "DoublyLinkedList": DoublyLinkedList,
+    }
+    results = {name: bench(make, n) for name, make in containers.items()}
+    ops = list(results["list"])
+    print(f"n={n:,}  ns per operation (* = O(n) per op, run on n={SLOW_N:,})")
+    print(f"{'':<14}" + "".join(f"{name:>18}" for name in containers))
+    for op in ops:
+        cells = []
+        for name in containers:
+            t = results[name][op]
+            t, slow = t if isinstance(t, tuple) else (t, False)
+            cells.append(f"{t * 1e9:>17.0f}{'*' if slow else ' '}")
+        print(f"{op:<14}" + "".join(cells))
@@ -1,22 +1,121 @@
 class Node:
+    __slots__ = ("obj", "next")
+
     def __init__(self, value):
         self.obj = value
         self.next = None  # Pointer to next node
 
 class SinglyLinkedList:
-    def __init__(self):
+    def __init__(self, iterable=()):
         self.head = None
+        self.tail = None  # Last node, so insert does not walk the list
+        self._len = 0
+        self.extend(iterable)
 
     def insert(self, value):
+        """Append value at the tail in O(1); returns its node."""
         new_node = Node(value)
-        if self.head is None:  # Empty list
-            self.head = new_node
+        if self.tail is None:  # Empty list
+            self.head = self.tail = new_node
+        else:
+            self.tail.next = new_node
+            self.tail = new_node
+        self._len += 1
+        return new_node
+
+    append = insert
+
+    def appendleft(self, value):
+        new_node = Node(value)
+        new_node.next = self.head
+        self.head = new_node
+        if self.tail is None:
+            self.tail = new_node
+        self._len += 1
+        return new_node
+
+    def extend(self, iterable):
+        # Link the new nodes locally and publish head/tail/len once at the end.
+        tail = dummy = Node(None)
+        count = 0
+        for value in iterable:
+            tail.next = tail = Node(value)
+            count += 1
+        if not count:
             return
-        # Traverse to the end
+        if self.tail is None:
+            self.head = dummy.next
+        else:
+            self.tail.next = dummy.next
+        self.tail = tail
+        self._len += count
+
+    def popleft(self):
+        """Remove and return the first value in O(1)."""
+        if self.head is None:
+            raise IndexError("pop from empty list")
+        node = self.head
+        self.head = node.next
+        if self.head is None:  # List became empty
+            self.tail = None
+        self._len -= 1
+        return node.obj
+
+    def pop(self):
+        """
+        Remove and return the last value.
+
+        O(n): a singly linked node does not know its predecessor, so the
+        list is walked up to the node before the tail.
+        """
+        if self.head is None:
+            raise IndexError("pop from empty list")
+        if self.head is self.tail:
+            return self.popleft()
+        current = self.head
+        while current.next is not self.tail:
+            current = current.next
+        value = self.tail.obj
+        current.next = None
+        self.tail = current
+        self._len -= 1
+        return value
+
+    def remove_after(self, node):
+        """
+        Unlink and return the value after `node` in O(1); node=None removes
+        the head. This is the O(1) removal a singly linked list can offer:
+        the handle must be the predecessor of the node to drop.
+        """
+        if node is None:
+            return self.popleft()
+        target = node.next
+        if target is None:
+            raise IndexError("no node after the given one")
+        node.next = target.next
+        if target is self.tail:
+            self.tail = node
+        self._len -= 1
+        return target.obj
+
+    def __len__(self):
+        return self._len
+
+    def __bool__(self):
+        return self.head is not None
+
+    def __iter__(self):
         current = self.head
-        while current.next:    
+        while current:
+            yield current.obj
             current = current.next
-        current.next = new_node
+
+    def __reversed__(self):
+        # No back pointers: snapshot the values, then walk them backwards.
+        return reversed(list(self))
+
+    def __repr__(self):
+        return f"SinglyLinkedList({list(self)!r})"
 
     def display(self):
         current = self.head
@@ -25,9 +124,16 @@ class SinglyLinkedList:
             current = current.next
         print("None")
 
-# Example
-lst = SinglyLinkedList()
-lst.insert(10)
-lst.insert(20)
-lst.insert(30)
-lst.display()  # 10 -> 20 -> 30 -> None
+if __name__ == "__main__":
+    # Example
+    lst = SinglyLinkedList()
+    lst.insert(10)
+    lst.insert(20)
+    lst.insert(30)
+    lst.display()  # 10 -> 20 -> 30 -> None
+
+    lst.extend([40, 50])
+    print(len(lst), list(reversed(lst)))   # 5 [50, 40, 30, 20, 10]
+    print(lst.popleft(), lst.pop())        # 10 50
+    lst.remove_after(lst.head)             # drops 30
+    lst.display()  # 20 -> 40 -> None
@@ -0,0 +1,295 @@
+# Unrolled linked list: a doubly linked list of chunks, each chunk holding up
+# to `capacity` elements in a Python list (or an array.array when a typecode
+# is given). One node header and two pointers are paid per chunk instead of
+# per element, neighbours sit next to each other in memory, and iteration
+# runs over whole chunks at C speed.
+#
+# Chunks split in half when they overflow, and a chunk that drops below half
+# full after a delete is merged with (or refilled from) a neighbour, so
+# deletes do not leave a trail of near-empty chunks. Indexing walks chunks
+# from the nearer end: O(n / capacity) hops plus O(capacity) inside the
+# chunk, which is O(sqrt n) when capacity is about sqrt n.
+#
+#   python unrolled_linked_list.py --n 1e6   # memory / speed comparison
+import argparse
+import math
+import time
+import tracemalloc
+from array import array
+from collections import deque
+from itertools import chain, islice
+
+from single_list_custom import SinglyLinkedList
+from double_linked_list import DoublyLinkedList
+
+DEFAULT_CAPACITY = 64
+
+
+class Chunk:
+    __slots__ = ("items", "next", "prev")
+
+    def __init__(self, items):
+        self.items = items
+        self.next = None  # Points to next chunk
+        self.prev = None  # Points to previous chunk
+
+
+class UnrolledLinkedList:
+    """
+    Sequence stored as a linked list of fixed-capacity chunks.
+
+    Args:
+        iterable: Initial values.
+        capacity: Most elements per chunk (at least 2).
+        typecode: If given, chunks are array.array(typecode), which stores
+            numbers unboxed; otherwise chunks are Python lists.
+    """
+
+    def __init__(self, iterable=(), capacity=DEFAULT_CAPACITY, typecode=None):
+        if capacity < 2:
+            raise ValueError("capacity must be at least 2")
+        self.capacity = capacity
+        self.typecode = typecode
+        self.head = None
+        self.tail = None
+        self._len = 0
+        self.extend(iterable)
+
+    def _new_items(self, values=()):
+        return array(self.typecode, values) if self.typecode else list(values)
+
+    # ---------- Chunk plumbing ----------
+    def _link_after(self, chunk, new):
+        # Insert `new` after `chunk`; chunk=None puts it at the head.
+        if chunk is None:
+            new.next = self.head
+            if self.head is not None:
+                self.head.prev = new
+            self.head = new
+        else:
+            new.prev = chunk
+            new.next = chunk.next
+            if chunk.next is not None:
+                chunk.next.prev = new
+            chunk.next = new
+        if new.next is None:
+            self.tail = new
+
+    def _unlink(self, chunk):
+        if chunk.prev is None:
+            self.head = chunk.next
+        else:
+            chunk.prev.next = chunk.next
+        if chunk.next is None:
+            self.tail = chunk.prev
+        else:
+            chunk.next.prev = chunk.prev
+        chunk.prev = chunk.next = None
+
+    def _split(self, chunk):
+        # Move the upper half of an overflowing chunk into a new one after it.
+        half = len(chunk.items) // 2
+        self._link_after(chunk, Chunk(chunk.items[half:]))
+        del chunk.items[half:]
+
+    def _rebalance(self, chunk):
+        # Called after a delete left `chunk` under half full: merge it with a
+        # neighbour if both fit in one chunk, otherwise even the two out.
+        a, b = chunk, chunk.next
+        if b is None:
+            a, b = chunk.prev, chunk
+            if a is None:  # only chunk
+                if not chunk.items:
+                    self._unlink(chunk)
+                return
+        if len(a.items) + len(b.items) <= self.capacity:
+            a.items.extend(b.items)
+            self._unlink(b)
+            return
+        k = (len(b.items) - len(a.items)) // 2
+        if k > 0:
+            a.items.extend(b.items[:k])
+            del b.items[:k]
+        elif k < 0:
+            b.items[:0] = a.items[k:]
+            del a.items[k:]
+
+    def _locate(self, index):
+        # (chunk, offset) of a non-negative index, walking from the nearer end.
+        if index < self._len // 2:
+            chunk = self.head
+            while index >= len(chunk.items):
+                index -= len(chunk.items)
+                chunk = chunk.next
+            return chunk, index
+        index = self._len - index
+        chunk = self.tail
+        while index > len(chunk.items):
+            index -= len(chunk.items)
+            chunk = chunk.prev
+        return chunk, len(chunk.items) - index
+
+    def _index(self, index):
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("list index out of range")
+        return index
+
+    # ---------- Adding ----------
+    def append(self, value):
+        if self.tail is None or len(self.tail.items) >= self.capacity:
+            self._link_after(self.tail, Chunk(self._new_items()))
+        self.tail.items.append(value)
+        self._len += 1
+
+    def appendleft(self, value):
+        if self.head is None or len(self.head.items) >= self.capacity:
+            self._link_after(None, Chunk(self._new_items()))
+        self.head.items.insert(0, value)
+        self._len += 1
+
+    def extend(self, iterable):
+        it = iter(iterable)
+        if self.tail is not None:
+            # Top up the last chunk first, then add full chunks.
+            room = self.capacity - len(self.tail.items)
+            before = len(self.tail.items)
+            self.tail.items.extend(islice(it, room))
+            self._len += len(self.tail.items) - before
+        while True:
+            items = self._new_items(islice(it, self.capacity))
+            if not items:
+                return
+            self._link_after(self.tail, Chunk(items))
+            self._len += len(items)
+
+    def insert(self, index, value):
+        """Insert value before index, like list.insert."""
+        if index < 0:
+            index = max(0, index + self._len)
+        if index >= self._len:
+            self.append(value)
+            return
+        chunk, offset = self._locate(index)
+        chunk.items.insert(offset, value)
+        self._len += 1
+        if len(chunk.items) > self.capacity:
+            self._split(chunk)
+
+    # ---------- Removing ----------
+    def pop(self, index=-1):
+        if not self._len:
+            raise IndexError("pop from empty list")
+        chunk, offset = self._locate(self._index(index))
+        value = chunk.items.pop(offset)
+        self._len -= 1
+        if len(chunk.items) < self.capacity // 2:
+            self._rebalance(chunk)
+        return value
+
+    def popleft(self):
+        return self.pop(0)
+
+    def __delitem__(self, index):
+        self.pop(index)
+
+    # ---------- Access ----------
+    def __getitem__(self, index):
+        chunk, offset = self._locate(self._index(index))
+        return chunk.items[offset]
+
+    def __setitem__(self, index, value):
+        chunk, offset = self._locate(self._index(index))
+        chunk.items[offset] = value
+
+    def __len__(self):
+        return self._len
+
+    def __bool__(self):
+        return self._len > 0
+
+    def chunks(self):
+        chunk = self.head
+        while chunk:
+            yield chunk.items
+            chunk = chunk.next
+
+    def __iter__(self):
+        return chain.from_iterable(self.chunks())
+
+    def __reversed__(self):
+        chunk = self.tail
+        while chunk:
+            yield from reversed(chunk.items)
+            chunk = chunk.prev
+
+    def __repr__(self):
+        return f"UnrolledLinkedList({list(self)!r}, capacity={self.capacity})"
+
+    def display(self):
+        for items in self.chunks():
+            print(list(items), end=" -> ")
+        print("None")
+
+
+# ---------- Comparison ----------
+def _measure(build):
+    # (object, bytes allocated while building it)
+    tracemalloc.start()
+    obj = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return obj, size
+
+
+def _per_item(fn, n, repeats=3):
+    best = float("inf")
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best / n
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Unrolled linked list vs node-per-element lists")
+    parser.add_argument("--n", type=float, default=1e6)
+    parser.add_argument("--capacity", type=int, default=DEFAULT_CAPACITY)
+    args = parser.parse_args()
+    n = int(args.n)
+    root = max(2, math.isqrt(n))
+    # Shared values, so only container overhead is measured. The array('q')
+    # variant is the exception: it also holds the numbers, unboxed, which
+    # the others keep as separate 28-byte int objects.
+    values = list(range(n))
+
+    # Example
+    u = UnrolledLinkedList(range(10), capacity=4)
+    u.insert(5, "x")
+    del u[0]
+    u.display()  # [1, 2, 3] -> [4, 'x'] -> [5, 6, 7] -> [8, 9] -> None
+
+    builders = [
+        ("list", lambda: list(values)),
+        ("deque", lambda: deque(values)),
+        ("SinglyLinkedList", lambda: SinglyLinkedList(values)),
+        ("DoublyLinkedList", lambda: DoublyLinkedList(values)),
+        ("UnrolledLinkedList", lambda: UnrolledLinkedList(values, args.capacity)),
+        ("Unrolled, array('q')", lambda: UnrolledLinkedList(values, args.capacity, "q")),
+        ("Unrolled, cap=sqrt n", lambda: UnrolledLinkedList(values, root)),
+    ]
+    print(f"\nn={n:,}, capacity={args.capacity}")
+    print(f"{'':<22}{'bytes/elem':>11}{'iterate ns':>12}{'index ns':>10}{'mid insert ns':>15}")
+    probes = values[:: max(1, n // 1000)]
+    for label, build in builders:
+        obj, size = _measure(build)
+        it_t = _per_item(lambda: deque(obj, maxlen=0), n)
+        if hasattr(obj, "__getitem__"):
+            ix_t = _per_item(lambda: [obj[i] for i in probes], len(probes), repeats=1)
+            k = min(n, 1000)
+            ins_t = _per_item(lambda: [obj.insert(len(obj) // 2, 0) for _ in range(k)], k, repeats=1)
+            row = f"{ix_t * 1e9:>10.0f}{ins_t * 1e9:>15.0f}"
+        else:
+            row = f"{'-':>10}{'-':>15}"  # no indexed access on the node lists
+        print(f"{label:<22}{size / n:>11.1f}{it_t * 1e9:>12.1f}{row}")
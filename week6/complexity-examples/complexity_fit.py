@@ -0,0 +1,199 @@
+# Empirical complexity estimator.
+#
+# Runs a registered function over a geometric series of input sizes, fits
+# the timings to t(n) = c * f(n) for f in 1, log n, sqrt n, n, n log n, n^2
+# and n^3, reports the best model with a confidence value and extrapolates
+# the running time at a target N.
+#
+#   python complexity_fit.py                       # every registered function
+#   python complexity_fit.py binary_search sieve --target 1e9
+import argparse
+import math
+import os
+import random
+import sys
+import time
+
+MODELS = {
+    "O(1)": lambda n: 1.0,
+    "O(log n)": lambda n: math.log2(n),
+    "O(sqrt n)": lambda n: math.sqrt(n),
+    "O(n)": lambda n: float(n),
+    "O(n log n)": lambda n: n * math.log2(n),
+    "O(n^2)": lambda n: float(n) ** 2,
+    "O(n^3)": lambda n: float(n) ** 3,
+}
+
+REGISTRY = {}
+
+
+def register(name, fn, make_input, start=16, max_n=10**7):
+    """
+    Register `fn` for fitting.
+
+    Args:
+        name: Name shown in reports and accepted on the command line.
+        fn: Function to time; called as fn(*make_input(n)).
+        make_input: Builds the argument tuple for size n (not timed).
+        start: First input size of the geometric series.
+        max_n: Largest input size to try.
+    """
+    REGISTRY[name] = (fn, make_input, start, max_n)
+
+
+# ---------- Timing ----------
+def time_call(fn, args, min_time=0.02, rounds=3):
+    """Seconds per call: repeat until `min_time` has passed, best of `rounds`."""
+    best = float("inf")
+    for _ in range(rounds):
+        reps = 0
+        t0 = time.perf_counter()
+        while True:
+            fn(*args)
+            reps += 1
+            elapsed = time.perf_counter() - t0
+            if elapsed >= min_time:
+                break
+        best = min(best, elapsed / reps)
+    return best
+
+
+def sweep(fn, make_input, start=16, max_n=10**7, factor=2, budget=5.0, max_call=0.5):
+    """
+    Time fn over n = start, start*factor, ... and return [(n, seconds)].
+
+    Stops at max_n, when one call takes longer than `max_call` seconds, or
+    when the sweep has used `budget` seconds.
+    """
+    points = []
+    t_start = time.perf_counter()
+    n = start
+    while n <= max_n:
+        args = make_input(n)
+        t = time_call(fn, args)
+        points.append((n, t))
+        if t > max_call or time.perf_counter() - t_start > budget:
+            break
+        n = int(n * factor)
+    return points
+
+
+# ---------- Fitting ----------
+def fit_model(points, f):
+    """
+    Least-squares fit of t = c * f(n) on relative error.
+
+    Returns (c, rss), where rss is the sum of squared relative residuals, so
+    fast and slow sizes weigh the same.
+    """
+    fs = [f(n) for n, _ in points]
+    num = sum(fi / t for fi, (_, t) in zip(fs, points))
+    den = sum((fi / t) ** 2 for fi, (_, t) in zip(fs, points))
+    c = num / den
+    rss = sum((1 - c * fi / t) ** 2 for fi, (_, t) in zip(fs, points))
+    return c, rss
+
+
+def fit(points):
+    """
+    Fit every model and return a result dict.
+
+    Keys: model, c, rss, confidence, runner_up, fits (all (name, c, rss)).
+    Confidence is 1 - rss_best / rss_runner_up: near 1 when the best model
+    clearly beats every other one, near 0 when two models explain the data
+    equally well.
+    """
+    fits = sorted(((name, *fit_model(points, f)) for name, f in MODELS.items()),
+                  key=lambda r: r[2])
+    (best, c, rss), (second, _, rss2) = fits[0], fits[1]
+    confidence = 1 - rss / rss2 if rss2 > 0 else 0.0
+    return {"model": best, "c": c, "rss": rss, "confidence": confidence,
+            "runner_up": second, "fits": fits}
+
+
+def extrapolate(result, n):
+    """Predicted seconds per call at size n under the best-fit model."""
+    return result["c"] * MODELS[result["model"]](n)
+
+
+def pretty(sec):
+    if sec < 1e-3: return f"{sec*1e6:.2f} µs"
+    if sec < 1: return f"{sec*1e3:.2f} ms"
+    if sec < 3600: return f"{sec:.2f} s"
+    if sec < 86400 * 365: return f"{sec/3600:.1f} h"
+    return f"{sec/(86400*365):.1f} years"
+
+
+# ---------- Registered week6 / week7 functions ----------
+def _register_defaults():
+    here = os.path.dirname(os.path.abspath(__file__))
+    sys.path.insert(0, os.path.join(here, "..", "..", "week7", "tests"))
+
+    from search import linear_search, binary_search, set_search
+    from primes import is_prime_naive, is_prime_sqrt, sieve
+    from find_sum import two_sum_bruteforce, two_sum_twoptr, two_sum_hash
+    from find_duplicates import has_duplicates_bruteforce, has_duplicates_sort, has_duplicates_set
+    from max_item import max_sort, max_linear, max_builtin
+
+    def sorted_range(n):
+        data = list(range(n))
+        return data, n - 1  # worst case for linear search
+
+    def set_range(n):
+        return set(range(n)), n - 1
+
+    def prime_at_least(n):
+        while not is_prime_sqrt(n):
+            n += 1
+        return (n,)
+
+    def distinct(n):
+        # No duplicates and no matching pair: every algorithm does full work.
+        return (random.sample(range(4 * n), n),)
+
+    def no_pair(n):
+        return [2 * x for x in random.sample(range(2 * n), n)], 1
+
+    def random_list(n):
+        return ([random.random() for _ in range(n)],)
+
+    register("linear_search", linear_search, sorted_range)
+    register("binary_search", binary_search, sorted_range)
+    register("set_search", set_search, set_range)
+    register("is_prime_naive", is_prime_naive, prime_at_least, start=1_000)
+    register("is_prime_sqrt", is_prime_sqrt, prime_at_least, start=1_000, max_n=10**14)
+    register("sieve", sieve, lambda n: (n,), start=1_000)
+    register("two_sum_bruteforce", two_sum_bruteforce, no_pair)
+    register("two_sum_twoptr", two_sum_twoptr, no_pair)
+    register("two_sum_hash", two_sum_hash, no_pair)
+    register("has_duplicates_bruteforce", has_duplicates_bruteforce, distinct)
+    register("has_duplicates_sort", has_duplicates_sort, distinct)
+    register("has_duplicates_set", has_duplicates_set, distinct)
+    register("max_sort", max_sort, random_list)
+    register("max_linear", max_linear, random_list)
+    register("max_builtin", max_builtin, random_list)
+
+
+if __name__ == "__main__":
+    _register_defaults()
+    parser = argparse.ArgumentParser(description="Fit running times to complexity models")
+    parser.add_argument("names", nargs="*", help="registered functions (default: all)")
+    parser.add_argument("--target", type=float, default=1e9, help="N to extrapolate to")
+    parser.add_argument("--budget", type=float, default=5.0, help="seconds per sweep")
+    parser.add_argument("--verbose", action="store_true", help="print every measured point")
+    args = parser.parse_args()
+
+    target = int(args.target)
+    for name in args.names or list(REGISTRY):
+        fn, make_input, start, max_n = REGISTRY[name]
+        points = sweep(fn, make_input, start, max_n, budget=args.budget)
+        if len(points) < 3:
+            print(f"{name:<26} not enough sizes measured ({len(points)})")
+            continue
+        if args.verbose:
+            for n, t in points:
+                print(f"    n={n:<12} {pretty(t)}")
+        result = fit(points)
+        print(f"{name:<26} best={result['model']:<11} confidence={result['confidence']:.2f} "
+              f"(runner-up {result['runner_up']})  sizes {points[0][0]}..{points[-1][0]}  "
+              f"predicted at n={target:.0e}: {pretty(extrapolate(result, target))}")
@@ -0,0 +1,273 @@
+# Operation counting for sorting and search functions.
+#
+# The algorithms are not modified, so there is zero overhead when counting
+# is off. Instead the *input* is instrumented:
+#   - every element is wrapped in a Counted proxy that counts comparisons
+#     and hashes,
+#   - the list itself is a CountingList that counts element writes; its
+#     slices, copies and concatenations stay CountingLists. Stores into
+#     lists the algorithm builds itself are invisible, so when it returns
+#     such a list, writes are reported as n/a instead of an undercount,
+#   - a profile hook, installed only inside count_ops(), records calls and
+#     the maximum recursion depth of the algorithm's module,
+#   - tracemalloc records the peak bytes allocated. Lists the algorithm
+#     builds itself (comprehensions, list(...)) are invisible to the
+#     proxies, so memory use is reported only as this peak.
+#
+#   with count_ops() as ops:
+#       out = quicksort(ops.wrap(data))
+#   print(ops.report())
+import sys
+import tracemalloc
+
+_active = None  # OpCounter currently collecting, or None
+
+
+def _value(x):
+    return x.value if isinstance(x, Counted) else x
+
+
+class Counted:
+    """Proxy around one element that counts comparisons and hashes."""
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def _compared(self):
+        if _active is not None:
+            _active.comparisons += 1
+
+    def __lt__(self, other):
+        self._compared()
+        return self.value < _value(other)
+
+    def __le__(self, other):
+        self._compared()
+        return self.value <= _value(other)
+
+    def __gt__(self, other):
+        self._compared()
+        return self.value > _value(other)
+
+    def __ge__(self, other):
+        self._compared()
+        return self.value >= _value(other)
+
+    def __eq__(self, other):
+        self._compared()
+        return self.value == _value(other)
+
+    def __ne__(self, other):
+        self._compared()
+        return self.value != _value(other)
+
+    def __hash__(self):
+        if _active is not None:
+            _active.hashes += 1
+        return hash(self.value)
+
+    def __repr__(self):
+        return f"Counted({self.value!r})"
+
+
+class CountingList(list):
+    """A list that counts element writes; lists derived from it are CountingLists too."""
+
+    def _wrote(self, n=1):
+        if _active is not None:
+            _active.writes += n
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return CountingList(list.__getitem__(self, i))
+        return list.__getitem__(self, i)
+
+    def __setitem__(self, i, value):
+        if isinstance(i, slice):
+            value = list(value)
+            self._wrote(len(value))
+        else:
+            self._wrote()
+        list.__setitem__(self, i, value)
+
+    def __add__(self, other):
+        return CountingList(list.__add__(self, other))
+
+    def copy(self):
+        return CountingList(list.copy(self))
+
+    def append(self, value):
+        self._wrote()
+        list.append(self, value)
+
+    def extend(self, values):
+        values = list(values)
+        self._wrote(len(values))
+        list.extend(self, values)
+
+    def insert(self, i, value):
+        self._wrote()
+        list.insert(self, i, value)
+
+
+class OpCounter:
+    """Counters collected inside one count_ops() block."""
+
+    FIELDS = ("comparisons", "hashes", "writes", "calls", "max_depth", "peak_bytes")
+
+    def __init__(self, track_calls=True):
+        self.track_calls = track_calls
+        self.comparisons = 0
+        self.hashes = 0
+        self.writes = 0
+        self.calls = 0
+        self.max_depth = 0
+        self.peak_bytes = 0
+        self._depth = 0
+        self._files = set()
+
+    def wrap(self, data):
+        """Return an instrumented copy of `data` (a CountingList of Counted elements)."""
+        return wrap(data)
+
+    def track(self, fn):
+        """Count calls and recursion depth for functions defined in fn's source file."""
+        self._files.add(fn.__code__.co_filename)
+        return fn
+
+    def _profile(self, frame, event, arg):
+        if frame.f_code.co_filename not in self._files or frame.f_code.co_filename == __file__:
+            return
+        if event == "call":
+            self.calls += 1
+            self._depth += 1
+            if self._depth > self.max_depth:
+                self.max_depth = self._depth
+        elif event == "return":
+            self._depth -= 1
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.FIELDS}
+
+    def report(self):
+        return "  ".join(f"{name}={'n/a' if getattr(self, name) is None else getattr(self, name)}"
+                         for name in self.FIELDS)
+
+
+class count_ops:
+    """
+    Context manager that collects operation counts for instrumented inputs.
+
+    Only data passed through ``ops.wrap()`` is counted. Calls and recursion
+    depth are recorded for functions registered with ``ops.track(fn)``.
+    Counting blocks do not nest. A profiler or tracemalloc session that was
+    already running is restored on exit; in the latter case its peak is
+    reset on entry, so the block's own peak can be measured.
+    """
+
+    def __init__(self, track_calls=True):
+        self.counter = OpCounter(track_calls)
+
+    def __enter__(self):
+        global _active
+        if _active is not None:
+            raise RuntimeError("count_ops blocks cannot be nested")
+        _active = self.counter
+        self._was_tracing = tracemalloc.is_tracing()
+        if self._was_tracing:
+            self._base = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        else:
+            self._base = 0
+            tracemalloc.start()
+        self._profiler = sys.getprofile()
+        if self.counter.track_calls:
+            sys.setprofile(self.counter._profile)
+        return self.counter
+
+    def __exit__(self, *exc):
+        global _active
+        if self.counter.track_calls:
+            sys.setprofile(self._profiler)
+        self.counter.peak_bytes = tracemalloc.get_traced_memory()[1] - self._base
+        if not self._was_tracing:
+            tracemalloc.stop()
+        _active = None
+
+
+def wrap(data):
+    """Return an instrumented copy of `data` (a CountingList of Counted elements)."""
+    return CountingList(Counted(x) for x in data)
+
+
+def unwrap(seq):
+    """Plain values of an instrumented sequence."""
+    return [_value(x) for x in seq]
+
+
+def measure(fn, data, *args, track=None):
+    """
+    Run fn(wrapped data, *args) under count_ops and return (result, OpCounter).
+
+    Calls are tracked in the source file of `track` (default: `fn`), which
+    matters when `fn` is a thin wrapper defined elsewhere.
+    """
+    wrapped = wrap(data)
+    with count_ops() as ops:
+        ops.track(track or fn)
+        result = fn(wrapped, *args)
+    if isinstance(result, list):
+        if not isinstance(result, CountingList):
+            ops.writes = None  # built in lists the counter cannot see
+        result = unwrap(result)
+    return result, ops
+
+
+# --- Demo: sorting.py and search.py by operation count ---
+if __name__ == "__main__":
+    import os
+    import random
+
+    from search import linear_search, binary_search, set_search
+
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                    "..", "..", "week7", "sorting"))
+    from sorting import (bubble_original, bubble_enhanced, insertion_sort, selection_sort,
+                         quicksort, mergesort, heapsort, introsort)
+
+    def introsort_copy(a):
+        a = a[:]
+        introsort(a)
+        return a
+
+    n = 300
+    cases = {
+        "random": [random.randint(0, 10 * n) for _ in range(n)],
+        "sorted": list(range(n)),
+        "reverse": list(range(n, 0, -1)),
+        "few_unique": [random.randint(0, 4) for _ in range(n)],
+    }
+    sorts = [bubble_original, bubble_enhanced, insertion_sort, selection_sort,
+             quicksort, mergesort, heapsort, introsort_copy]
+
+    for case_name, data in cases.items():
+        print(f"\nCase: {case_name} (n={n})")
+        for fn in sorts:
+            out, ops = measure(fn, data, track=introsort)
+            correct = out == sorted(data)
+            print(f"{fn.__name__:<16} {ops.report()}  correct={correct}")
+
+    data = list(range(100_000))
+    target = len(data) - 1
+    print(f"\nSearch (n={len(data)}, target={target})")
+    for fn in (linear_search, binary_search):
+        found, ops = measure(fn, data, target)
+        print(f"{fn.__name__:<16} {ops.report()}  found={found}")
+    with count_ops() as ops:
+        data_set = set(ops.wrap(data))
+        build = ops.as_dict()
+        found = set_search(data_set, target)
+    print(f"{'set (build)':<16} comparisons={build['comparisons']}  hashes={build['hashes']}")
+    print(f"{'set_search':<16} comparisons={ops.comparisons - build['comparisons']}  "
+          f"hashes={ops.hashes - build['hashes']}  found={found}")
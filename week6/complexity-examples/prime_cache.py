@@ -0,0 +1,220 @@
+# Persistent prime table, memory-mapped.
+#
+# The file holds a bit-packed odd-only sieve (bit i set iff 2i + 1 is prime)
+# cut into blocks. Each block stores the number of odd primes before it,
+# followed by its bits:
+#
+#   header | count(8) bits(512) | count(8) bits(512) | ...
+#
+# so is_prime is one bit test, pi(n) is one stored count plus a popcount
+# inside one block, and nth_prime is a binary search over block counts.
+# Lookups read the mmap in place; nothing is loaded into the heap. Queries
+# past the end raise ValueError; ensure() grows the table, sieving only the
+# missing range and appending blocks.
+#
+#   python prime_cache.py --max-n 1e8
+import argparse
+import mmap
+import os
+import struct
+import tempfile
+from bisect import bisect_left
+from math import isqrt
+from time import perf_counter
+
+from primes import _small_odd_primes, _odd_segments
+
+MAGIC = b"PRIMEBIT"
+VERSION = 1
+HEADER = struct.Struct("<8sIIQQ")  # magic, version, block bits, max_n, blocks
+COUNT = struct.Struct("<Q")
+BLOCK_BITS = 4096  # odd numbers per block, 8192 numbers
+BLOCK_BYTES = BLOCK_BITS // 8
+BLOCK_SIZE = COUNT.size + BLOCK_BYTES
+SPAN = 2 * BLOCK_BITS  # numbers covered by one block
+# The file grows by whole multiples of this many blocks (one sieve segment).
+GROW_BLOCKS = 64
+# bytes 0/1 -> ASCII '0'/'1', to pack a sieve segment into bits with int(..., 2).
+_TO_ASCII = bytes.maketrans(b"\x00\x01", b"01")
+
+
+def _pack(segment):
+    # One bit per byte of a 0/1 segment (length divisible by 8), bit i = segment[i].
+    bits = int(segment.translate(_TO_ASCII)[::-1], 2) if segment else 0
+    return bits.to_bytes(len(segment) // 8, "little")
+
+
+class _BlockCounts:
+    # Read-only sequence view of the per-block counts, for bisect.
+    def __init__(self, mm, blocks):
+        self.mm = mm
+        self.blocks = blocks
+
+    def __len__(self):
+        return self.blocks
+
+    def __getitem__(self, b):
+        return COUNT.unpack_from(self.mm, HEADER.size + b * BLOCK_SIZE)[0]
+
+
+class PrimeCache:
+    """
+    Prime table stored in `path` and read through mmap.
+
+    Args:
+        path: Cache file; created if missing, rebuilt if its version differs.
+        max_n: Make sure the table covers at least this number.
+    """
+
+    def __init__(self, path, max_n=0):
+        self.path = path
+        self._mm = None
+        self.blocks = 0
+        if not self._open():
+            with open(path, "wb") as f:
+                f.write(HEADER.pack(MAGIC, VERSION, BLOCK_BITS, 0, 0))
+            self._open()
+        self.ensure(max_n)
+
+    def _open(self):
+        # Map the file; False if it is missing or not a current-version table.
+        if not os.path.exists(self.path):
+            return False
+        with open(self.path, "rb") as f:
+            head = f.read(HEADER.size)
+            if len(head) < HEADER.size:
+                return False
+            magic, version, block_bits, _, blocks = HEADER.unpack(head)
+            if (magic, version, block_bits) != (MAGIC, VERSION, BLOCK_BITS):
+                return False
+            if os.path.getsize(self.path) < HEADER.size + blocks * BLOCK_SIZE:
+                return False  # truncated write
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.blocks = blocks
+        return True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+
+    @property
+    def max_n(self):
+        """Largest number the table covers."""
+        return self.blocks * SPAN - 1 if self.blocks else 1
+
+    # ---------- Growing ----------
+    def ensure(self, max_n):
+        """Extend the file so it covers max_n, sieving only the new range."""
+        if max_n <= self.max_n:
+            return
+        blocks = -(-(max_n + 1) // SPAN)
+        blocks = -(-blocks // GROW_BLOCKS) * GROW_BLOCKS
+        start = self.blocks
+        total = self._odd_primes() if start else 0
+        hi = blocks * SPAN - 1
+        base = _small_odd_primes(isqrt(hi))
+        self.close()
+        with open(self.path, "r+b") as f:
+            f.seek(HEADER.size + start * BLOCK_SIZE)
+            for first, segment in _odd_segments(start * SPAN + 1, hi, base=base):
+                out = bytearray()
+                for i in range(0, len(segment), BLOCK_BITS):
+                    chunk = segment[i:i + BLOCK_BITS]
+                    out += COUNT.pack(total)
+                    out += _pack(chunk)
+                    total += chunk.count(1)
+                f.write(out)
+            f.flush()
+            f.seek(0)
+            f.write(HEADER.pack(MAGIC, VERSION, BLOCK_BITS, hi, blocks))
+        self._open()
+
+    def _odd_primes(self):
+        # Odd primes in the whole table: the last block's count plus its bits.
+        off = HEADER.size + (self.blocks - 1) * BLOCK_SIZE
+        bits = int.from_bytes(self._mm[off + COUNT.size:off + BLOCK_SIZE], "little")
+        return COUNT.unpack_from(self._mm, off)[0] + bin(bits).count("1")
+
+    # ---------- Queries ----------
+    def _check(self, n):
+        if n > self.max_n:
+            raise ValueError(f"{n} is beyond the table (max_n={self.max_n}); call ensure() first")
+
+    def is_prime(self, n):
+        if n % 2 == 0:
+            return n == 2
+        if n < 3:
+            return False
+        self._check(n)
+        i = n // 2
+        b, bit = divmod(i, BLOCK_BITS)
+        byte = self._mm[HEADER.size + b * BLOCK_SIZE + COUNT.size + bit // 8]
+        return bool(byte >> (bit % 8) & 1)
+
+    def pi(self, n):
+        """Number of primes <= n."""
+        if n < 2:
+            return 0
+        self._check(n)
+        i = (n - 1) // 2  # index of the largest odd number <= n
+        b, bit = divmod(i, BLOCK_BITS)
+        off = HEADER.size + b * BLOCK_SIZE
+        count = COUNT.unpack_from(self._mm, off)[0]
+        data = self._mm[off + COUNT.size:off + COUNT.size + bit // 8 + 1]
+        bits = int.from_bytes(data, "little") & ((2 << bit) - 1)
+        return 1 + count + bin(bits).count("1")
+
+    def nth_prime(self, k):
+        """The k-th prime, 1-based: nth_prime(1) == 2."""
+        if k < 1:
+            raise ValueError("k must be at least 1")
+        if k == 1:
+            return 2
+        r = k - 1  # rank among odd primes
+        if not self.blocks or r > self._odd_primes():
+            raise ValueError(f"prime #{k} is beyond the table (max_n={self.max_n}); call ensure() first")
+        b = bisect_left(_BlockCounts(self._mm, self.blocks), r) - 1
+        off = HEADER.size + b * BLOCK_SIZE
+        need = r - COUNT.unpack_from(self._mm, off)[0]
+        bits = bin(int.from_bytes(self._mm[off + COUNT.size:off + BLOCK_SIZE], "little"))[:1:-1]
+        pos = -1
+        for _ in range(need):
+            pos = bits.index("1", pos + 1)
+        return 2 * (b * BLOCK_BITS + pos) + 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Memory-mapped prime table cache")
+    parser.add_argument("--path", default=os.path.join(tempfile.gettempdir(), "primes.cache"))
+    parser.add_argument("--max-n", type=float, default=1e8)
+    parser.add_argument("--fresh", action="store_true", help="delete the cache file first")
+    args = parser.parse_args()
+    max_n = int(args.max_n)
+    if args.fresh and os.path.exists(args.path):
+        os.remove(args.path)
+
+    t0 = perf_counter()
+    with PrimeCache(args.path, max_n) as cache:
+        print(f"open/build up to {max_n:.0e}: {perf_counter() - t0:.3f}s  "
+              f"({os.path.getsize(args.path) / 2**20:.1f} MB at {args.path})")
+    t0 = perf_counter()
+    cache = PrimeCache(args.path, max_n)
+    print(f"reopen: {(perf_counter() - t0) * 1e3:.2f} ms")
+
+    queries = [(cache.is_prime, max_n - 1), (cache.pi, max_n), (cache.nth_prime, cache.pi(max_n) // 2)]
+    for fn, arg in queries:
+        t0 = perf_counter()
+        result = fn(arg)
+        print(f"{fn.__name__}({arg}) = {result}  {(perf_counter() - t0) * 1e6:.1f} µs")
+
+    t0 = perf_counter()
+    cache.ensure(2 * max_n)
+    print(f"grow to {2 * max_n:.0e}: {perf_counter() - t0:.3f}s  pi={cache.pi(2 * max_n)}")
+    cache.close()
@@ -1,3 +1,7 @@
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from itertools import compress
 from math import isqrt
 from time import perf_counter
 
@@ -30,6 +34,167 @@ def sieve(max_n):
                 primes[multiple] = False
     return primes
 
+# 4) Segmented odd-only sieve
+# Only odd numbers are stored, one byte each, and only one cache-sized
+# segment is alive at a time, so memory stays bounded no matter how far
+# the sieve runs. Index i of a segment starting at odd `lo` stands for lo + 2i.
+SEGMENT_SIZE = 1 << 18  # odd numbers per segment (256 KB)
+
+def _small_odd_primes(limit):
+    # Odd primes <= limit, from a plain odd-only bytearray sieve.
+    if limit < 3:
+        return []
+    size = (limit - 1) // 2  # index i <-> 2i + 3
+    table = bytearray(b"\x01") * size
+    for i in range((isqrt(limit) - 1) // 2):
+        if table[i]:
+            p = 2 * i + 3
+            start = (p * p - 3) // 2
+            table[start::p] = bytes(len(range(start, size, p)))
+    return list(compress(range(3, limit + 1, 2), table))
+
+def _odd_segments(lo, hi, segment_size=SEGMENT_SIZE, base=None):
+    """
+    Yield (first, table) covering the odd numbers in [lo, hi]; table[i] == 1 iff first + 2i is prime.
+
+    `base` may pass in precomputed odd primes up to at least isqrt(hi).
+    """
+    first = max(lo, 1) | 1
+    if first > hi:
+        return
+    if base is None:
+        base = _small_odd_primes(isqrt(hi))
+    zeros = memoryview(bytes(segment_size))
+    while first <= hi:
+        size = min(segment_size, (hi - first) // 2 + 1)
+        last = first + 2 * (size - 1)
+        table = bytearray(b"\x01") * size
+        for p in base:
+            sq = p * p
+            if sq > last:
+                break
+            m = max(sq, (first + p - 1) // p * p)
+            if m % 2 == 0:
+                m += p
+            i = (m - first) // 2
+            if i < size:
+                table[i::p] = zeros[:(size - 1 - i) // p + 1]
+        if first == 1:
+            table[0] = 0
+        yield first, table
+        first = last + 2
+
+def iter_primes(hi, lo=2):
+    """Generate the primes p with lo <= p <= hi in increasing order, in bounded memory."""
+    if lo <= 2 <= hi:
+        yield 2
+    for first, table in _odd_segments(lo, hi):
+        yield from compress(range(first, first + 2 * len(table), 2), table)
+
+def primes_in_range(lo, hi):
+    """List of the primes p with lo <= p <= hi."""
+    return list(iter_primes(hi, lo))
+
+def count_primes(n):
+    """pi(n): the number of primes <= n."""
+    if n < 2:
+        return 0
+    return 1 + sum(table.count(1) for _, table in _odd_segments(3, n))
+
+def sieve_odd(max_n):
+    """
+    Odd-only primality table up to max_n: bytearray t with t[i] == 1 iff 2i + 1 is prime.
+
+    Half a byte per number instead of the 8 bytes per slot of sieve().
+    """
+    table = bytearray((max_n + 1) // 2)
+    for first, segment in _odd_segments(1, max_n):
+        i = first // 2
+        table[i:i + len(segment)] = segment
+    return table
+
+# 5) Deterministic Miller-Rabin
+SMALL_PRIME_LIMIT = 1000
+SMALL_PRIMES = [p for p, is_p in enumerate(sieve(SMALL_PRIME_LIMIT)) if is_p]
+
+# (bound, bases): testing these bases is exact for every n < bound.
+# Beyond the last bound the answer is a strong probable prime.
+_MR_BASES = [
+    (2_047, (2,)),
+    (1_373_653, (2, 3)),
+    (25_326_001, (2, 3, 5)),
+    (3_215_031_751, (2, 3, 5, 7)),
+    (2_152_302_898_747, (2, 3, 5, 7, 11)),
+    (3_474_749_660_383, (2, 3, 5, 7, 11, 13)),
+    (341_550_071_728_321, (2, 3, 5, 7, 11, 13, 17)),
+    (3_825_123_056_546_413_051, (2, 3, 5, 7, 11, 13, 17, 19, 23)),
+    (318_665_857_834_031_151_167_461, (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)),
+    (3_317_044_064_679_887_385_961_981, (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)),
+]
+
+def is_prime_mr(n):
+    """Miller-Rabin primality test, deterministic for all n < 3.3e24 (so every 64-bit n)."""
+    if n < 2:
+        return False
+    for p in SMALL_PRIMES:
+        if n % p == 0:
+            return n == p
+    if n <= SMALL_PRIME_LIMIT * SMALL_PRIME_LIMIT:
+        return True  # no prime factor <= sqrt(n)
+    d = n - 1
+    s = (d & -d).bit_length() - 1
+    d >>= s
+    bases = next((b for bound, b in _MR_BASES if n < bound), _MR_BASES[-1][1])
+    for a in bases:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+# Below this many numbers, a process pool costs more than it saves.
+PARALLEL_MIN = 20_000
+
+def is_prime_many(numbers, workers=None):
+    """
+    Test every number in `numbers` with is_prime_mr; returns a list of bools.
+
+    Large batches are split over a process pool (`workers` processes,
+    default os.cpu_count()); pass workers=1 to stay in this process.
+    """
+    numbers = list(numbers)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(numbers) < PARALLEL_MIN:
+        return [is_prime_mr(n) for n in numbers]
+    chunksize = max(1, len(numbers) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(is_prime_mr, numbers, chunksize=chunksize))
+
+def next_prime(n):
+    """Smallest prime > n."""
+    if n < 2:
+        return 2
+    n += 1 + (n % 2 == 1)  # next odd number above n
+    while not is_prime_mr(n):
+        n += 2
+    return n
+
+def prev_prime(n):
+    """Largest prime < n; raises ValueError for n <= 2."""
+    if n <= 2:
+        raise ValueError("no prime below 2")
+    if n == 3:
+        return 2
+    n -= 1 + (n % 2 == 1)  # previous odd number below n
+    while not is_prime_mr(n):
+        n -= 2
+    return n
+
 # ---- Demo ----
 if __name__ == "__main__":
     test_ns = [10_007, 50_021, 100_003, 200_003, 400_009]
@@ -49,3 +214,34 @@ if __name__ == "__main__":
         t0 = perf_counter(); sieve_table[n]; sieve_t = perf_counter() - t0
 
         print(f"n={n}: naive={naive_t:.4f}s, sqrt={sqrt_t:.4f}s, sieve_build={sieve_build:.4f}s, sieve_query={sieve_t:.6f}s")
+
+    # Segmented sieve: bounded memory far past what sieve() can hold.
+    for n in (10**7, 10**8, 10**9):
+        t0 = perf_counter(); count = count_primes(n); seg_t = perf_counter() - t0
+        print(f"count_primes({n:.0e}) = {count}: {seg_t:.2f}s")
+    t0 = perf_counter(); sieve(10**7); list_t = perf_counter() - t0
+    print(f"sieve(1e7) as list of bools: {list_t:.2f}s")
+    window = primes_in_range(10**12, 10**12 + 1000)
+    print(f"primes in [1e12, 1e12+1000]: {len(window)}, first {window[:3]}")
+
+    # Primality tests across magnitudes, on the largest prime below 2^k.
+    print("\nPrimality of the largest prime below 2^k")
+    table = sieve(10**7)
+    for k in (16, 24, 32, 40, 48, 56, 63):
+        n = prev_prime(2 ** k)
+        row = [f"2^{k:<2} n={n:<20}"]
+        methods = [("naive", is_prime_naive, 24), ("sqrt", is_prime_sqrt, 48),
+                   ("sieve", table.__getitem__, 23), ("miller-rabin", is_prime_mr, 63)]
+        for name, fn, max_k in methods:
+            if k > max_k:
+                row.append(f"{name}=   -     ")
+                continue
+            t0 = perf_counter(); fn(n); dt = perf_counter() - t0
+            row.append(f"{name}={dt:.6f}s")
+        print("  ".join(row))
+
+    batch = [random.getrandbits(63) | 1 for _ in range(200_000)]
+    for workers in (1, None):
+        t0 = perf_counter(); found = sum(is_prime_many(batch, workers)); dt = perf_counter() - t0
+        print(f"is_prime_many: {len(batch)} random 63-bit odd numbers, "
+              f"workers={workers or os.cpu_count()}: {found} primes, {dt:.2f}s")
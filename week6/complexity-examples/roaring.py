@@ -0,0 +1,712 @@
+# Roaring-style compressed set of 32-bit unsigned integers.
+#
+# A value v is split into a 16-bit key (v >> 16) and a 16-bit low part.
+# Each key owns one container holding the low parts, stored in whichever
+# encoding is smallest:
+#   - array:  sorted array('H'), 2 bytes per value (at most 4096 values),
+#   - bitmap: 8 KB bytearray, one bit per possible low value,
+#   - run:    sorted (start, last) pairs, 4 bytes per run of consecutive values.
+# Dense ID ranges collapse to a few runs, sparse IDs cost 2 bytes each, and
+# lookups touch a single container.
+#
+#   python roaring.py     # memory / latency benchmark
+import random
+import struct
+import sys
+import time
+import tracemalloc
+from array import array
+from bisect import bisect_left, bisect_right
+from heapq import merge
+from itertools import accumulate, compress, filterfalse, groupby, islice, repeat
+from operator import eq, ne, sub
+
+ARRAY_MAX = 4096
+BITMAP_BYTES = 8192
+ARRAY, BITMAP, RUN = 0, 1, 2
+MAGIC = b"RBM1"
+_HEAD = struct.Struct("<4sI")
+_CONTAINER = struct.Struct("<HBI")  # key, kind, count (values, or runs)
+_POPCOUNT = bytes(bin(i).count("1") for i in range(256))
+# Values read, sorted and spread over containers at a time by update().
+UPDATE_CHUNK = 1 << 16
+
+
+def _u16(values=()):
+    return array("H", values)
+
+
+def _little(a):
+    # array('H') -> little-endian bytes, whatever the host order.
+    if sys.byteorder == "big":
+        a = array(a.typecode, a)
+        a.byteswap()
+    return a.tobytes()
+
+
+def _from_little(data):
+    a = _u16()
+    a.frombytes(data)
+    if sys.byteorder == "big":
+        a.byteswap()
+    return a
+
+
+def _bit_positions(bits):
+    # Low values set in an 8 KB bitmap, ascending.
+    out = _u16()
+    for i, byte in enumerate(bits):
+        while byte:
+            low = byte & -byte
+            out.append(i * 8 + low.bit_length() - 1)
+            byte ^= low
+    return out
+
+
+def _best(values):
+    """Smallest container for the sorted, distinct low values `values`."""
+    n = len(values)
+    # Number of runs: one plus the gaps between non-consecutive neighbours.
+    runs = 1 + sum(map(ne, map(sub, islice(values, 1, None), values), repeat(1))) if n else 0
+    if n and 4 * runs < min(2 * n, BITMAP_BYTES):
+        # Positions where a run ends: the next value is not consecutive.
+        ends = [i for i, (a, b) in enumerate(zip(values, islice(values, 1, None))) if b - a != 1]
+        starts = _u16([values[0]] + [values[i + 1] for i in ends])
+        lasts = _u16([values[i] for i in ends] + [values[-1]])
+        return _Run(starts, lasts)
+    if n <= ARRAY_MAX:
+        return _Array(_u16(values))
+    bits = bytearray(BITMAP_BYTES)
+    for v in values:
+        bits[v >> 3] |= 1 << (v & 7)
+    return _Bitmap(bits, n)
+
+
+def _mask(c):
+    # Container -> Python int with bit v set for each low value v.
+    if c.kind == BITMAP:
+        return int.from_bytes(c.bits, "little")
+    m = 0
+    if c.kind == RUN:
+        for s, e in zip(c.starts, c.lasts):
+            m |= ((1 << (e - s + 1)) - 1) << s
+        return m
+    bits = bytearray(BITMAP_BYTES)
+    for v in c.a:
+        bits[v >> 3] |= 1 << (v & 7)
+    return int.from_bytes(bits, "little")
+
+
+def _from_mask(m):
+    # Smallest container for the values set in mask m (same choice as _best),
+    # or None when m is empty. Runs start where a bit has no set bit below it
+    # and end where it has none above it.
+    card = bin(m).count("1")
+    if not card:
+        return None
+    starts = m & ~(m << 1)
+    runs = bin(starts).count("1")
+    if 4 * runs < min(2 * card, BITMAP_BYTES):
+        lasts = m & ~(m >> 1)
+        return _Run(_bit_positions(starts.to_bytes(BITMAP_BYTES, "little")),
+                    _bit_positions(lasts.to_bytes(BITMAP_BYTES, "little")))
+    if card <= ARRAY_MAX:
+        return _Array(_bit_positions(m.to_bytes(BITMAP_BYTES, "little")))
+    return _Bitmap(bytearray(m.to_bytes(BITMAP_BYTES, "little")), card)
+
+
+# ---------- Containers ----------
+# add/remove return (container, changed); the container may be a new one of
+# another kind, or None when it became empty.
+class _Array:
+    __slots__ = ("a",)
+    kind = ARRAY
+
+    def __init__(self, a):
+        self.a = a
+
+    def __len__(self):
+        return len(self.a)
+
+    def __iter__(self):
+        return iter(self.a)
+
+    def __contains__(self, v):
+        i = bisect_left(self.a, v)
+        return i < len(self.a) and self.a[i] == v
+
+    def add(self, v):
+        i = bisect_left(self.a, v)
+        if i < len(self.a) and self.a[i] == v:
+            return self, False
+        self.a.insert(i, v)
+        if len(self.a) > ARRAY_MAX:
+            return _best(self.a), True
+        return self, True
+
+    def remove(self, v):
+        i = bisect_left(self.a, v)
+        if i == len(self.a) or self.a[i] != v:
+            return self, False
+        del self.a[i]
+        return (self if self.a else None), True
+
+    def rank(self, v):
+        return bisect_right(self.a, v)
+
+    def copy(self):
+        return _Array(_u16(self.a))
+
+    def select(self, i):
+        return self.a[i]
+
+    def nbytes(self):
+        return self.a.itemsize * len(self.a)
+
+    def payload(self):
+        return len(self.a), _little(self.a)
+
+
+class _Bitmap:
+    __slots__ = ("bits", "card")
+    kind = BITMAP
+
+    def __init__(self, bits, card):
+        self.bits = bits
+        self.card = card
+
+    def __len__(self):
+        return self.card
+
+    def __iter__(self):
+        return iter(_bit_positions(self.bits))
+
+    def __contains__(self, v):
+        return self.bits[v >> 3] >> (v & 7) & 1 == 1
+
+    def add(self, v):
+        mask = 1 << (v & 7)
+        if self.bits[v >> 3] & mask:
+            return self, False
+        self.bits[v >> 3] |= mask
+        self.card += 1
+        return self, True
+
+    def remove(self, v):
+        mask = 1 << (v & 7)
+        if not self.bits[v >> 3] & mask:
+            return self, False
+        self.bits[v >> 3] &= ~mask
+        self.card -= 1
+        if self.card <= ARRAY_MAX:
+            return _Array(_bit_positions(self.bits)), True
+        return self, True
+
+    def rank(self, v):
+        byte = v >> 3
+        below = sum(self.bits[:byte].translate(_POPCOUNT))
+        return below + _POPCOUNT[self.bits[byte] & ((2 << (v & 7)) - 1)]
+
+    def select(self, i):
+        for pos, byte in enumerate(self.bits):
+            c = _POPCOUNT[byte]
+            if i < c:
+                for bit in range(8):
+                    if byte >> bit & 1:
+                        if i == 0:
+                            return pos * 8 + bit
+                        i -= 1
+            i -= c
+        raise IndexError("select index out of range")
+
+    def nbytes(self):
+        return BITMAP_BYTES
+
+    def copy(self):
+        return _Bitmap(bytearray(self.bits), self.card)
+
+    def payload(self):
+        return self.card, bytes(self.bits)
+
+
+class _Run:
+    __slots__ = ("starts", "lasts")
+    kind = RUN
+
+    def __init__(self, starts, lasts):
+        self.starts = starts
+        self.lasts = lasts
+
+    def __len__(self):
+        return sum(self.lasts) - sum(self.starts) + len(self.starts)
+
+    def __iter__(self):
+        for s, e in zip(self.starts, self.lasts):
+            yield from range(s, e + 1)
+
+    def __contains__(self, v):
+        i = bisect_right(self.starts, v) - 1
+        return i >= 0 and v <= self.lasts[i]
+
+    def _resized(self):
+        # Keep the run encoding only while it is the smallest one.
+        n = len(self)
+        if not n:
+            return None
+        if 4 * len(self.starts) < min(2 * n, BITMAP_BYTES):
+            return self
+        return _from_mask(_mask(self))
+
+    def add(self, v):
+        starts, lasts = self.starts, self.lasts
+        i = bisect_right(starts, v) - 1
+        if i >= 0 and v <= lasts[i]:
+            return self, False
+        joins_left = i >= 0 and lasts[i] == v - 1
+        joins_right = i + 1 < len(starts) and starts[i + 1] == v + 1
+        if joins_left and joins_right:
+            lasts[i] = lasts[i + 1]
+            del starts[i + 1]
+            del lasts[i + 1]
+        elif joins_left:
+            lasts[i] = v
+        elif joins_right:
+            starts[i + 1] = v
+        else:
+            starts.insert(i + 1, v)
+            lasts.insert(i + 1, v)
+        return self._resized(), True
+
+    def remove(self, v):
+        starts, lasts = self.starts, self.lasts
+        i = bisect_right(starts, v) - 1
+        if i < 0 or v > lasts[i]:
+            return self, False
+        s, e = starts[i], lasts[i]
+        if s == e:
+            del starts[i]
+            del lasts[i]
+        elif v == s:
+            starts[i] = v + 1
+        elif v == e:
+            lasts[i] = v - 1
+        else:
+            lasts[i] = v - 1
+            starts.insert(i + 1, v + 1)
+            lasts.insert(i + 1, e)
+        return self._resized(), True
+
+    def rank(self, v):
+        i = bisect_right(self.starts, v)
+        full = sum(self.lasts[:i]) - sum(self.starts[:i]) + i
+        if i and v < self.lasts[i - 1]:
+            full -= self.lasts[i - 1] - v
+        return full
+
+    def select(self, i):
+        for s, e in zip(self.starts, self.lasts):
+            if i <= e - s:
+                return s + i
+            i -= e - s + 1
+        raise IndexError("select index out of range")
+
+    def nbytes(self):
+        return 4 * len(self.starts)
+
+    def copy(self):
+        return _Run(_u16(self.starts), _u16(self.lasts))
+
+    def payload(self):
+        pairs = _u16()
+        for s, e in zip(self.starts, self.lasts):
+            pairs.append(s)
+            pairs.append(e)
+        return len(self.starts), _little(pairs)
+
+
+def _from_payload(kind, count, data):
+    if kind == ARRAY:
+        return _Array(_from_little(data))
+    if kind == BITMAP:
+        return _Bitmap(bytearray(data), count)
+    pairs = _from_little(data)
+    return _Run(pairs[0::2], pairs[1::2])
+
+
+# ---------- Container algebra ----------
+# Each returns a new container, or None when the result is empty; inputs are
+# never modified. Arrays and runs are combined with sorted merges, anything
+# involving a bitmap with big-int AND/OR on the bitmaps.
+def _array_result(values):
+    return _best(values) if values else None
+
+
+def _run_result(starts, lasts):
+    return _Run(_u16(starts), _u16(lasts))._resized() if starts else None
+
+
+def _runs_union(a, b):
+    starts, lasts = [], []
+    for s, e in merge(zip(a.starts, a.lasts), zip(b.starts, b.lasts)):
+        if lasts and s <= lasts[-1] + 1:
+            lasts[-1] = max(lasts[-1], e)
+        else:
+            starts.append(s)
+            lasts.append(e)
+    return _run_result(starts, lasts)
+
+
+def _runs_intersection(a, b):
+    starts, lasts = [], []
+    i = j = 0
+    while i < len(a.starts) and j < len(b.starts):
+        s = max(a.starts[i], b.starts[j])
+        e = min(a.lasts[i], b.lasts[j])
+        if s <= e:
+            starts.append(s)
+            lasts.append(e)
+        if a.lasts[i] < b.lasts[j]:
+            i += 1
+        else:
+            j += 1
+    return _run_result(starts, lasts)
+
+
+def _runs_difference(a, b):
+    starts, lasts = [], []
+    j = 0
+    for s, e in zip(a.starts, a.lasts):
+        while j < len(b.starts) and b.lasts[j] < s:
+            j += 1
+        k = j
+        while s <= e and k < len(b.starts) and b.starts[k] <= e:
+            if b.starts[k] > s:
+                starts.append(s)
+                lasts.append(b.starts[k] - 1)
+            s = max(s, b.lasts[k] + 1)
+            k += 1
+        if s <= e:
+            starts.append(s)
+            lasts.append(e)
+    return _run_result(starts, lasts)
+
+
+def _union(a, b):
+    if a.kind == b.kind == ARRAY:
+        # sorted() of two concatenated runs is a C-level merge; fromkeys dedups.
+        return _array_result(list(dict.fromkeys(sorted(a.a + b.a))))
+    if a.kind == b.kind == RUN:
+        return _runs_union(a, b)
+    return _from_mask(_mask(a) | _mask(b))
+
+
+def _intersection(a, b):
+    if a.kind == b.kind == ARRAY:
+        # Merged, each common value sits next to its copy.
+        m = sorted(a.a + b.a)
+        return _array_result(list(compress(m, map(eq, m, islice(m, 1, None)))))
+    if a.kind == ARRAY or b.kind == ARRAY:
+        small, other = (a, b) if a.kind == ARRAY else (b, a)
+        return _array_result([v for v in small.a if v in other])
+    if a.kind == b.kind == RUN:
+        return _runs_intersection(a, b)
+    return _from_mask(_mask(a) & _mask(b))
+
+
+def _difference(a, b):
+    if a.kind == b.kind == ARRAY:
+        # Probe a's values against a hash of b (at most ARRAY_MAX entries):
+        # about 3x faster in CPython than a bisect per value.
+        return _array_result(list(filterfalse(frozenset(b.a).__contains__, a.a)))
+    if a.kind == ARRAY:
+        return _array_result([v for v in a.a if v not in b])
+    if a.kind == b.kind == RUN:
+        return _runs_difference(a, b)
+    return _from_mask(_mask(a) & ~_mask(b))
+
+
+# ---------- Set ----------
+class RoaringBitmap:
+    """
+    Compressed set of integers in [0, 2**32).
+
+    Supports `in`, add/discard/remove, | & - (union, intersection,
+    difference), rank/select and to_bytes/from_bytes.
+    """
+
+    def __init__(self, values=()):
+        self._keys = []
+        self._containers = []
+        self._offsets = None  # cumulative sizes for rank/select, built lazily
+        self.update(values)
+
+    @staticmethod
+    def _split(v):
+        if not 0 <= v < 1 << 32:
+            raise ValueError(f"{v} is outside [0, 2**32)")
+        return v >> 16, v & 0xFFFF
+
+    def _find(self, key):
+        i = bisect_left(self._keys, key)
+        return i, i < len(self._keys) and self._keys[i] == key
+
+    # ---------- Building ----------
+    def update(self, values):
+        """
+        Add many values, UPDATE_CHUNK at a time: each chunk is sorted, split
+        by key and merged into that key's container, so the input is never
+        held in memory as a whole.
+        """
+        values = iter(values)
+        while True:
+            chunk = sorted(islice(values, UPDATE_CHUNK))
+            if not chunk:
+                break
+            if chunk[0] < 0 or chunk[-1] >= 1 << 32:
+                raise ValueError("values must be in [0, 2**32)")
+            start = 0
+            while start < len(chunk):
+                key = chunk[start] >> 16
+                end = bisect_left(chunk, (key + 1) << 16, start)
+                lows = [v & 0xFFFF for v, _ in groupby(islice(chunk, start, end))]
+                self._merge_container(key, _best(lows))
+                start = end
+        self._offsets = None
+
+    def _merge_container(self, key, container):
+        i, found = self._find(key)
+        if found:
+            self._containers[i] = _union(self._containers[i], container)
+        else:
+            self._keys.insert(i, key)
+            self._containers.insert(i, container)
+
+    def add(self, v):
+        key, low = self._split(v)
+        i, found = self._find(key)
+        if not found:
+            self._keys.insert(i, key)
+            self._containers.insert(i, _Array(_u16([low])))
+        else:
+            self._containers[i], changed = self._containers[i].add(low)
+            if not changed:
+                return
+        self._offsets = None
+
+    def discard(self, v):
+        key, low = self._split(v)
+        i, found = self._find(key)
+        if not found:
+            return False
+        container, changed = self._containers[i].remove(low)
+        if container is None:
+            del self._keys[i]
+            del self._containers[i]
+        else:
+            self._containers[i] = container
+        if changed:
+            self._offsets = None
+        return changed
+
+    def remove(self, v):
+        if not self.discard(v):
+            raise KeyError(v)
+
+    def optimize(self):
+        """Re-encode every container in its smallest form."""
+        self._containers = [_from_mask(_mask(c)) for c in self._containers]
+
+    # ---------- Queries ----------
+    def __contains__(self, v):
+        if not 0 <= v < 1 << 32:
+            return False
+        i, found = self._find(v >> 16)
+        return found and (v & 0xFFFF) in self._containers[i]
+
+    def __len__(self):
+        return sum(map(len, self._containers))
+
+    def __iter__(self):
+        for key, c in zip(self._keys, self._containers):
+            base = key << 16
+            for low in c:
+                yield base + low
+
+    def __eq__(self, other):
+        if not isinstance(other, RoaringBitmap):
+            return NotImplemented
+        return self._keys == other._keys and all(
+            len(a) == len(b) and _mask(a) == _mask(b) for a, b in zip(self._containers, other._containers))
+
+    def __repr__(self):
+        return f"RoaringBitmap(<{len(self)} values in {len(self._keys)} containers>)"
+
+    def _cumulative(self):
+        if self._offsets is None:
+            self._offsets = list(accumulate(map(len, self._containers), initial=0))
+        return self._offsets
+
+    def rank(self, v):
+        """Number of values <= v."""
+        offsets = self._cumulative()
+        key, low = v >> 16, v & 0xFFFF
+        i, found = self._find(key)
+        return offsets[i] + (self._containers[i].rank(low) if found else 0)
+
+    def select(self, i):
+        """The i-th smallest value (0-based)."""
+        offsets = self._cumulative()
+        if not 0 <= i < offsets[-1]:
+            raise IndexError("select index out of range")
+        c = bisect_right(offsets, i) - 1
+        return (self._keys[c] << 16) + self._containers[c].select(i - offsets[c])
+
+    def nbytes(self):
+        """Approximate payload size: container data plus 4 bytes per key."""
+        return sum(c.nbytes() for c in self._containers) + 4 * len(self._keys)
+
+    # ---------- Set algebra ----------
+    def _combine(self, other, op, keep_left, keep_right):
+        # Walk both key lists in order. Keys on one side only are copied as
+        # they are (when kept); shared keys combine their containers.
+        out = RoaringBitmap()
+        i = j = 0
+        a_keys, b_keys = self._keys, other._keys
+        while i < len(a_keys) or j < len(b_keys):
+            a = a_keys[i] if i < len(a_keys) else None
+            b = b_keys[j] if j < len(b_keys) else None
+            if b is None or (a is not None and a < b):
+                if keep_left:
+                    out._keys.append(a)
+                    out._containers.append(self._containers[i].copy())
+                i += 1
+            elif a is None or b < a:
+                if keep_right:
+                    out._keys.append(b)
+                    out._containers.append(other._containers[j].copy())
+                j += 1
+            else:
+                container = op(self._containers[i], other._containers[j])
+                if container is not None:
+                    out._keys.append(a)
+                    out._containers.append(container)
+                i += 1
+                j += 1
+        return out
+
+    def __or__(self, other):
+        return self._combine(other, _union, True, True)
+
+    def __and__(self, other):
+        return self._combine(other, _intersection, False, False)
+
+    def __sub__(self, other):
+        return self._combine(other, _difference, True, False)
+
+    # ---------- Serialization ----------
+    def to_bytes(self):
+        parts = [_HEAD.pack(MAGIC, len(self._keys))]
+        for key, c in zip(self._keys, self._containers):
+            count, data = c.payload()
+            parts.append(_CONTAINER.pack(key, c.kind, count))
+            parts.append(data)
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data):
+        magic, n = _HEAD.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("not a serialized RoaringBitmap")
+        out = cls()
+        off = _HEAD.size
+        for _ in range(n):
+            key, kind, count = _CONTAINER.unpack_from(data, off)
+            off += _CONTAINER.size
+            size = {ARRAY: 2 * count, BITMAP: BITMAP_BYTES, RUN: 4 * count}[kind]
+            out._keys.append(key)
+            out._containers.append(_from_payload(kind, count, data[off:off + size]))
+            off += size
+        return out
+
+
+# ---------- Benchmark ----------
+class SortedArray:
+    """Baseline: sorted array('L') searched with bisect."""
+
+    def __init__(self, values):
+        # Sorted chunks kept as arrays, then one merge: no list of all ids.
+        values = iter(values)
+        runs = []
+        while True:
+            chunk = sorted(islice(values, UPDATE_CHUNK))
+            if not chunk:
+                break
+            runs.append(array("L", chunk))
+        self.a = array("L", (v for v, _ in groupby(merge(*runs))))
+
+    def __contains__(self, v):
+        i = bisect_left(self.a, v)
+        return i < len(self.a) and self.a[i] == v
+
+
+class ByteBitmap:
+    """Baseline: plain bytearray bitmap, one bit per possible value."""
+
+    def __init__(self, values, universe):
+        self.bits = bytearray((universe + 7) // 8)
+        for v in values:
+            self.bits[v >> 3] |= 1 << (v & 7)
+
+    def __contains__(self, v):
+        return self.bits[v >> 3] >> (v & 7) & 1 == 1
+
+
+def _measure(build):
+    # Build once for timing, then again under tracemalloc for the size. The
+    # int objects already exist in the input list, so a set is charged only
+    # for its hash table: its real cost is about 28 bytes per id more.
+    t0 = time.perf_counter()
+    obj = build()
+    build_t = time.perf_counter() - t0
+    del obj
+    tracemalloc.start()
+    obj = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return obj, size, build_t
+
+
+if __name__ == "__main__":
+    n = 1_000_000
+    universe = 1 << 28
+    datasets = {
+        "dense range": list(range(n)),
+        "sparse random": random.sample(range(universe), n),
+        "clustered runs": [s + k for s in random.sample(range(0, universe, 1 << 12), n // 500)
+                           for k in range(500)],
+    }
+    for name, values in datasets.items():
+        probes = [random.choice(values) if i % 2 else random.randrange(universe) for i in range(200_000)]
+        print(f"\n{name}: {len(values)} ids below 2^28, {len(probes)} probes")
+        builders = [
+            ("set", lambda: set(values)),
+            ("array + bisect", lambda: SortedArray(values)),
+            ("bytearray bitmap", lambda: ByteBitmap(values, universe)),
+            ("RoaringBitmap", lambda: RoaringBitmap(values)),
+        ]
+        for label, build in builders:
+            obj, size, build_t = _measure(build)
+            t0 = time.perf_counter()
+            hits = sum(1 for p in probes if p in obj)
+            dt = time.perf_counter() - t0
+            print(f"{label:<18} memory={size / 2**20:8.2f} MB  build={build_t:.2f}s  "
+                  f"lookup={dt / len(probes) * 1e9:6.0f} ns  hits={hits}")
+
+    a = RoaringBitmap(datasets["sparse random"])
+    b = RoaringBitmap(datasets["clustered runs"])
+    for label, fn in [("union", lambda: a | b), ("intersection", lambda: a & b),
+                      ("difference", lambda: a - b), ("to_bytes", a.to_bytes),
+                      ("rank", lambda: a.rank(universe // 2)), ("select", lambda: a.select(n // 2))]:
+        t0 = time.perf_counter()
+        fn()
+        print(f"{label:<14} {(time.perf_counter() - t0) * 1e3:8.2f} ms")
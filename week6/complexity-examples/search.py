@@ -16,6 +16,106 @@ def binary_search(data, target):
 def set_search(data_set, target):
     return target in data_set
 
+# --- 4) Interpolation search (sorted numeric data) ---
+def interpolation_index(data, target):
+    """
+    bisect_left position of target, guessing each probe from the key values.
+
+    O(log log n) probes on uniformly spread keys. After about 2 log log n
+    probes without converging (skewed keys), the rest is left to bisect.
+    """
+    lo, hi = 0, len(data) - 1
+    if hi < 0 or target <= data[0]:
+        return 0
+    if target > data[hi]:
+        return hi + 1
+    budget = 2 * len(data).bit_length().bit_length() + 2
+    # Invariant: data[lo] < target <= data[hi].
+    while hi - lo > 1 and budget:
+        budget -= 1
+        a, b = data[lo], data[hi]
+        pos = lo + int((target - a) * (hi - lo) / (b - a))
+        pos = min(max(pos, lo + 1), hi - 1)
+        if data[pos] < target:
+            lo = pos
+        else:
+            hi = pos
+    return bisect.bisect_left(data, target, lo + 1, hi)
+
+def interpolation_search(data, target):
+    i = interpolation_index(data, target)
+    return i < len(data) and data[i] == target
+
+# --- 5) Exponential / galloping search from a hint ---
+def gallop_index(data, target, hint=0):
+    """
+    bisect_left position of target, galloping out from index `hint`.
+
+    Costs O(log d) where d is the distance from hint to the answer, so
+    lookups near a known position (e.g. the previous result) are cheap.
+    """
+    n = len(data)
+    if n == 0:
+        return 0
+    hint = min(max(hint, 0), n - 1)
+    step = 1
+    if data[hint] < target:
+        # Answer is in (hint, n]: double the step until we pass target.
+        lo, hi = hint + 1, hint + 1
+        while hi < n and data[hi] < target:
+            lo = hi + 1
+            hi = hint + step * 2
+            step *= 2
+        return bisect.bisect_left(data, target, lo, min(hi, n))
+    # Answer is in [0, hint]: gallop left.
+    lo, hi = hint, hint
+    while lo > 0 and data[lo - 1] >= target:
+        hi = lo - 1
+        lo = max(0, hint - step * 2)
+        step *= 2
+    return bisect.bisect_left(data, target, lo, hi + 1)
+
+def exponential_search(data, target, hint=0):
+    i = gallop_index(data, target, hint)
+    return i < len(data) and data[i] == target
+
+# --- 6) Auto-selection ---
+UNIFORM_TOLERANCE = 0.02  # max deviation from a straight line, as a fraction of the key range
+
+def choose_search(data, samples=64, trials=200):
+    """
+    Sample the data and return the search function to use for it.
+
+    Interpolation search is only considered when sampled keys lie close to
+    the line from data[0] to data[-1] (uniform spread). It is then timed
+    against binary search on `trials` sampled keys: bisect runs in C, so in
+    CPython it often wins even where interpolation needs fewer probes.
+    """
+    n = len(data)
+    if n < 1024 or not isinstance(data[0], (int, float)):
+        return binary_search
+    first, last = data[0], data[-1]
+    span = last - first
+    if span <= 0:
+        return binary_search
+    worst = 0.0
+    for k in range(1, samples):
+        i = k * (n - 1) // samples
+        expected = first + span * i / (n - 1)
+        worst = max(worst, abs(data[i] - expected) / span)
+    if worst > UNIFORM_TOLERANCE:
+        return binary_search
+    keys = [data[random.randrange(n)] for _ in range(trials)]
+    best, best_t = binary_search, float("inf")
+    for fn in (binary_search, interpolation_search):
+        t0 = time.perf_counter()
+        for x in keys:
+            fn(data, x)
+        t = time.perf_counter() - t0
+        if t < best_t:
+            best, best_t = fn, t
+    return best
+
 
 # --- Demo & timing ---
 if __name__ == "__main__":
@@ -42,3 +142,23 @@ if __name__ == "__main__":
     print(f"Linear search: {t1:.6f} sec")
     print(f"Binary search: {t2:.6f} sec")
     print(f"Set search:    {t3:.6f} sec")
+
+    # Batched probes: per-query cost of many lookups against the same data
+    from sorted_index import SortedIndex, np
+
+    probes = [random.randrange(2 * n) for _ in range(200_000)]
+    print(f"\nBatch of {len(probes)} probes (about half present), per query:")
+    few = probes[:200]  # O(n) per probe: a small subset gives the per-query cost
+    _, t = time_it(lambda: [linear_search(data, x) for x in few])
+    print(f"linear_search loop:       {t / len(few) * 1e9:8.1f} ns  ({len(few)} probes)")
+    _, t = time_it(lambda: [binary_search(data, x) for x in probes])
+    print(f"binary_search loop:       {t / len(probes) * 1e9:8.1f} ns")
+    _, t = time_it(lambda: [set_search(data_set, x) for x in probes])
+    print(f"set_search loop:          {t / len(probes) * 1e9:8.1f} ns")
+    layouts = ["bisect", "eytzinger"] + (["numpy"] if np is not None else [])
+    for layout in layouts:
+        index = SortedIndex(data, layout)
+        batch = np.array(probes) if layout == "numpy" else probes
+        hits, t = time_it(index.contains_many, batch)
+        print(f"SortedIndex[{layout}]:{'':<{13 - len(layout)}}{t / len(probes) * 1e9:8.1f} ns"
+              f"  (hits={int(sum(hits))})")
@@ -0,0 +1,84 @@
+# Benchmark of the search strategies in search.py on uniform, skewed and
+# clustered keys. Data is generated straight into array('q') (8 bytes per
+# key), so 10^8 keys fit in memory.
+#
+#   python search_bench.py --sizes 1e6 1e7 1e8
+import argparse
+import random
+import time
+from array import array
+from itertools import accumulate
+
+from search import (binary_search, interpolation_search, exponential_search,
+                    gallop_index, choose_search)
+
+
+def uniform(n, rng):
+    # Sorted uniform keys as cumulative random gaps: no sort, no list.
+    return array("q", accumulate(rng.randrange(1, 200) for _ in range(n)))
+
+
+def skewed(n, rng):
+    # A monotone power transform of uniform keys keeps them sorted but packs
+    # most of them near the bottom of the range.
+    top = 10 ** 15
+    return array("q", (int(top * (i / n) ** 4) + i for i in range(n)))
+
+
+def clustered(n, rng):
+    # Dense clusters of consecutive-ish keys separated by huge jumps.
+    return array("q", accumulate(rng.randrange(10 ** 9) if rng.random() < 0.001 else rng.randrange(1, 3)
+                                 for _ in range(n)))
+
+
+DISTRIBUTIONS = {"uniform": uniform, "skewed": skewed, "clustered": clustered}
+
+
+def per_query(fn, probes):
+    t0 = time.perf_counter()
+    hits = sum(1 for x in probes if fn(x))
+    return (time.perf_counter() - t0) / len(probes), hits
+
+
+def gallop_sorted(data, probes):
+    # Probes in increasing order, each search starting from the previous answer.
+    hint = 0
+    hits = 0
+    t0 = time.perf_counter()
+    for x in probes:
+        hint = gallop_index(data, x, hint)
+        hits += hint < len(data) and data[hint] == x
+    return (time.perf_counter() - t0) / len(probes), hits
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare search strategies")
+    parser.add_argument("--sizes", type=float, nargs="+", default=[1e6, 1e7])
+    parser.add_argument("--probes", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+
+    for size in map(int, args.sizes):
+        for name, make in DISTRIBUTIONS.items():
+            t0 = time.perf_counter()
+            data = make(size, rng)
+            build = time.perf_counter() - t0
+            probes = [data[rng.randrange(size)] if i % 2 else rng.randint(data[0], data[-1])
+                      for i in range(args.probes)]
+            chosen = choose_search(data)
+            print(f"\n{name} n={size:.0e} (generated in {build:.1f}s), auto picks {chosen.__name__}")
+            for label, fn in [
+                ("binary_search", lambda x: binary_search(data, x)),
+                ("interpolation_search", lambda x: interpolation_search(data, x)),
+                ("exponential_search", lambda x: exponential_search(data, x)),
+                ("auto", lambda x: chosen(data, x)),
+            ]:
+                t, hits = per_query(fn, probes)
+                print(f"  {label:<26} {t * 1e9:8.0f} ns/query  hits={hits}")
+            ordered = sorted(probes)
+            t, hits = per_query(lambda x: binary_search(data, x), ordered)
+            print(f"  {'binary_search, sorted':<26} {t * 1e9:8.0f} ns/query  hits={hits}")
+            t, hits = gallop_sorted(data, ordered)
+            print(f"  {'gallop from previous hit':<26} {t * 1e9:8.0f} ns/query  hits={hits}")
+            del data
@@ -0,0 +1,179 @@
+# Multi-process sieve over shared memory.
+#
+# The table has the layout of primes.sieve_odd (byte i is 1 iff 2i + 1 is
+# prime) and lives in one multiprocessing.shared_memory block. The base
+# primes up to sqrt(max_n) are computed once and handed to every worker;
+# each worker sieves disjoint, segment-aligned slices of the table and
+# copies them straight into the block. Other processes attach to the
+# finished table by name and read it without copying.
+#
+#   python shared_sieve.py --max-n 1e9
+import argparse
+import os
+import pickle
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from math import isqrt
+from multiprocessing import shared_memory
+from time import perf_counter
+
+from primes import SEGMENT_SIZE, _small_odd_primes, _odd_segments, sieve_odd
+
+# Slices per worker, so a slow slice does not leave the other workers idle.
+SLICES_PER_WORKER = 4
+COUNT_CHUNK = 1 << 24
+
+
+def _attach(name):
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    return shared_memory.SharedMemory(name=name)
+
+
+def _fill(buf, lo, hi, base):
+    # Sieve table indices [lo, hi), i.e. the odd numbers 2*lo+1 .. 2*hi-1.
+    for first, segment in _odd_segments(2 * lo + 1, 2 * hi - 1, base=base):
+        i = first // 2
+        buf[i:i + len(segment)] = segment
+
+
+# ---------- Worker side ----------
+_worker_shm = None
+_worker_base = None
+
+
+def _init_worker(name, base):
+    global _worker_shm, _worker_base
+    _worker_shm = _attach(name)
+    _worker_base = base
+
+
+def _sieve_slice(bounds):
+    lo, hi = bounds
+    _fill(_worker_shm.buf, lo, hi, _worker_base)
+    return hi - lo
+
+
+class SharedSieve:
+    """
+    Odd-only prime table up to max_n in shared memory.
+
+    Build it with SharedSieve.build(); attach from another process with
+    SharedSieve.attach(name, max_n), or simply pass the object to a worker:
+    it pickles as a reference to the block, not as its contents.
+    """
+
+    def __init__(self, shm, max_n, owner):
+        self._shm = shm
+        self.name = shm.name
+        self.max_n = max_n
+        self.owner = owner
+        self.table = shm.buf[:(max_n + 1) // 2]
+
+    @classmethod
+    def build(cls, max_n, workers=None):
+        """Sieve up to max_n with `workers` processes (default os.cpu_count())."""
+        size = (max_n + 1) // 2
+        shm = shared_memory.SharedMemory(create=True, size=max(1, size))
+        try:
+            base = _small_odd_primes(isqrt(max_n))
+            workers = workers or os.cpu_count() or 1
+            span = -(-size // (workers * SLICES_PER_WORKER))
+            span = max(SEGMENT_SIZE, -(-span // SEGMENT_SIZE) * SEGMENT_SIZE)
+            slices = [(lo, min(size, lo + span)) for lo in range(0, size, span)]
+            if workers == 1:
+                for lo, hi in slices:
+                    _fill(shm.buf, lo, hi, base)
+            else:
+                with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                         initargs=(shm.name, base)) as pool:
+                    for _ in pool.map(_sieve_slice, slices):
+                        pass
+        except BaseException:
+            shm.close()
+            shm.unlink()
+            raise
+        return cls(shm, max_n, owner=True)
+
+    @classmethod
+    def attach(cls, name, max_n):
+        return cls(_attach(name), max_n, owner=False)
+
+    def __reduce__(self):
+        return (SharedSieve.attach, (self.name, self.max_n))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Detach; the owner also frees the shared block."""
+        self.table.release()
+        self._shm.close()
+        if self.owner:
+            self._shm.unlink()
+
+    def is_prime(self, n):
+        if n > self.max_n:
+            raise ValueError(f"{n} is beyond the table (max_n={self.max_n})")
+        if n % 2 == 0:
+            return n == 2
+        return n > 1 and self.table[n // 2] == 1
+
+    def count(self, lo=0, hi=None):
+        """Number of primes p with lo <= p <= hi (default: the whole table)."""
+        hi = self.max_n if hi is None else min(hi, self.max_n)
+        if hi < max(lo, 2):
+            return 0
+        total = 1 if lo <= 2 else 0
+        a, b = max(lo, 1) // 2, (hi - 1) // 2 + 1
+        for i in range(a, b, COUNT_CHUNK):
+            total += bytes(self.table[i:min(b, i + COUNT_CHUNK)]).count(1)
+        return total
+
+
+def _count_window(task):
+    # Runs in a child process: `table` arrives attached, not copied.
+    table, lo, hi = task
+    try:
+        return table.count(lo, hi)
+    finally:
+        table.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Shared-memory multi-process sieve")
+    parser.add_argument("--max-n", type=float, default=1e9)
+    parser.add_argument("--workers", type=int, nargs="*", help="worker counts to time (default: 1, 2, 4, ... cores)")
+    args = parser.parse_args()
+    max_n = int(args.max_n)
+    cores = os.cpu_count() or 1
+    counts = args.workers or sorted({1, 2, 4, 8, 16, 32, cores} & set(range(1, cores + 1)))
+
+    print(f"Sieve up to {max_n:.0e}: table of {(max_n + 1) // 2 / 2**20:.0f} MB, {cores} cores")
+    t0 = perf_counter()
+    table = sieve_odd(max_n)
+    base_t = perf_counter() - t0
+    expected = 1 + table.count(1) if max_n >= 2 else 0
+    del table
+    print(f"primes.sieve_odd (one process)  {base_t:.2f}s  pi={expected}")
+
+    for workers in counts:
+        t0 = perf_counter()
+        sieve = SharedSieve.build(max_n, workers)
+        dt = perf_counter() - t0
+        with sieve:
+            pi = sieve.count()
+            print(f"SharedSieve workers={workers:<3}      {dt:.2f}s  speedup={base_t / dt:.2f}x  "
+                  f"pi={pi} correct={pi == expected}")
+
+    # Readers in other processes attach by name; the pickled object is tiny.
+    with SharedSieve.build(max_n, cores) as sieve:
+        step = max_n // 4 + 1
+        windows = [(sieve, lo, min(max_n, lo + step - 1)) for lo in range(0, max_n + 1, step)]
+        with ProcessPoolExecutor(max_workers=min(4, cores)) as pool:
+            parts = list(pool.map(_count_window, windows))
+        print(f"pi counted in {len(parts)} child processes: {sum(parts)}  "
+              f"(pickled table reference: {len(pickle.dumps(sieve))} bytes)")
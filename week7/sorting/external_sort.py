@@ -0,0 +1,194 @@
+# external_sort.py
+# External merge sort for files larger than RAM: the input is split into
+# line-aligned byte ranges, worker processes sort each range into a run
+# file, and the runs are k-way merged through a heap (heapq.merge) into a
+# streamed output.
+#
+#   python external_sort.py numbers.txt sorted.txt --kind int --memory-mb 256
+import argparse
+import heapq
+import io
+import os
+import random
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from sorting import mergesort, heapsort, introsort
+
+# A list of parsed lines takes several times the bytes it was read from
+# (object headers plus list slots), so chunks get memory_limit / this.
+PYTHON_OVERHEAD = 8
+MIN_CHUNK = 1 << 20
+# Runs merged at once; more runs are merged in several passes.
+MAX_FANIN = 128
+WRITE_BATCH = 1 << 14
+
+# ---------- Line formats ----------
+# Lines are handled as bytes: for UTF-8 text, byte order equals code point order.
+def _parse(kind, lines):
+    if kind == "int":
+        return [int(line) for line in lines]
+    return [line.rstrip(b"\n") for line in lines]
+
+def _format(kind, items):
+    if kind == "int":
+        return b"".join(b"%d\n" % x for x in items)
+    return b"".join(x + b"\n" for x in items)
+
+def _read_run(kind, path):
+    with open(path, "rb") as f:
+        if kind == "int":
+            yield from map(int, f)
+        else:
+            for line in f:
+                yield line.rstrip(b"\n")
+
+def _write_items(kind, items, path):
+    with open(path, "wb") as f:
+        while True:
+            batch = list(islice(items, WRITE_BATCH))
+            if not batch:
+                break
+            f.write(_format(kind, batch))
+
+# ---------- Run generation ----------
+IN_PLACE_SORTERS = {"builtin": list.sort, "introsort": introsort}
+COPYING_SORTERS = {"mergesort": mergesort, "heapsort": heapsort}
+SORTERS = [*IN_PLACE_SORTERS, *COPYING_SORTERS]
+
+def _sort_inplace(items, sort_fn):
+    if sort_fn in IN_PLACE_SORTERS:
+        IN_PLACE_SORTERS[sort_fn](items)
+    else:
+        items[:] = COPYING_SORTERS[sort_fn](items)
+
+def _sort_run(task):
+    # Worker: read one byte range of the input, sort it and write a run file.
+    path, start, end, kind, sort_fn, run_path = task
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+    # Split on b"\n" only, as split_ranges and _read_run do (splitlines would
+    # also cut records at \r, \x0b, \x0c, \x1c...).
+    items = _parse(kind, io.BytesIO(data))
+    del data
+    _sort_inplace(items, sort_fn)
+    _write_items(kind, iter(items), run_path)
+    return run_path
+
+def split_ranges(path, chunk_bytes):
+    """Yield (start, end) byte ranges of `path` that end on a line boundary."""
+    size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        start = 0
+        while start < size:
+            end = min(start + chunk_bytes, size)
+            if end < size:
+                f.seek(end)
+                end += len(f.readline())
+            yield start, end
+            start = end
+
+# ---------- Merging ----------
+def _merge_runs(kind, runs, tmp_dir):
+    # Reduce the number of runs below MAX_FANIN with intermediate merges.
+    level = 0
+    while len(runs) > MAX_FANIN:
+        merged = []
+        for i in range(0, len(runs), MAX_FANIN):
+            group = runs[i:i + MAX_FANIN]
+            out = os.path.join(tmp_dir, f"merge-{level}-{i}.run")
+            _write_items(kind, heapq.merge(*(_read_run(kind, r) for r in group)), out)
+            for r in group:
+                os.remove(r)
+            merged.append(out)
+        runs = merged
+        level += 1
+    return heapq.merge(*(_read_run(kind, r) for r in runs))
+
+def iter_external_sort(path, kind="text", memory_limit=256 << 20, workers=None,
+                       sort_fn="builtin", tmp_dir=None):
+    """
+    Lazily yield the sorted lines of `path` (bytes without newline, or ints).
+
+    Args:
+        path: Input file, one item per line.
+        kind: "text" to sort lines as bytes, "int" to sort them as integers.
+        memory_limit: Approximate bytes of RAM the run phase may use in total.
+        workers: Worker processes for the run phase (default: os.cpu_count()).
+        sort_fn: In-memory sort for each run: "builtin", "introsort",
+            "mergesort" or "heapsort".
+        tmp_dir: Directory for run files (default: the system temp dir).
+    """
+    if sort_fn not in SORTERS:
+        raise ValueError(f"unknown sort_fn {sort_fn!r}")
+    workers = workers or os.cpu_count() or 1
+    chunk_bytes = max(MIN_CHUNK, memory_limit // (workers * PYTHON_OVERHEAD))
+    run_dir = tempfile.mkdtemp(prefix="extsort-", dir=tmp_dir)
+    try:
+        tasks = (
+            (path, start, end, kind, sort_fn, os.path.join(run_dir, f"run-{i}.run"))
+            for i, (start, end) in enumerate(split_ranges(path, chunk_bytes))
+        )
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            runs = list(pool.map(_sort_run, tasks))
+        yield from _merge_runs(kind, runs, run_dir)
+    finally:
+        shutil.rmtree(run_dir, ignore_errors=True)
+
+def external_sort(path, out_path, kind="text", memory_limit=256 << 20, workers=None,
+                  sort_fn="builtin", tmp_dir=None):
+    """Sort `path` into `out_path` with iter_external_sort, streaming the output."""
+    _write_items(kind, iter_external_sort(path, kind, memory_limit, workers, sort_fn, tmp_dir),
+                 out_path)
+
+# ---------- Benchmark ----------
+def write_random_ints(path, n, seed=0):
+    rng = random.Random(seed)
+    with open(path, "wb") as f:
+        for i in range(0, n, WRITE_BATCH):
+            count = min(WRITE_BATCH, n - i)
+            f.write(_format("int", (rng.randint(0, 10**12) for _ in range(count))))
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="External merge sort of a line-based file")
+    parser.add_argument("input", nargs="?", help="file to sort (omit to run the scaling benchmark)")
+    parser.add_argument("output", nargs="?")
+    parser.add_argument("--kind", choices=["text", "int"], default="text")
+    parser.add_argument("--memory-mb", type=int, default=256)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--sort-fn", choices=SORTERS, default="builtin")
+    parser.add_argument("--bench-n", type=int, default=5_000_000,
+                        help="integers in the generated benchmark file")
+    return parser.parse_args()
+
+if __name__ == "__main__":
+    args = parse_args()
+    if args.input:
+        external_sort(args.input, args.output or args.input + ".sorted", args.kind,
+                      args.memory_mb << 20, args.workers, args.sort_fn)
+    else:
+        with tempfile.TemporaryDirectory() as tmp:
+            src = os.path.join(tmp, "ints.txt")
+            dst = os.path.join(tmp, "sorted.txt")
+            write_random_ints(src, args.bench_n)
+            size_mb = os.path.getsize(src) / 2**20
+            print(f"Benchmark: external sort of {args.bench_n} ints ({size_mb:.0f} MB), "
+                  f"memory limit {args.memory_mb} MB")
+            cores = os.cpu_count() or 1
+            counts = sorted({1, 2, 4, 8, 16, cores} & set(range(1, cores + 1)))
+            for workers in counts:
+                start = time.perf_counter()
+                external_sort(src, dst, "int", args.memory_mb << 20, workers, args.sort_fn)
+                dt = time.perf_counter() - start
+                with open(dst, "rb") as f:
+                    prev, ok = None, True
+                    for x in map(int, f):
+                        if prev is not None and x < prev:
+                            ok = False
+                            break
+                        prev = x
+                print(f"workers={workers:<3} time={dt:.2f}s  {size_mb / dt:.1f} MB/s  sorted={ok}")
@@ -0,0 +1,136 @@
+# integer_sorting.py
+# Non-comparison sorts for integer data: counting sort and LSD radix sort.
+# They accept lists, array.array and NumPy arrays and return a new sorted
+# container of the same kind. NumPy is optional: when it is installed the
+# passes are vectorized, otherwise a pure-Python version runs.
+import random
+import time
+from array import array
+from itertools import chain, repeat
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+RADIX_BITS = 8
+# Counting sort wins while the value span is at most this many times N.
+COUNTING_SPAN_FACTOR = 4
+# Below this size the overhead of either sort outweighs sorted().
+SMALL_N = 64
+
+# ---------- Helpers ----------
+def _is_numpy(a):
+    return np is not None and isinstance(a, np.ndarray)
+
+def _bounds(a):
+    if _is_numpy(a):
+        return int(a.min()), int(a.max())
+    return min(a), max(a)
+
+def _same_kind(a, values):
+    # Wrap a sorted list of ints in the container type of `a`.
+    if isinstance(a, array):
+        return array(a.typecode, values)
+    return values
+
+# ---------- Counting sort ----------
+def counting_sort(a):
+    """Sort integers by counting occurrences of each value in [min, max]. O(n + span)."""
+    if len(a) == 0:
+        return a.copy() if _is_numpy(a) else a[:]
+    lo, hi = _bounds(a)
+    if _is_numpy(a):
+        counts = np.bincount(a.astype(np.int64) - lo)
+        return np.repeat(np.arange(lo, hi + 1, dtype=a.dtype), counts)
+
+    counts = [0] * (hi - lo + 1)
+    for x in a:
+        counts[x - lo] += 1
+    out = list(chain.from_iterable(repeat(v, c) for v, c in enumerate(counts, lo) if c))
+    return _same_kind(a, out)
+
+# ---------- LSD radix sort ----------
+def radix_sort(a, bits=RADIX_BITS):
+    """Sort integers with least-significant-digit radix passes of `bits` bits each. O(n * passes)."""
+    if len(a) == 0:
+        return a.copy() if _is_numpy(a) else a[:]
+    lo, hi = _bounds(a)
+    span = hi - lo
+    mask = (1 << bits) - 1
+
+    if _is_numpy(a):
+        # Shift to non-negative so the digits of negative values are well defined.
+        keys = (a.astype(np.int64) - lo).astype(np.uint64)
+        out = a.copy()
+        shift = 0
+        while span >> shift:
+            order = np.argsort((keys >> np.uint64(shift)) & np.uint64(mask), kind="stable")
+            keys = keys[order]
+            out = out[order]
+            shift += bits
+        return out
+
+    values = [x - lo for x in a] if lo else list(a)
+    shift = 0
+    while span >> shift:
+        buckets = [[] for _ in range(mask + 1)]
+        for x in values:
+            buckets[(x >> shift) & mask].append(x)
+        values = list(chain.from_iterable(buckets))
+        shift += bits
+    if lo:
+        values = [x + lo for x in values]
+    return _same_kind(a, values)
+
+# ---------- Automatic selection ----------
+def choose_int_sort(n, span, vectorized=False):
+    """
+    Name the algorithm int_sort uses for n values spanning `span`.
+
+    Pure-Python radix passes cost more per element than the C timsort behind
+    sorted(), so radix is only picked when its passes run in NumPy.
+    """
+    if n < SMALL_N:
+        return "builtin"
+    if span <= COUNTING_SPAN_FACTOR * n:
+        return "counting"
+    return "radix" if vectorized else "builtin"
+
+def int_sort(a):
+    """Sort integers with counting sort, radix sort or sorted(), picked from N and the value range."""
+    if len(a) == 0:
+        return a.copy() if _is_numpy(a) else a[:]
+    lo, hi = _bounds(a)
+    choice = choose_int_sort(len(a), hi - lo, _is_numpy(a))
+    if choice == "counting":
+        return counting_sort(a)
+    if choice == "radix":
+        return radix_sort(a)
+    if _is_numpy(a):
+        return np.sort(a)
+    return _same_kind(a, sorted(a))
+
+# ---------- Benchmark ----------
+if __name__ == "__main__":
+    N = 1_000_000
+    data = [random.randint(0, 10000) for _ in range(N)]
+    wide = [random.randint(0, 2**31 - 1) for _ in range(N)]
+
+    for case_name, values in [("0..10000", data), ("0..2^31", wide)]:
+        containers = [("list", values), ("array('i')", array("i", values))]
+        if np is not None:
+            containers.append(("numpy int32", np.array(values, dtype=np.int32)))
+        span = max(values) - min(values)
+        print(f"\nCase: {case_name} (n={N})")
+        expected = sorted(values)
+        for kind, arr in containers:
+            for name, fn in [("counting_sort", counting_sort), ("radix_sort", radix_sort),
+                             ("int_sort", int_sort), ("sorted", sorted)]:
+                if fn is counting_sort and span > 10 * N:
+                    continue
+                start = time.perf_counter()
+                out = fn(arr)
+                dt = time.perf_counter() - start
+                print(f"{kind:<12} {name:<14} time={dt:.4f}s  correct={list(out) == expected}")
+            print(f"{kind:<12} int_sort picked {choose_int_sort(N, span, _is_numpy(arr))}")
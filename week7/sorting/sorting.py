@@ -71,31 +71,156 @@ def mergesort(a):
     out.extend(left[i:]); out.extend(right[j:])
     return out
 
+def _sift_down(a, i, size, lo=0):
+    # Max-heap stored in a[lo:lo+size]; i is the index relative to lo.
+    while True:
+        largest = i
+        l = 2*i + 1
+        r = 2*i + 2
+        if l < size and a[lo+l] > a[lo+largest]:
+            largest = l
+        if r < size and a[lo+r] > a[lo+largest]:
+            largest = r
+        if largest == i:
+            break
+        a[lo+i], a[lo+largest] = a[lo+largest], a[lo+i]
+        i = largest
+
 def heapsort(a):
     a = a[:]
     n = len(a)
-
-    def heapify(i, size):
-        while True:
-            largest = i
-            l = 2*i + 1
-            r = 2*i + 2
-            if l < size and a[l] > a[largest]:
-                largest = l
-            if r < size and a[r] > a[largest]:
-                largest = r
-            if largest == i:
-                break
-            a[i], a[largest] = a[largest], a[i]
-            i = largest
-
     for i in range(n//2 - 1, -1, -1):
-        heapify(i, n)
+        _sift_down(a, i, n)
     for end in range(n-1, 0, -1):
         a[0], a[end] = a[end], a[0]
-        heapify(0, end)
+        _sift_down(a, 0, end)
     return a
 
+# ---------- In-place variants ----------
+# These sort the given list in place and return None, like list.sort.
+INSERTION_CUTOFF = 16
+
+def _with_key(a, key, reverse, core):
+    # Run core(list) honouring key= and reverse= the way list.sort does.
+    # Keys are computed once and paired with the original index, so ties
+    # never compare the elements themselves and stable cores stay stable.
+    if reverse:
+        a.reverse()
+    if key is None:
+        core(a)
+    else:
+        decorated = [(key(x), i) for i, x in enumerate(a)]
+        core(decorated)
+        a[:] = [a[i] for _, i in decorated]
+    if reverse:
+        a.reverse()
+
+def _insertion_range(a, lo, hi):
+    for i in range(lo + 1, hi):
+        key = a[i]
+        j = i - 1
+        while j >= lo and key < a[j]:
+            a[j+1] = a[j]
+            j -= 1
+        a[j+1] = key
+
+def _heapsort_range(a, lo, hi):
+    n = hi - lo
+    for i in range(n//2 - 1, -1, -1):
+        _sift_down(a, i, n, lo)
+    for end in range(n-1, 0, -1):
+        a[lo], a[lo+end] = a[lo+end], a[lo]
+        _sift_down(a, 0, end, lo)
+
+def _introsort(a, lo, hi, depth):
+    # Sorts a[lo:hi]. Recurses on the smaller side and loops on the larger,
+    # so the stack stays O(log n) even before the depth limit kicks in.
+    while hi - lo > INSERTION_CUTOFF:
+        if depth == 0:
+            _heapsort_range(a, lo, hi)
+            return
+        depth -= 1
+
+        # Median of three moved into a[mid], then Hoare partition.
+        mid = (lo + hi) // 2
+        if a[mid] < a[lo]:
+            a[lo], a[mid] = a[mid], a[lo]
+        if a[hi-1] < a[mid]:
+            a[mid], a[hi-1] = a[hi-1], a[mid]
+            if a[mid] < a[lo]:
+                a[lo], a[mid] = a[mid], a[lo]
+        pivot = a[mid]
+        i, j = lo - 1, hi
+        while True:
+            i += 1
+            while a[i] < pivot:
+                i += 1
+            j -= 1
+            while pivot < a[j]:
+                j -= 1
+            if i >= j:
+                break
+            a[i], a[j] = a[j], a[i]
+
+        # a[lo:j+1] <= pivot <= a[j+1:hi]
+        if j + 1 - lo < hi - j - 1:
+            _introsort(a, lo, j + 1, depth)
+            lo = j + 1
+        else:
+            _introsort(a, j + 1, hi, depth)
+            hi = j + 1
+    _insertion_range(a, lo, hi)
+
+def introsort(a, key=None, reverse=False):
+    """Sort list `a` in place: quicksort, heapsort past 2*log2(n) levels, insertion sort for small ranges."""
+    def core(b):
+        _introsort(b, 0, len(b), 2 * max(1, len(b)).bit_length())
+    _with_key(a, key, reverse, core)
+
+def _copy_range(dst, k, src, i, j):
+    # dst[k:k+(j-i)] = src[i:j] in bounded slices, so no temporary list is
+    # ever as large as the range being copied.
+    step = 1024
+    while i < j:
+        m = min(j - i, step)
+        dst[k:k+m] = src[i:i+m]
+        i += m
+        k += m
+
+def _mergesort_bottom_up(a):
+    n = len(a)
+    for lo in range(0, n, INSERTION_CUTOFF):
+        _insertion_range(a, lo, min(lo + INSERTION_CUTOFF, n))
+    if n <= INSERTION_CUTOFF:
+        return
+
+    # Merge runs of doubling width back and forth between `a` and one buffer.
+    src, dst = a, [None] * n
+    width = INSERTION_CUTOFF
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            i, j, k = lo, mid, lo
+            while i < mid and j < hi:
+                if src[j] < src[i]:
+                    dst[k] = src[j]; j += 1
+                else:
+                    dst[k] = src[i]; i += 1
+                k += 1
+            if i < mid:
+                _copy_range(dst, k, src, i, mid)
+            else:
+                _copy_range(dst, k, src, j, hi)
+        src, dst = dst, src
+        width *= 2
+    if src is not a:
+        _copy_range(a, 0, src, 0, n)
+
+def mergesort_bottom_up(a, key=None, reverse=False):
+    """Stable in-place sort of list `a`: bottom-up mergesort with a single auxiliary buffer."""
+    _with_key(a, key, reverse, _mergesort_bottom_up)
+
 # ---------- Benchmark ----------
 if __name__ == "__main__":
     N = 2000
@@ -0,0 +1,247 @@
+# sorting_bench.py
+# Benchmark suite for the algorithms in sorting.py: input-distribution
+# generators, size sweeps with per-algorithm time budgets, warmups/repeats
+# with perf_counter, optional tracemalloc peak memory, and table / JSON
+# lines / CSV output.
+#
+#   python sorting_bench.py --sizes 100 1000 10000 --dists random sorted --format json
+import argparse
+import csv
+import json
+import math
+import random
+import statistics
+import string
+import sys
+import time
+import tracemalloc
+
+from sorting import (bubble_original, bubble_enhanced, insertion_sort,
+                     selection_sort, quicksort, mergesort, heapsort,
+                     introsort, mergesort_bottom_up)
+from integer_sorting import counting_sort, radix_sort, int_sort
+
+# ---------- Input generators ----------
+def gen_random(n, rng):
+    return [rng.randint(0, 10 * n) for _ in range(n)]
+
+def gen_sorted(n, rng):
+    return sorted(gen_random(n, rng))
+
+def gen_reverse(n, rng):
+    return sorted(gen_random(n, rng), reverse=True)
+
+def gen_nearly_sorted(n, rng):
+    # Sorted, then about 1% of positions swapped with a random partner.
+    a = gen_sorted(n, rng)
+    for _ in range(max(1, n // 100)):
+        i, j = rng.randrange(n), rng.randrange(n)
+        a[i], a[j] = a[j], a[i]
+    return a
+
+def gen_few_unique(n, rng):
+    return [rng.randint(0, 9) for _ in range(n)]
+
+def gen_sawtooth(n, rng):
+    # Ascending runs of about sqrt(n) elements.
+    run = max(1, math.isqrt(n))
+    return [i % run for i in range(n)]
+
+def gen_strings(n, rng):
+    letters = string.ascii_lowercase
+    return ["".join(rng.choices(letters, k=8)) for _ in range(n)]
+
+def gen_tuples(n, rng):
+    return [(rng.randint(0, 100), rng.randint(0, 10 * n)) for _ in range(n)]
+
+GENERATORS = {
+    "random": gen_random,
+    "sorted": gen_sorted,
+    "reverse": gen_reverse,
+    "nearly_sorted": gen_nearly_sorted,
+    "few_unique": gen_few_unique,
+    "sawtooth": gen_sawtooth,
+    "strings": gen_strings,
+    "tuples": gen_tuples,
+}
+
+# The in-place sorts get the same input copy the other functions make.
+def introsort_copy(a):
+    a = a[:]
+    introsort(a)
+    return a
+
+def mergesort_bottom_up_copy(a):
+    a = a[:]
+    mergesort_bottom_up(a)
+    return a
+
+# (name, function, worst-case growth exponent used until two sizes are measured)
+ALGORITHMS = [
+    ("bubble_original", bubble_original, 2),
+    ("bubble_enhanced", bubble_enhanced, 2),
+    ("insertion_sort", insertion_sort, 2),
+    ("selection_sort", selection_sort, 2),
+    ("quicksort", quicksort, 1.1),
+    ("mergesort", mergesort, 1.1),
+    ("heapsort", heapsort, 1.1),
+    ("introsort", introsort_copy, 1.1),
+    ("mergesort_bu", mergesort_bottom_up_copy, 1.1),
+    ("counting_sort", counting_sort, 1),
+    ("radix_sort", radix_sort, 1),
+    ("int_sort", int_sort, 1),
+]
+# Integer-only sorts are not run on the string and tuple distributions.
+INT_ONLY = {"counting_sort", "radix_sort", "int_sort"}
+NON_INT_DISTS = {"strings", "tuples"}
+
+# ---------- Timing ----------
+# Input size of the calibration run that seeds each algorithm's prediction.
+CALIBRATION_N = 256
+
+def measure(fn, data, warmup, repeats):
+    """Run fn(data) `warmup` times untimed, then return (times, output) of `repeats` runs."""
+    out = None
+    for _ in range(warmup):
+        fn(data)
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        out = fn(data)
+        times.append(time.perf_counter() - start)
+    return times, out
+
+def peak_memory(fn, data):
+    """Peak bytes allocated by one fn(data) call, as seen by tracemalloc."""
+    tracemalloc.start()
+    try:
+        fn(data)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def calibrate(fn, gen, seed):
+    """(size, seconds) of fn on a CALIBRATION_N input: the first point for predict()."""
+    data = gen(CALIBRATION_N, random.Random(seed))
+    times, _ = measure(fn, data, 0, 3)
+    return CALIBRATION_N, min(times)
+
+def predict(history, n, exponent):
+    """Extrapolate one run at size n from earlier (size, seconds) measurements."""
+    if not history:
+        return 0.0
+    last_n, last_t = history[-1]
+    if len(history) >= 2:
+        prev_n, prev_t = history[-2]
+        if prev_t > 0 and last_t > 0 and last_n > prev_n:
+            # Measured growth, clamped to the range sorting algorithms live in.
+            exponent = math.log(last_t / prev_t) / math.log(last_n / prev_n)
+            exponent = min(2.0, max(1.0, exponent))
+    return last_t * (n / last_n) ** exponent
+
+def run_suite(sizes, dists, algs, warmup=1, repeats=3, budget=2.0, seed=0, memory=False):
+    """
+    Yield one record (dict) per (distribution, size, algorithm).
+
+    An algorithm is skipped at a size when its predicted total time for
+    warmup + repeats exceeds `budget` seconds, and stays skipped for larger
+    sizes of that distribution. An algorithm with no timings yet is first
+    run on CALIBRATION_N elements to seed the prediction. With `memory`,
+    one extra untimed run records the tracemalloc peak.
+    """
+    for dist in dists:
+        history = {name: [] for name, _, _ in algs}
+        skipped = set()
+        for n in sorted(sizes):
+            data = GENERATORS[dist](n, random.Random(seed))
+            expected = sorted(data)
+            for name, fn, exponent in algs:
+                if name in INT_ONLY and dist in NON_INT_DISTS:
+                    continue
+                record = {"algorithm": name, "distribution": dist, "n": n}
+                if not history[name] and n > CALIBRATION_N:
+                    # No timings yet: a small run stops a large first size from
+                    # launching a quadratic sort with no prediction.
+                    history[name].append(calibrate(fn, GENERATORS[dist], seed))
+                estimate = predict(history[name], n, exponent)
+                if name in skipped or estimate * (warmup + repeats) > budget:
+                    skipped.add(name)
+                    record.update(skipped=True, predicted_s=estimate)
+                    yield record
+                    continue
+                times, out = measure(fn, data, warmup, repeats)
+                history[name].append((n, min(times)))
+                record.update(
+                    skipped=False,
+                    repeats=repeats,
+                    min_s=min(times),
+                    median_s=statistics.median(times),
+                    mean_s=statistics.fmean(times),
+                    correct=out == expected,
+                )
+                if memory:
+                    record["peak_kib"] = peak_memory(fn, data) / 1024
+                yield record
+
+# ---------- Output ----------
+FIELDS = ["algorithm", "distribution", "n", "skipped", "repeats",
+          "min_s", "median_s", "mean_s", "correct", "peak_kib", "predicted_s"]
+
+def write_table(records, out):
+    current = None
+    for r in records:
+        key = (r["distribution"], r["n"])
+        if key != current:
+            current = key
+            print(f"\nCase: {r['distribution']} (n={r['n']})", file=out)
+        if r["skipped"]:
+            print(f"{r['algorithm']:<15} skipped (predicted {r['predicted_s']:.2f}s per run)", file=out)
+        else:
+            peak = f"  peak={r['peak_kib']:.0f} KiB" if "peak_kib" in r else ""
+            print(f"{r['algorithm']:<15} min={r['min_s']:.6f}s  median={r['median_s']:.6f}s  "
+                  f"correct={r['correct']}{peak}", file=out)
+        out.flush()
+
+def write_json(records, out):
+    for r in records:
+        out.write(json.dumps(r) + "\n")
+        out.flush()
+
+def write_csv(records, out):
+    writer = csv.DictWriter(out, fieldnames=FIELDS)
+    writer.writeheader()
+    for r in records:
+        writer.writerow(r)
+        out.flush()
+
+WRITERS = {"table": write_table, "json": write_json, "csv": write_csv}
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the algorithms in sorting.py")
+    parser.add_argument("--sizes", type=int, nargs="+",
+                        default=[100, 1_000, 10_000, 100_000, 1_000_000])
+    parser.add_argument("--dists", nargs="+", choices=list(GENERATORS), default=list(GENERATORS))
+    parser.add_argument("--algs", nargs="+", choices=[a[0] for a in ALGORITHMS],
+                        default=[a[0] for a in ALGORITHMS])
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--budget", type=float, default=2.0,
+                        help="max predicted seconds per algorithm and size")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--memory", action="store_true",
+                        help="also record tracemalloc peak memory per run")
+    parser.add_argument("--format", choices=list(WRITERS), default="table")
+    parser.add_argument("--out", help="write results to this file instead of stdout")
+    return parser.parse_args(argv)
+
+if __name__ == "__main__":
+    args = parse_args()
+    algs = [a for a in ALGORITHMS if a[0] in args.algs]
+    records = run_suite(args.sizes, args.dists, algs, args.warmup, args.repeats,
+                        args.budget, args.seed, args.memory)
+    out = open(args.out, "w", newline="") if args.out else sys.stdout
+    try:
+        WRITERS[args.format](records, out)
+    finally:
+        if args.out:
+            out.close()
@@ -0,0 +1,155 @@
+import random
+from array import array
+
+# Module imports, not `from ... import`: each of these modules imports
+# batch_kernels back for its NumPy row, so names are looked up at call time.
+import find_duplicates
+import find_sum
+import max_item
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# NumPy counterparts of find_duplicates / find_sum / max_item.
+#
+# Each kernel takes a 1-D array (one answer) or a 2-D batch (one answer per
+# row, computed in a single vectorized pass). Without NumPy the same calls
+# fall back to the pure-Python functions, row by row.
+
+def _is_batch(a):
+    # Pure-Python fallback: a batch is a sequence of list/tuple/array rows.
+    # Strings and bytes are values, not rows, so ["ab", "ab"] is one 1-D
+    # input here just as it is for np.asarray.
+    return len(a) > 0 and isinstance(a[0], (list, tuple, array))
+
+def _rows(a):
+    # Pure-Python fallback: the list of rows of a batch, or [a].
+    return list(a) if _is_batch(a) else [a]
+
+# ---------- Duplicates ----------
+def has_duplicates_numpy(a):
+    """
+    True if `a` has a repeated value; for a 2-D batch, one bool per row.
+
+    Sorts along the last axis and looks for equal neighbours.
+    """
+    if np is None:
+        results = [find_duplicates.has_duplicates_set(row) for row in _rows(a)]
+        return results if _is_batch(a) else results[0]
+    arr = np.asarray(a)
+    if arr.shape[-1] < 2:
+        return np.zeros(arr.shape[:-1], dtype=bool) if arr.ndim == 2 else False
+    s = np.sort(arr, axis=-1)
+    dup = (s[..., 1:] == s[..., :-1]).any(axis=-1)
+    return dup if arr.ndim == 2 else bool(dup)
+
+# ---------- Two-sum ----------
+def _two_sum_sorted(s, T):
+    # s: 2-D, each row sorted; T: (rows, 1). One flat searchsorted over rows
+    # shifted into disjoint integer ranges finds every complement at once.
+    # Widen first: in a narrower dtype T - s and s - lo can wrap around.
+    s = s.astype(np.int64)
+    T = T.astype(np.int64)
+    rows, n = s.shape
+    lo, hi = int(s.min()), int(s.max())
+    span = hi - lo + 1
+    comp = T - s
+    valid = (comp >= lo) & (comp <= hi)
+    shift = (np.arange(rows, dtype=np.int64) * span)[:, None]
+    keys = s - lo + shift
+    want = np.clip(comp, lo, hi) - lo + shift
+    flat = keys.ravel()
+    pos = np.minimum(np.searchsorted(flat, want.ravel()), flat.size - 1).reshape(rows, n)
+    found = valid & (flat[pos] == want)
+    # A value matching itself needs a second copy: an equal sorted neighbour.
+    repeated = np.zeros_like(found)
+    repeated[:, 1:] |= s[:, 1:] == s[:, :-1]
+    repeated[:, :-1] |= s[:, 1:] == s[:, :-1]
+    return (found & ((comp != s) | repeated)).any(axis=1)
+
+def two_sum_numpy(a, T):
+    """
+    True if two different positions of `a` add up to T; for a 2-D batch, one
+    bool per row (T may then be a scalar or one target per row).
+    """
+    if np is None:
+        rows = _rows(a)
+        targets = T if isinstance(T, (list, tuple)) else [T] * len(rows)
+        results = [find_sum.two_sum_hash(row, t) for row, t in zip(rows, targets)]
+        return results if _is_batch(a) else results[0]
+    arr = np.asarray(a)
+    batch = arr.reshape(1, -1) if arr.ndim == 1 else arr
+    targets = np.broadcast_to(np.asarray(T), (batch.shape[0],)).reshape(-1, 1)
+    if batch.shape[1] < 2:
+        out = np.zeros(batch.shape[0], dtype=bool)
+    else:
+        s = np.sort(batch, axis=1)
+        integer = np.issubdtype(s.dtype, np.integer) and np.issubdtype(targets.dtype, np.integer)
+        span = int(s.max()) - int(s.min()) + 1 if integer else None
+        if span is not None and span * batch.shape[0] < 1 << 62:
+            out = _two_sum_sorted(s, targets)
+        else:
+            # Floats or huge ranges: the same lookup one row at a time.
+            out = np.empty(batch.shape[0], dtype=bool)
+            for r, (row, t) in enumerate(zip(s, targets[:, 0])):
+                comp = t - row
+                pos = np.minimum(np.searchsorted(row, comp), len(row) - 1)
+                eq = row[1:] == row[:-1]
+                repeated = np.concatenate(([False], eq)) | np.concatenate((eq, [False]))
+                out[r] = ((row[pos] == comp) & ((comp != row) | repeated)).any()
+    return out if arr.ndim == 2 else bool(out[0])
+
+# ---------- Max ----------
+def max_numpy(a):
+    """Maximum of `a`; for a 2-D batch, the maximum of each row."""
+    if np is None:
+        results = [max_item.max_builtin(row) for row in _rows(a)]
+        return results if _is_batch(a) else results[0]
+    arr = np.asarray(a)
+    return arr.max(axis=-1) if arr.ndim == 2 else arr.max().item()
+
+# ---------- Main ----------
+if __name__ == "__main__":
+    run_and_time, pretty = find_duplicates.run_and_time, find_duplicates.pretty
+    size = 10_000_000
+    # Worst cases: the only duplicate is the last element and no pair sums to T.
+    nums = random.sample(range(10 * size), size)
+    nums[-1] = nums[0]
+    data = np.array(nums) if np is not None else nums
+    T = -1
+    print(f"Benchmark: n={size} ({'numpy' if np is not None else 'numpy missing, python fallback'})")
+
+    for func in (find_duplicates.has_duplicates_sort, find_duplicates.has_duplicates_set):
+        result, dt = run_and_time(func, nums)
+        print(f"{func.__name__:<22} result={result} time={pretty(dt)}")
+    result, dt = run_and_time(has_duplicates_numpy, data)
+    print(f"{'has_duplicates_numpy':<22} result={result} time={pretty(dt)}")
+
+    for func in (find_sum.two_sum_twoptr, find_sum.two_sum_hash):
+        result, dt = run_and_time(lambda xs: func(xs, T), nums)
+        print(f"{func.__name__:<22} result={result} time={pretty(dt)}")
+    result, dt = run_and_time(lambda xs: two_sum_numpy(xs, T), data)
+    print(f"{'two_sum_numpy':<22} result={result} time={pretty(dt)}")
+
+    for func in (max_item.max_linear, max_item.max_builtin, max_numpy):
+        result, dt = run_and_time(func, data if func is max_numpy else nums)
+        print(f"{func.__name__:<22} result={result} time={pretty(dt)}")
+
+    # 1000 independent arrays of 10_000 values in one call.
+    rows = [nums[i:i + 10_000] for i in range(0, 10_000_000, 10_000)]
+    batch = np.array(rows) if np is not None else rows
+    print(f"\nBatch: {len(rows)} rows x {len(rows[0])}")
+    result, dt = run_and_time(lambda rs: [find_duplicates.has_duplicates_set(r) for r in rs], rows)
+    print(f"{'has_duplicates_set loop':<24} rows with dups={sum(result)} time={pretty(dt)}")
+    result, dt = run_and_time(has_duplicates_numpy, batch)
+    print(f"{'has_duplicates_numpy':<24} rows with dups={sum(result)} time={pretty(dt)}")
+    result, dt = run_and_time(lambda rs: [find_sum.two_sum_hash(r, T) for r in rs], rows)
+    print(f"{'two_sum_hash loop':<24} rows with pair={sum(result)} time={pretty(dt)}")
+    result, dt = run_and_time(lambda rs: two_sum_numpy(rs, T), batch)
+    print(f"{'two_sum_numpy':<24} rows with pair={sum(result)} time={pretty(dt)}")
+    result, dt = run_and_time(lambda rs: [max(r) for r in rs], rows)
+    print(f"{'max loop':<24} sum of maxima={sum(result)} time={pretty(dt)}")
+    result, dt = run_and_time(max_numpy, batch)
+    print(f"{'max_numpy':<24} sum of maxima={sum(result)} time={pretty(dt)}")
@@ -1,5 +1,7 @@
 import time, random
 
+import batch_kernels  # module import: batch_kernels imports this module too
+
 # ---------- Algorithms ----------
 def has_duplicates_bruteforce(nums):
     for i in range(len(nums)):
@@ -43,6 +45,6 @@ if __name__ == "__main__":
 
     print(f"Benchmark: Duplicates check (n={len(nums)})")
 
-    for func in (has_duplicates_bruteforce, has_duplicates_sort, has_duplicates_set):
+    for func in (has_duplicates_bruteforce, has_duplicates_sort, has_duplicates_set, batch_kernels.has_duplicates_numpy):
         result, dt = run_and_time(func, nums)
         print(f"{func.__name__:<25} result={result} time={pretty(dt)}")
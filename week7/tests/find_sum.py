@@ -1,6 +1,8 @@
 import time
 import random
 
+import batch_kernels  # module import: batch_kernels imports this module too
+
 def two_sum_bruteforce(nums, T):
     for i in range(len(nums)):
         for j in range(i+1, len(nums)):
@@ -51,3 +53,5 @@ if __name__ == "__main__":
     run_and_time(two_sum_twoptr, nums, T)
     run_and_time(two_sum_hash, nums, T)
 
+    run_and_time(batch_kernels.two_sum_numpy, nums, T)
+
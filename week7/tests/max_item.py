@@ -1,5 +1,7 @@
 import time, random
 
+import batch_kernels  # module import: batch_kernels imports this module too
+
 # ---------- Algorithms ----------
 def max_sort(nums):
     nums = sorted(nums)
@@ -31,6 +33,6 @@ if __name__ == "__main__":
     nums = [random.randint(0, 1_000_000) for _ in range(100_000)]
     print(f"Benchmark: Max in list (n={len(nums)})")
 
-    for func in (max_sort, max_linear, max_builtin):
+    for func in (max_sort, max_linear, max_builtin, batch_kernels.max_numpy):
         result, dt = run_and_time(func, nums)
         print(f"{func.__name__:<12} result={result} time={pretty(dt)}")
@@ -0,0 +1,295 @@
+import time, random, os, math, struct, hashlib, shutil, tempfile, contextlib
+
+from find_duplicates import has_duplicates_bruteforce, has_duplicates_sort, has_duplicates_set
+
+# Streaming duplicate detection in bounded memory.
+#
+# Stage 1: every item is hashed once. A Bloom filter answers "definitely new"
+# or "maybe seen"; the item's key is appended to a hash-partitioned spill file
+# on disk, either the `first` file or the `candidate` file of its partition.
+# Stage 2: one partition at a time, the (few) candidate keys are loaded into a
+# dict and the partition's `first` file is streamed past it to count exact
+# occurrences. Bloom false positives end up with a count of 1 and are dropped.
+#
+# Only the Bloom filter, one partition's candidates and the file buffers are
+# held in memory at once. A partition whose candidates would not fit in the
+# confirm budget is first split again on disk, with a fresh hash, until the
+# pieces fit.
+
+DEFAULT_MEMORY = 64 << 20
+MAX_PARTITIONS = 64
+_RECORD = struct.Struct("<I")
+# Heap bytes per loaded candidate beyond its on-disk record: bytes object
+# header plus its share of the counts dict.
+_KEY_OVERHEAD = 80
+# Most files a partition is re-split into at once, and how deep to recurse.
+MAX_FANOUT = 256
+MAX_DEPTH = 16
+# Smallest write buffer per spill file.
+MIN_BUFFER = 1024
+
+# ---------- Keys ----------
+# Items are ints, str or bytes; they are spilled as a 1-byte type tag + data.
+def _encode(item):
+    if isinstance(item, bytes):
+        return b"b" + item
+    if isinstance(item, str):
+        return b"s" + item.encode("utf-8")
+    if isinstance(item, int):
+        # int() first: bools count as the ints they compare equal to.
+        return b"i" + str(int(item)).encode("ascii")
+    raise TypeError(f"unsupported item type: {type(item).__name__}")
+
+def _decode(key):
+    tag, data = key[:1], key[1:]
+    if tag == b"b":
+        return data
+    if tag == b"s":
+        return data.decode("utf-8")
+    return int(data)
+
+def _write_key(f, key):
+    f.write(_RECORD.pack(len(key)))
+    f.write(key)
+
+def _read_keys(path):
+    with open(path, "rb") as f:
+        while True:
+            head = f.read(_RECORD.size)
+            if not head:
+                return
+            (size,) = _RECORD.unpack(head)
+            yield f.read(size)
+
+# ---------- Bloom filter ----------
+class BloomFilter:
+    """Bloom filter over a bytearray, probed by double hashing."""
+
+    def __init__(self, n_bits, n_hashes):
+        self.n_bits = max(8, n_bits)
+        self.n_hashes = n_hashes
+        self.bits = bytearray((self.n_bits + 7) // 8)
+
+    @classmethod
+    def for_capacity(cls, memory_bytes, expected_items):
+        """Size the filter to `memory_bytes` with the optimal hash count for `expected_items`."""
+        n_bits = memory_bytes * 8
+        k = round(n_bits / max(1, expected_items) * math.log(2))
+        return cls(n_bits, min(16, max(1, k)))
+
+    def add_and_check(self, h1, h2):
+        """Set the item's bits; return True if they were all set already (maybe seen)."""
+        bits = self.bits
+        m = self.n_bits
+        seen = True
+        for i in range(self.n_hashes):
+            pos = (h1 + i * h2) % m
+            byte, mask = pos >> 3, 1 << (pos & 7)
+            if not bits[byte] & mask:
+                seen = False
+                bits[byte] |= mask
+        return seen
+
+    def false_positive_rate(self, items):
+        """Expected false-positive rate after `items` insertions."""
+        return (1 - math.exp(-self.n_hashes * items / self.n_bits)) ** self.n_hashes
+
+# ---------- Detector ----------
+class StreamingDuplicateDetector:
+    """
+    Find duplicated items in a stream too large for a set().
+
+    Args:
+        memory_bytes: Approximate memory budget. Half goes to the Bloom
+            filter, a quarter to spill buffers and a quarter to one
+            partition's candidates during confirmation.
+        expected_items: Expected stream length, used to pick the number of
+            Bloom hash functions.
+        partitions: Number of hash partitions spilled to disk. Default:
+            as many as the spill quarter holds with MIN_BUFFER-byte
+            buffers on both files of each, up to MAX_PARTITIONS. An
+            explicit value is capped to the same bound.
+        tmp_dir: Where spill files go (default: the system temp dir).
+    """
+
+    def __init__(self, memory_bytes=DEFAULT_MEMORY, expected_items=10**8,
+                 partitions=None, tmp_dir=None):
+        self.bloom = BloomFilter.for_capacity(memory_bytes // 2, expected_items)
+        spill_bytes = memory_bytes // 4
+        fit = max(1, spill_bytes // (2 * MIN_BUFFER))
+        partitions = min(fit, partitions or MAX_PARTITIONS)
+        self.partitions = partitions
+        self.confirm_bytes = memory_bytes // 4
+        self.items = 0
+        self.candidates = 0
+        self._cand_counts = [0] * partitions
+        self._dir = tempfile.mkdtemp(prefix="dups-", dir=tmp_dir)
+        # Spread the spill quarter of the budget over the 2 * partitions files.
+        buffering = max(MIN_BUFFER, spill_bytes // (2 * partitions))
+        self._first = [open(os.path.join(self._dir, f"first-{p}"), "wb", buffering=buffering)
+                       for p in range(partitions)]
+        self._cand = [open(os.path.join(self._dir, f"cand-{p}"), "wb", buffering=buffering)
+                      for p in range(partitions)]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Delete the spill files."""
+        for f in self._first + self._cand:
+            f.close()
+        shutil.rmtree(self._dir, ignore_errors=True)
+
+    def add(self, item):
+        key = _encode(item)
+        digest = hashlib.blake2b(key, digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        p = h1 % self.partitions
+        self.items += 1
+        if self.bloom.add_and_check(h1, h2):
+            self.candidates += 1
+            self._cand_counts[p] += 1
+            _write_key(self._cand[p], key)
+        else:
+            _write_key(self._first[p], key)
+
+    def update(self, items):
+        for item in items:
+            self.add(item)
+
+    def duplicates(self):
+        """Yield (item, count) for every item seen at least twice, partition by partition."""
+        for f in self._first + self._cand:
+            f.flush()
+        for p in range(self.partitions):
+            if self._cand_counts[p]:
+                yield from self._confirm(self._cand[p].name, self._first[p].name,
+                                         self._cand_counts[p], 0)
+
+    def _confirm(self, cand_path, first_path, n_cand, depth):
+        # Count the candidates of one partition exactly; split it first if
+        # its candidates would not fit in confirm_bytes.
+        need = os.path.getsize(cand_path) + n_cand * _KEY_OVERHEAD
+        if need > self.confirm_bytes and depth < MAX_DEPTH and n_cand > 1:
+            # Each open piece costs a write buffer, so a small budget splits
+            # into fewer pieces per level and recurses deeper instead.
+            fanout = min(MAX_FANOUT, self.confirm_bytes // MIN_BUFFER,
+                         -(-2 * need // max(1, self.confirm_bytes)))
+            fanout = max(2, fanout)
+            pieces = self._split(cand_path, first_path, fanout, depth + 1)
+            # An unsplittable partition (one key repeated) lands in one piece;
+            # its dict holds a single key, so it is loaded as is.
+            try:
+                if max(n for _, _, n in pieces) < n_cand:
+                    for sub_cand, sub_first, n in pieces:
+                        if n:
+                            yield from self._confirm(sub_cand, sub_first, n, depth + 1)
+                    return
+            finally:
+                for sub_cand, sub_first, _ in pieces:
+                    os.remove(sub_cand)
+                    os.remove(sub_first)
+        counts = {}
+        for key in _read_keys(cand_path):
+            counts[key] = counts.get(key, 0) + 1
+        for key in _read_keys(first_path):
+            if key in counts:
+                counts[key] += 1
+        for key, count in counts.items():
+            if count > 1:
+                yield _decode(key), count
+
+    def _split(self, cand_path, first_path, fanout, depth):
+        # Re-partition both files of a partition by a hash salted with the depth.
+        salt = depth.to_bytes(2, "little")
+        buffering = max(MIN_BUFFER, self.confirm_bytes // fanout)
+        pieces = []
+        for path in (cand_path, first_path):
+            outs = [open(f"{path}.{depth}.{i}", "wb", buffering=buffering) for i in range(fanout)]
+            written = [0] * fanout
+            with contextlib.ExitStack() as stack:
+                for f in outs:
+                    stack.enter_context(f)
+                for key in _read_keys(path):
+                    h = hashlib.blake2b(key, digest_size=8, salt=salt).digest()
+                    i = int.from_bytes(h, "little") % fanout
+                    written[i] += 1
+                    _write_key(outs[i], key)
+            pieces.append(([f.name for f in outs], written))
+        (cands, n_cands), (firsts, _) = pieces
+        return list(zip(cands, firsts, n_cands))
+
+def iter_file_items(path):
+    """Yield the lines of a file as bytes without the line ending."""
+    with open(path, "rb") as f:
+        for line in f:
+            yield line.rstrip(b"\r\n")
+
+def _items(source):
+    return iter_file_items(source) if isinstance(source, (str, os.PathLike)) else source
+
+def find_all_duplicates(source, **kwargs):
+    """
+    Return {item: count} for items that occur more than once.
+
+    `source` is any iterable of ints/str/bytes, or a file path (one item per
+    line). Keyword arguments go to StreamingDuplicateDetector.
+    """
+    with StreamingDuplicateDetector(**kwargs) as detector:
+        detector.update(_items(source))
+        return dict(detector.duplicates())
+
+def has_duplicates_stream(source, **kwargs):
+    """True if `source` (iterable or file path) contains a repeated item."""
+    with StreamingDuplicateDetector(**kwargs) as detector:
+        detector.update(_items(source))
+        if detector.candidates == 0:
+            return False  # the Bloom filter never fired: no repeats, no disk pass
+        for _ in detector.duplicates():
+            return True
+        return False
+
+# ---------- Benchmark helpers ----------
+def run_and_time(func, nums):
+    start = time.perf_counter()
+    result = func(nums)
+    return result, time.perf_counter() - start
+
+def pretty(sec):
+    if sec < 1e-3: return f"{sec*1e6:.2f} µs"
+    if sec < 1: return f"{sec*1e3:.2f} ms"
+    return f"{sec:.4f} s"
+
+# ---------- Main ----------
+if __name__ == "__main__":
+    for size, funcs in [
+        (20_000, (has_duplicates_bruteforce, has_duplicates_sort, has_duplicates_set, has_duplicates_stream)),
+        (1_000_000, (has_duplicates_sort, has_duplicates_set, has_duplicates_stream)),
+    ]:
+        nums = random.sample(range(10 * size), size)
+        # Force a duplicate at the very end, so no early exit helps.
+        nums[-1] = nums[0]
+        print(f"\nBenchmark: Duplicates check (n={len(nums)})")
+        for func in funcs:
+            result, dt = run_and_time(func, nums)
+            print(f"{func.__name__:<25} result={result} time={pretty(dt)}")
+
+    size = 1_000_000
+    nums = [random.randint(0, 5 * size) for _ in range(size)]
+    with StreamingDuplicateDetector(memory_bytes=8 << 20, expected_items=size) as det:
+        start = time.perf_counter()
+        det.update(nums)
+        dups = dict(det.duplicates())
+        dt = time.perf_counter() - start
+        fp = det.bloom.false_positive_rate(size)
+    exact = {}
+    for x in nums:
+        exact[x] = exact.get(x, 0) + 1
+    exact = {x: c for x, c in exact.items() if c > 1}
+    print(f"\nfind_all_duplicates (n={size}, 8 MB budget): {len(dups)} duplicated ids, "
+          f"candidates={det.candidates}, expected Bloom FP rate={fp:.4f}, "
+          f"time={pretty(dt)}, matches dict count={dups == exact}")
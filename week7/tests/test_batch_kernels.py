@@ -0,0 +1,40 @@
+# Description: The NumPy kernels and their pure-Python fallback must agree on
+# what is a batch: a sequence of list/tuple/array rows is one, a sequence of
+# strings or bytes is a single 1-D input.
+#
+#   python -m pytest test_batch_kernels.py
+
+from array import array
+
+import pytest
+
+import batch_kernels
+from batch_kernels import has_duplicates_numpy, max_numpy, two_sum_numpy
+
+PATHS = ["python"] + (["numpy"] if batch_kernels.np is not None else [])
+
+
+@pytest.fixture(params=PATHS)
+def path(request, monkeypatch):
+    if request.param == "python":
+        monkeypatch.setattr(batch_kernels, "np", None)
+    return request.param
+
+
+@pytest.mark.parametrize("values, expected", [
+    (["a", "a"], True),
+    (["ab", "ba"], False),
+    ([b"xy", b"xy", b"z"], True),
+    ([3, 1, 3], True),
+    ([3, 1, 2], False),
+])
+def test_duplicates_1d(path, values, expected):
+    assert has_duplicates_numpy(values) is expected
+
+
+@pytest.mark.parametrize("make_row", [list, tuple, lambda r: array("q", r)])
+def test_rows_are_a_batch(path, make_row):
+    rows = [make_row([1, 2, 1]), make_row([4, 5, 6])]
+    assert [bool(x) for x in has_duplicates_numpy(rows)] == [True, False]
+    assert [bool(x) for x in two_sum_numpy(rows, 3)] == [True, False]
+    assert [int(x) for x in max_numpy(rows)] == [2, 6]
@@ -0,0 +1,172 @@
+import time, random, heapq
+from array import array
+
+from max_item import max_sort, max_linear, max_builtin
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Sizes at or below this are finished with sorted().
+SMALL_RANGE = 16
+
+# ---------- Helpers ----------
+def _is_numpy(a):
+    return np is not None and isinstance(a, np.ndarray)
+
+def _median_of_medians(a):
+    medians = [sorted(a[i:i + 5])[(min(5, len(a) - i) - 1) // 2] for i in range(0, len(a), 5)]
+    return _select_value(medians, (len(medians) - 1) // 2, fast=False)
+
+def _select_value(a, k, fast=True):
+    # Introselect on values: median-of-three quickselect while each round
+    # leaves less than 3/4 of the range (a geometric series, O(n) in total).
+    # After the first round that does not, median-of-medians pivots take
+    # over, so the worst case stays O(n). Partitions are built with
+    # comprehensions, which run far faster than an element-by-element swap
+    # loop; `a` is never mutated.
+    while len(a) > SMALL_RANGE:
+        size = len(a)
+        if fast:
+            pivot = sorted((a[0], a[size // 2], a[-1]))[1]
+        else:
+            pivot = _median_of_medians(a)
+        lows = [x for x in a if x < pivot]
+        if k < len(lows):
+            a = lows
+        else:
+            highs = [x for x in a if pivot < x]
+            equal = size - len(lows) - len(highs)
+            if k < len(lows) + equal:
+                return pivot
+            k -= len(lows) + equal
+            a = highs
+        if 4 * len(a) >= 3 * size:
+            fast = False
+    return sorted(a)[k]
+
+def _rearrange(a, lows, value, equal, highs):
+    # Write lows + [value]*equal + highs back into `a` (list or array.array).
+    out = lows + [value] * equal + highs
+    if isinstance(a, array):
+        out = array(a.typecode, out)
+    a[:] = out
+
+# ---------- Selection API ----------
+def nth_element(a, k):
+    """
+    Rearrange `a` in place so a[k] is the k-th smallest (0-based) and return it.
+
+    Everything before k is <= a[k] and everything after is >= a[k].
+    Works on lists, array.array and NumPy arrays (via ndarray.partition).
+    """
+    n = len(a)
+    if not 0 <= k < n:
+        raise IndexError("nth_element index out of range")
+    if _is_numpy(a):
+        a.partition(k)
+        return a[k]
+    value = _select_value(a, k)
+    lows = [x for x in a if x < value]
+    highs = [x for x in a if value < x]
+    _rearrange(a, lows, value, n - len(lows) - len(highs), highs)
+    return value
+
+def partial_sort(a, k):
+    """Rearrange `a` in place so a[:k] holds its k smallest values in sorted order."""
+    n = len(a)
+    k = min(k, n)
+    if k <= 0:
+        return
+    if _is_numpy(a):
+        if k < n:
+            a.partition(k - 1)
+        a[:k].sort()
+        return
+    value = _select_value(a, k - 1)
+    lows = sorted(x for x in a if x < value)
+    highs = [x for x in a if value < x]
+    _rearrange(a, lows, value, n - len(lows) - len(highs), highs)
+
+def top_k(a, k):
+    """Return the k largest values of `a`, largest first (bounded heap, O(n log k))."""
+    if k <= 0:
+        return a[:0] if _is_numpy(a) else []
+    if _is_numpy(a):
+        if k < len(a):
+            a = a[np.argpartition(a, len(a) - k)[len(a) - k:]]
+        return np.sort(a)[::-1]
+    return heapq.nlargest(k, a)
+
+def bottom_k(a, k):
+    """Return the k smallest values of `a`, smallest first (bounded heap, O(n log k))."""
+    if k <= 0:
+        return a[:0] if _is_numpy(a) else []
+    if _is_numpy(a):
+        if k < len(a):
+            a = a[np.argpartition(a, k - 1)[:k]]
+        return np.sort(a)
+    return heapq.nsmallest(k, a)
+
+def median(a):
+    """Lower median of `a` in expected O(n), without modifying `a`."""
+    k = (len(a) - 1) // 2
+    if _is_numpy(a):
+        return np.partition(a, k)[k]
+    return _select_value(a, k)
+
+# ---------- Benchmark helpers ----------
+def run_and_time(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+def pretty(sec):
+    if sec < 1e-3: return f"{sec*1e6:.2f} µs"
+    if sec < 1: return f"{sec*1e3:.2f} ms"
+    return f"{sec:.4f} s"
+
+def median_sort(nums):
+    return sorted(nums)[(len(nums) - 1) // 2]
+
+def top100_sort(nums):
+    return sorted(nums, reverse=True)[:100]
+
+def top100_heap(nums):
+    return top_k(nums, 100)
+
+def top1_heap(nums):
+    return top_k(nums, 1)[0]
+
+def partial_sort_100(nums):
+    nums = nums.copy() if _is_numpy(nums) else nums[:]
+    partial_sort(nums, 100)
+    return nums[:100]
+
+def sort_100(nums):
+    return sorted(nums)[:100]
+
+# ---------- Main ----------
+if __name__ == "__main__":
+    nums = [random.randint(0, 1_000_000) for _ in range(1_000_000)]
+    containers = [("list", nums), ("array('i')", array("i", nums))]
+    if np is not None:
+        containers.append(("numpy", np.array(nums)))
+
+    for kind, data in containers:
+        print(f"\nBenchmark: selection on {kind} (n={len(data)})")
+        groups = [
+            ("max", (max_sort, max_linear, max_builtin, top1_heap)),
+            ("median", (median_sort, median)),
+            ("top-100", (top100_sort, top100_heap)),
+            ("smallest 100 sorted", (sort_100, partial_sort_100)),
+        ]
+        for title, funcs in groups:
+            for func in funcs:
+                result, dt = run_and_time(func, data)
+                if title in ("max", "median"):
+                    shown = result
+                else:
+                    shown = f"{list(result[:3])}..."
+                print(f"{title:<20} {func.__name__:<16} result={shown} time={pretty(dt)}")
@@ -0,0 +1,215 @@
+import time, random
+from bisect import bisect_left
+
+from find_sum import two_sum_twoptr, two_sum_hash, generate_random_list
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Matrix cells (targets x distinct values) per NumPy block in query_many.
+BLOCK_CELLS = 1 << 22
+
+# ---------- Index ----------
+class TwoSumIndex:
+    """
+    Two-sum / k-sum queries against a fixed list, built once.
+
+    two_sum_twoptr sorts and two_sum_hash builds a set on every call; the
+    index does that work once, so each query only pays for the scan.
+    """
+
+    def __init__(self, nums):
+        self.nums = list(nums)
+        n = len(self.nums)
+        # Sorted values with their original positions, for k-sum.
+        self._order = sorted(range(n), key=self.nums.__getitem__)
+        self._sorted = [self.nums[i] for i in self._order]
+        # value -> count, and value -> positions, for two-sum.
+        self._counts = {}
+        self._positions = {}
+        for i, x in enumerate(self.nums):
+            self._counts[x] = self._counts.get(x, 0) + 1
+            self._positions.setdefault(x, []).append(i)
+        self._values = set(self._counts)
+        self._np_values = self._np_counts = None
+        if np is not None and n:
+            self._np_values, self._np_counts = np.unique(np.asarray(self.nums), return_counts=True)
+
+    def __len__(self):
+        return len(self.nums)
+
+    def _out_of_range(self, T):
+        return len(self.nums) < 2 or not (2 * self._sorted[0] <= T <= 2 * self._sorted[-1])
+
+    def query(self, T):
+        """True if two different positions of nums add up to T."""
+        if self._out_of_range(T):
+            return False
+        values = self._values
+        # Set intersection in C: is some T - x also a value?
+        if values.isdisjoint(T - x for x in values):
+            return False
+        # Exact half: T // 2 keeps big ints exact, T / 2 covers odd or float T.
+        half = T // 2 if isinstance(T, int) and T % 2 == 0 else T / 2
+        if half + half != T or self._counts.get(half, 0) != 1:
+            return True
+        # The only match may be T/2 pairing with itself; check without it.
+        return any(T - x in values for x in values if x != half)
+
+    def query_many(self, targets):
+        """
+        Answer query() for every target, returning a list of bools.
+
+        With NumPy, all (target, value) complements are looked up with one
+        searchsorted call per block; otherwise each target is a query().
+        """
+        if self._np_values is None or not len(targets):
+            return [self.query(T) for T in targets]
+        values, counts = self._np_values, self._np_counts
+        targets = np.asarray(targets)
+        rows = max(1, BLOCK_CELLS // len(values))
+        out = []
+        for start in range(0, len(targets), rows):
+            t = targets[start:start + rows, None]
+            comp = t - values[None, :]
+            pos = np.minimum(np.searchsorted(values, comp), len(values) - 1)
+            hit = (values[pos] == comp) & ((comp != values) | (counts >= 2))
+            out.extend(hit.any(axis=1).tolist())
+        return out
+
+    def find_pair(self, T):
+        """Return one index pair (i, j), i < j, with nums[i] + nums[j] == T, or None."""
+        if self._out_of_range(T):
+            return None
+        positions = self._positions
+        for x, xs in positions.items():
+            ys = positions.get(T - x)
+            if ys is None:
+                continue
+            if ys is xs:
+                if len(xs) > 1:
+                    return xs[0], xs[1]
+            else:
+                return tuple(sorted((xs[0], ys[0])))
+        return None
+
+    def pairs(self, T):
+        """Return every index pair (i, j), i < j, with nums[i] + nums[j] == T, sorted."""
+        out = []
+        positions = self._positions
+        for x, xs in positions.items():
+            y = T - x
+            if y < x or y not in positions:
+                continue
+            if y == x:
+                out.extend((xs[a], xs[b]) for a in range(len(xs)) for b in range(a + 1, len(xs)))
+            else:
+                out.extend((min(i, j), max(i, j)) for i in xs for j in positions[y])
+        out.sort()
+        return out
+
+    def count_pairs(self, T):
+        """Number of index pairs i < j with nums[i] + nums[j] == T, in O(distinct values)."""
+        counts = self._counts
+        total = 0
+        for x, c in counts.items():
+            y = T - x
+            if x < y:
+                total += c * counts.get(y, 0)
+            elif x == y:
+                total += c * (c - 1) // 2
+        return total
+
+    def k_sum(self, T, k=3):
+        """
+        Return k distinct indices (sorted) whose values add up to T, or None.
+
+        Fixes the smallest value and recurses down to a two-pointer scan on
+        the pre-sorted values: O(n^(k-1)) per query, without re-sorting.
+        """
+        if k < 1:
+            raise ValueError("k must be at least 1")
+        found = self._k_sum(0, k, T)
+        if found is None:
+            return None
+        return tuple(sorted(self._order[p] for p in found))
+
+    def three_sum(self, T):
+        return self.k_sum(T, 3)
+
+    def _k_sum(self, start, k, T):
+        vals = self._sorted
+        n = len(vals)
+        if n - start < k:
+            return None
+        if k == 1:
+            p = bisect_left(vals, T, start)
+            return [p] if p < n and vals[p] == T else None
+        if k == 2:
+            i, j = start, n - 1
+            while i < j:
+                s = vals[i] + vals[j]
+                if s == T:
+                    return [i, j]
+                if s < T:
+                    i += 1
+                else:
+                    j -= 1
+            return None
+        top = sum(vals[n - k + 1:])
+        for i in range(start, n - k + 1):
+            if i > start and vals[i] == vals[i - 1]:
+                continue
+            if sum(vals[i:i + k]) > T:
+                break  # the k smallest remaining values already overshoot
+            if vals[i] + top < T:
+                continue  # even the k-1 largest values cannot reach T
+            rest = self._k_sum(i + 1, k - 1, T - vals[i])
+            if rest is not None:
+                return [i] + rest
+        return None
+
+# ---------- Benchmark helpers ----------
+def pretty(sec):
+    if sec < 1e-3: return f"{sec*1e6:.2f} µs"
+    if sec < 1: return f"{sec*1e3:.2f} ms"
+    return f"{sec:.4f} s"
+
+def time_queries(label, fn, count):
+    start = time.perf_counter()
+    result = fn()
+    dt = time.perf_counter() - start
+    print(f"{label:<34} hits={sum(result):<6} total={pretty(dt):<12} per query={pretty(dt / count)}")
+    return result
+
+# ---------- Main ----------
+if __name__ == "__main__":
+    nums = generate_random_list(20_000, 10_000_000)
+    targets = [random.choice(nums) + random.choice(nums) for _ in range(500)]
+    targets += [random.randint(0, 20_000_000) for _ in range(500)]
+    print(f"Benchmark: {len(targets)} two-sum queries on n={len(nums)}")
+
+    expected = time_queries("two_sum_twoptr (per call)", lambda: [two_sum_twoptr(nums, T) for T in targets],
+                            len(targets))
+    time_queries("two_sum_hash (per call)", lambda: [two_sum_hash(nums, T) for T in targets], len(targets))
+
+    start = time.perf_counter()
+    index = TwoSumIndex(nums)
+    print(f"{'TwoSumIndex build':<34} time={pretty(time.perf_counter() - start)}")
+    got = time_queries("TwoSumIndex.query", lambda: [index.query(T) for T in targets], len(targets))
+    many = time_queries(f"TwoSumIndex.query_many ({'numpy' if np else 'python'})",
+                        lambda: index.query_many(targets), len(targets))
+    print(f"answers agree: {got == expected and many == expected}")
+
+    T = targets[0]
+    small = TwoSumIndex(nums[:2_000])
+    print(f"\npairs summing to {T} in n=2000: count={small.count_pairs(T)} first={small.find_pair(T)}")
+    for k in (3, 4):
+        T = sum(random.sample(small.nums, k))
+        start = time.perf_counter()
+        found = small.k_sum(T, k)
+        dt = time.perf_counter() - start
+        print(f"{k}-sum target={T}: indices={found} "
+              f"check={sum(small.nums[i] for i in found) == T} time={pretty(dt)}")
@@ -0,0 +1,321 @@
+# Description: Binary tree stored in parallel typed arrays (keys, left, right)
+# instead of one Python object per node.
+
+import sys
+import tracemalloc
+from array import array
+from collections import deque
+from time import perf_counter
+
+from binary_tree import BinaryTree, Node
+
+NULL = -1
+INT64_MIN, INT64_MAX = -(1 << 63), (1 << 63) - 1  # range of typecode "q"
+
+
+class ArrayBinaryTree:
+    """
+    A binary tree whose nodes live in parallel arrays.
+
+    Node ``i`` has key ``keys[i]`` and children ``left[i]`` / ``right[i]``,
+    where ``NULL`` (-1) means no child. Integer keys are stored in a typed
+    ``array.array``; other keys fall back to a plain list.
+    """
+
+    def __init__(self, key_typecode="auto"):
+        """
+        Initialize an empty tree.
+
+        Args:
+            key_typecode (str | None): ``array`` typecode for the keys, None
+                to keep arbitrary Python objects in a list, or ``"auto"`` to
+                start with ``"q"`` and switch to a list on the first key that
+                is not a 64-bit int.
+        """
+        self._key_typecode = key_typecode
+        self._new_keys()
+
+    def _new_keys(self):
+        # Empty key storage for the configured typecode.
+        self._auto = self._key_typecode == "auto"
+        typecode = "q" if self._auto else self._key_typecode
+        self.keys = array(typecode) if typecode else []
+        self.left = array("i")
+        self.right = array("i")
+        self.root = NULL
+
+    def __len__(self):
+        return len(self.left)
+
+    def add_node(self, key, left=NULL, right=NULL):
+        """
+        Append a node and return its index.
+
+        Args:
+            key: Value to store in the node.
+            left (int): Index of the left child, or NULL.
+            right (int): Index of the right child, or NULL.
+
+        Returns:
+            int: Index of the new node.
+        """
+        if self._auto and not (type(key) is int and INT64_MIN <= key <= INT64_MAX):
+            self.keys = list(self.keys)
+            self._auto = False
+        self.keys.append(key)
+        self.left.append(left)
+        self.right.append(right)
+        return len(self.left) - 1
+
+    def is_empty(self):
+        """Check if the binary tree is empty."""
+        return self.root == NULL
+
+    def height(self):
+        """Calculate the height of the tree (-1 when empty) level by level."""
+        h = -1
+        level = [self.root] if self.root != NULL else []
+        left, right = self.left, self.right
+        while level:
+            h += 1
+            nxt = []
+            for i in level:
+                if left[i] != NULL:
+                    nxt.append(left[i])
+                if right[i] != NULL:
+                    nxt.append(right[i])
+            level = nxt
+        return h
+
+    def delete_tree(self):
+        """Delete the entire tree and release its storage."""
+        self._new_keys()
+        self.left = array("i")
+        self.right = array("i")
+        self.root = NULL
+
+    def pre_order(self):
+        """Perform a pre-order traversal (root-left-right)."""
+        return list(self.iter_pre_order())
+
+    def in_order(self):
+        """Perform an in-order traversal (left-root-right)."""
+        return list(self.iter_in_order())
+
+    def pos_order(self):
+        """Perform a post-order traversal (left-right-root)."""
+        return list(self.iter_post_order())
+
+    def bfs_traversal(self):
+        """Perform a breadth-first (level-order) traversal."""
+        return list(self.iter_level_order())
+
+    def iter_pre_order(self):
+        """Lazily yield keys in pre-order using an explicit stack."""
+        keys, left, right = self.keys, self.left, self.right
+        stack = [self.root] if self.root != NULL else []
+        while stack:
+            i = stack.pop()
+            yield keys[i]
+            if right[i] != NULL:
+                stack.append(right[i])
+            if left[i] != NULL:
+                stack.append(left[i])
+
+    def iter_in_order(self):
+        """Lazily yield keys in in-order using an explicit stack."""
+        keys, left, right = self.keys, self.left, self.right
+        stack = []
+        i = self.root
+        while stack or i != NULL:
+            while i != NULL:
+                stack.append(i)
+                i = left[i]
+            i = stack.pop()
+            yield keys[i]
+            i = right[i]
+
+    def iter_post_order(self):
+        """Lazily yield keys in post-order using an explicit stack."""
+        keys, left, right = self.keys, self.left, self.right
+        stack = []
+        last = NULL
+        i = self.root
+        while stack or i != NULL:
+            while i != NULL:
+                stack.append(i)
+                i = left[i]
+            top = stack[-1]
+            if right[top] != NULL and right[top] != last:
+                i = right[top]
+            else:
+                stack.pop()
+                yield keys[top]
+                last = top
+
+    def iter_level_order(self):
+        """Lazily yield keys in breadth-first (level) order."""
+        if self.root == NULL:
+            return
+        keys, left, right = self.keys, self.left, self.right
+        pending = deque([self.root])
+        while pending:
+            i = pending.popleft()
+            yield keys[i]
+            if left[i] != NULL:
+                pending.append(left[i])
+            if right[i] != NULL:
+                pending.append(right[i])
+
+    def print_tree(self):
+        """Print the tree structure in the same format as BinaryTree.print_tree."""
+        stack = [(" ", self.root, False)] if self.root != NULL else []
+        while stack:
+            p, i, is_left = stack.pop()
+            if is_left:
+                print(p + "|--", end='')
+                s = "|    "
+            else:
+                print(p + "'--", end='')
+                s = "    "
+            print(self.keys[i])
+            if self.right[i] != NULL:
+                stack.append((p + s, self.right[i], False))
+            if self.left[i] != NULL:
+                stack.append((p + s, self.left[i], True))
+
+    def search(self, k):
+        """
+        Find the first node (in BFS order) whose key equals ``k``.
+
+        Returns:
+            int: Index of the node, or NULL if ``k`` is not in the tree.
+        """
+        if self.root == NULL:
+            return NULL
+        keys, left, right = self.keys, self.left, self.right
+        pending = deque([self.root])
+        while pending:
+            i = pending.popleft()
+            if keys[i] == k:
+                return i
+            if left[i] != NULL:
+                pending.append(left[i])
+            if right[i] != NULL:
+                pending.append(right[i])
+        return NULL
+
+    # --- Conversion ---
+
+    @classmethod
+    def from_binary_tree(cls, tree, key_typecode="auto"):
+        """
+        Copy a pointer-based BinaryTree into array storage.
+
+        Nodes are numbered in pre-order, so the root is always index 0.
+
+        Args:
+            tree (BinaryTree): Source tree.
+            key_typecode (str | None): Typecode for the keys, as in ``__init__``.
+                ``"auto"`` keeps ``"q"`` when every key is a 64-bit int and a
+                list otherwise.
+        """
+        out = cls(key_typecode)
+        if tree.root is None:
+            return out
+
+        # (node, parent index, is_left) so each child can patch its parent.
+        stack = [(tree.root, NULL, False)]
+        while stack:
+            r, parent, is_left = stack.pop()
+            i = out.add_node(r.key)
+            if parent != NULL:
+                if is_left:
+                    out.left[parent] = i
+                else:
+                    out.right[parent] = i
+            if r.right is not None:
+                stack.append((r.right, i, False))
+            if r.left is not None:
+                stack.append((r.left, i, True))
+        out.root = 0
+        return out
+
+    def to_binary_tree(self):
+        """Build an equivalent pointer-based BinaryTree."""
+        tree = BinaryTree()
+        if self.root == NULL:
+            return tree
+        nodes = {}
+        stack = [self.root]
+        while stack:
+            i = stack.pop()
+            nodes[i] = Node(self.keys[i])
+            if self.right[i] != NULL:
+                stack.append(self.right[i])
+            if self.left[i] != NULL:
+                stack.append(self.left[i])
+        for i, r in nodes.items():
+            if self.left[i] != NULL:
+                r.left = nodes[self.left[i]]
+            if self.right[i] != NULL:
+                r.right = nodes[self.right[i]]
+        tree.root = nodes[self.root]
+        return tree
+
+
+# ---------- Memory / throughput report ----------
+
+class SlotsNode:
+    """Same fields as Node, without a per-instance __dict__."""
+    __slots__ = ("key", "left", "right")
+
+    def __init__(self, val=None):
+        self.key = val
+        self.left = None
+        self.right = None
+
+
+def build_pointer_tree(n, node_cls):
+    """Complete tree with keys 0..n-1 in heap order, using ``node_cls`` nodes."""
+    tree = BinaryTree()
+    nodes = [node_cls(i) for i in range(n)]
+    for i in range(n):
+        if 2 * i + 1 < n:
+            nodes[i].left = nodes[2 * i + 1]
+        if 2 * i + 2 < n:
+            nodes[i].right = nodes[2 * i + 2]
+    tree.root = nodes[0] if n else None
+    return tree
+
+
+def build_array_tree(n):
+    tree = ArrayBinaryTree("q")
+    tree.keys = array("q", range(n))
+    tree.left = array("i", (2 * i + 1 if 2 * i + 1 < n else NULL for i in range(n)))
+    tree.right = array("i", (2 * i + 2 if 2 * i + 2 < n else NULL for i in range(n)))
+    tree.root = 0 if n else NULL
+    return tree
+
+
+def measure(builder, n):
+    tracemalloc.start()
+    tree = builder(n)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    t0 = perf_counter()
+    for _ in tree.iter_in_order():
+        pass
+    return size, perf_counter() - t0
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    print(f"Benchmark: tree storage (n={n}, complete tree)")
+    for name, builder in (
+        ("Node (__dict__)", lambda m: build_pointer_tree(m, Node)),
+        ("SlotsNode", lambda m: build_pointer_tree(m, SlotsNode)),
+        ("ArrayBinaryTree", build_array_tree),
+    ):
+        size, dt = measure(builder, n)
+        print(f"{name:<16} memory={size / n:6.1f} B/node  in_order={dt:.4f}s")
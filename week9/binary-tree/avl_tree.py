@@ -0,0 +1,415 @@
+# Description: Self-balancing (AVL) ordered map built on the BinaryTree/Node
+# shape: insert, delete, search, floor/ceiling, range scans and order
+# statistics (select, rank) in O(log n).
+
+import bisect
+import random
+import sys
+from time import perf_counter
+
+from binary_tree import BinaryTree, Node
+
+
+class AVLNode(Node):
+    """A tree node that also stores a value and the height and size of its subtree."""
+
+    def __init__(self, key=None, value=None):
+        """
+        Initialize a leaf node.
+
+        Args:
+            key: Ordering key of the node.
+            value: Value associated with the key.
+        """
+        super().__init__(key)
+        self.value = value
+        self.height = 0
+        self.size = 1
+
+
+class AVLTree(BinaryTree):
+    """
+    An ordered map kept balanced with AVL rotations.
+
+    Keys must be mutually comparable and are unique; inserting an existing
+    key replaces its value. Traversals, print_tree and bfs_traversal are
+    inherited from BinaryTree, so in_order() returns the keys sorted.
+
+    Every node caches the height and size of its subtree, updated on the
+    insert/delete path, so height() and len() are O(1).
+    """
+
+    def __len__(self):
+        return 0 if self.root is None else self.root.size
+
+    def __contains__(self, key):
+        return self.search(key) is not None
+
+    def __iter__(self):
+        return self.iter_in_order()
+
+    def height(self):
+        """Return the cached height of the tree (-1 when empty)."""
+        return -1 if self.root is None else self.root.height
+
+    def insert(self, key, value=None):
+        """
+        Insert ``key`` with ``value``, replacing the value if the key exists.
+
+        Args:
+            key: Key to insert.
+            value: Value to associate with the key.
+        """
+        path = []
+        r = self.root
+        while r is not None:
+            path.append(r)
+            if key < r.key:
+                r = r.left
+            elif r.key < key:
+                r = r.right
+            else:
+                r.value = value
+                return
+        tmp = AVLNode(key, value)
+        if not path:
+            self.root = tmp
+            return
+        parent = path[-1]
+        if key < parent.key:
+            parent.left = tmp
+        else:
+            parent.right = tmp
+        self._retrace(path, 1)
+
+    def delete(self, key):
+        """
+        Remove ``key`` from the map.
+
+        Returns:
+            bool: True if the key was present.
+        """
+        path = []
+        r = self.root
+        while r is not None and (key < r.key or r.key < key):
+            path.append(r)
+            r = r.left if key < r.key else r.right
+        if r is None:
+            return False
+
+        if r.left is not None and r.right is not None:
+            # Move the in-order successor's entry into r, then unlink the
+            # successor, which has no left child.
+            path.append(r)
+            successor = r.right
+            while successor.left is not None:
+                path.append(successor)
+                successor = successor.left
+            r.key, r.value = successor.key, successor.value
+            r = successor
+
+        child = r.left if r.left is not None else r.right
+        self._replace_child(path[-1] if path else None, r, child)
+        self._retrace(path, -1)
+        return True
+
+    def search(self, key):
+        """
+        Find the node holding ``key``.
+
+        Returns:
+            AVLNode | None: The node, or None if the key is not present.
+        """
+        r = self.root
+        while r is not None:
+            if key < r.key:
+                r = r.left
+            elif r.key < key:
+                r = r.right
+            else:
+                return r
+        return None
+
+    def get(self, key, default=None):
+        """Return the value stored for ``key``, or ``default``."""
+        r = self.search(key)
+        return default if r is None else r.value
+
+    def floor(self, key):
+        """Return the largest key <= ``key``, or None if there is none."""
+        best = None
+        r = self.root
+        while r is not None:
+            if key < r.key:
+                r = r.left
+            else:
+                best = r.key
+                if not r.key < key:
+                    break
+                r = r.right
+        return best
+
+    def ceiling(self, key):
+        """Return the smallest key >= ``key``, or None if there is none."""
+        best = None
+        r = self.root
+        while r is not None:
+            if r.key < key:
+                r = r.right
+            else:
+                best = r.key
+                if not key < r.key:
+                    break
+                r = r.left
+        return best
+
+    def range_scan(self, lo, hi):
+        """
+        Lazily yield ``(key, value)`` pairs with ``lo <= key <= hi`` in order.
+
+        Subtrees outside the range are never visited, so a scan costs
+        O(log n + k) for k results.
+        """
+        stack = []
+        r = self.root
+        while stack or r is not None:
+            while r is not None:
+                if r.key < lo:
+                    r = r.right
+                else:
+                    stack.append(r)
+                    r = r.left
+            if not stack:
+                return
+            r = stack.pop()
+            if hi < r.key:
+                return
+            yield r.key, r.value
+            r = r.right
+
+    def select(self, k):
+        """
+        Return the k-th smallest key (0-based) in O(height).
+
+        Raises:
+            IndexError: If ``k`` is not in ``range(len(self))``.
+        """
+        if not 0 <= k < len(self):
+            raise IndexError("select index out of range")
+        r = self.root
+        while True:
+            left = 0 if r.left is None else r.left.size
+            if k < left:
+                r = r.left
+            elif k == left:
+                return r.key
+            else:
+                k -= left + 1
+                r = r.right
+
+    def rank(self, key):
+        """Return the number of keys strictly less than ``key`` in O(height)."""
+        count = 0
+        r = self.root
+        while r is not None:
+            if r.key < key:
+                count += 1 if r.left is None else r.left.size + 1
+                r = r.right
+            else:
+                r = r.left
+        return count
+
+    def count_range(self, lo, hi):
+        """Return the number of keys with ``lo <= key <= hi`` in O(height)."""
+        if hi < lo:
+            return 0
+        below_hi = 0
+        r = self.root
+        while r is not None:
+            if hi < r.key:
+                r = r.left
+            else:
+                below_hi += 1 if r.left is None else r.left.size + 1
+                r = r.right
+        return below_hi - self.rank(lo)
+
+    def items(self):
+        """Lazily yield all ``(key, value)`` pairs in key order."""
+        stack = []
+        r = self.root
+        while stack or r is not None:
+            while r is not None:
+                stack.append(r)
+                r = r.left
+            r = stack.pop()
+            yield r.key, r.value
+            r = r.right
+
+    # --- Internal helpers ---
+
+    def _h(self, r):
+        return -1 if r is None else r.height
+
+    def _update(self, r):
+        left, right = r.left, r.right
+        if left is None:
+            hl, sl = -1, 0
+        else:
+            hl, sl = left.height, left.size
+        if right is None:
+            hr, sr = -1, 0
+        else:
+            hr, sr = right.height, right.size
+        r.height = (hl if hl > hr else hr) + 1
+        r.size = sl + sr + 1
+
+    def _rotate_left(self, r):
+        tmp = r.right
+        r.right = tmp.left
+        tmp.left = r
+        self._update(r)
+        self._update(tmp)
+        return tmp
+
+    def _rotate_right(self, r):
+        tmp = r.left
+        r.left = tmp.right
+        tmp.right = r
+        self._update(r)
+        self._update(tmp)
+        return tmp
+
+    def _rebalance(self, r):
+        self._update(r)
+        balance = self._h(r.left) - self._h(r.right)
+        if balance > 1:
+            if self._h(r.left.left) < self._h(r.left.right):
+                r.left = self._rotate_left(r.left)
+            return self._rotate_right(r)
+        if balance < -1:
+            if self._h(r.right.right) < self._h(r.right.left):
+                r.right = self._rotate_right(r.right)
+            return self._rotate_left(r)
+        return r
+
+    def _replace_child(self, parent, old, new):
+        if parent is None:
+            self.root = new
+        elif parent.left is old:
+            parent.left = new
+        else:
+            parent.right = new
+
+    def _retrace(self, path, delta):
+        # Walk back up from the changed node, rebalancing. Once a subtree
+        # keeps its old height no rotation can happen above it, and the
+        # remaining ancestors only need their size adjusted by `delta`.
+        i = len(path) - 1
+        while i >= 0:
+            r = path[i]
+            old_height = r.height
+            tmp = self._rebalance(r)
+            if tmp is not r:
+                self._replace_child(path[i - 1] if i else None, r, tmp)
+            i -= 1
+            if tmp.height == old_height:
+                break
+        while i >= 0:
+            path[i].size += delta
+            i -= 1
+
+
+# ---------- Benchmark ----------
+
+def run_and_time(func, *args):
+    start = perf_counter()
+    result = func(*args)
+    return result, perf_counter() - start
+
+
+def build_avl(keys):
+    tree = AVLTree()
+    for k in keys:
+        tree.insert(k, k)
+    return tree
+
+
+def lookup_avl(tree, probes):
+    return sum(1 for k in probes if tree.search(k) is not None)
+
+
+def floor_avl(tree, probes):
+    return sum(1 for k in probes if tree.floor(k) is not None)
+
+
+def lookup_bisect(data, probes):
+    n = len(data)
+    found = 0
+    for k in probes:
+        i = bisect.bisect_left(data, k)
+        if i < n and data[i] == k:
+            found += 1
+    return found
+
+
+def floor_bisect(data, probes):
+    return sum(1 for k in probes if bisect.bisect_right(data, k) > 0)
+
+
+def lookup_dict(table, probes):
+    return sum(1 for k in probes if k in table)
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    # Even keys, so the odd ones are free for the update phase.
+    keys = [2 * k for k in random.sample(range(2 * n), n)]
+    probes = [random.randrange(4 * n) for _ in range(n)]
+    print(f"Benchmark: ordered map (n={n}, {len(probes)} probes)")
+
+    tree, avl_build = run_and_time(build_avl, keys)
+    data, bisect_build = run_and_time(sorted, keys)
+    table, dict_build = run_and_time(dict.fromkeys, keys)
+    print(f"{'build':<8} avl={avl_build:.4f}s  sorted list={bisect_build:.4f}s  dict={dict_build:.4f}s")
+
+    found, avl_t = run_and_time(lookup_avl, tree, probes)
+    _, bisect_t = run_and_time(lookup_bisect, data, probes)
+    _, dict_t = run_and_time(lookup_dict, table, probes)
+    print(f"{'lookup':<8} avl={avl_t:.4f}s  bisect={bisect_t:.4f}s  dict={dict_t:.4f}s  (found={found})")
+
+    _, avl_t = run_and_time(floor_avl, tree, probes)
+    _, bisect_t = run_and_time(floor_bisect, data, probes)
+    print(f"{'floor':<8} avl={avl_t:.4f}s  bisect={bisect_t:.4f}s  dict=n/a")
+
+    # Mixed updates: the sorted list pays O(n) shifting per insort/delete.
+    m = min(n, 100_000)
+    fresh = [2 * k + 1 for k in random.sample(range(2 * n), m)]
+
+    def update_avl():
+        for k in fresh:
+            tree.insert(k)
+        for k in fresh:
+            tree.delete(k)
+
+    def update_bisect():
+        for k in fresh:
+            bisect.insort(data, k)
+        for k in fresh:
+            del data[bisect.bisect_left(data, k)]
+
+    _, avl_t = run_and_time(update_avl)
+    _, bisect_t = run_and_time(update_bisect)
+    print(f"{'updates':<8} avl={avl_t:.4f}s  insort={bisect_t:.4f}s  ({2 * m} ops)")
+
+    # Statistics polled on hot paths: cached O(1)/O(height) vs a full walk.
+    _, cached_t = run_and_time(lambda: (tree.height(), len(tree)))
+    _, walk_t = run_and_time(lambda: (tree._height(tree.root), sum(1 for _ in tree)))
+    print(f"{'stats':<8} cached height+len={cached_t:.6f}s  full walk={walk_t:.4f}s  height={tree.height()}")
+
+    ranks = probes[:m]
+    _, avl_t = run_and_time(lambda: [tree.rank(k) for k in ranks])
+    _, bisect_t = run_and_time(lambda: [bisect.bisect_left(data, k) for k in ranks])
+    print(f"{'rank':<8} avl={avl_t:.4f}s  bisect={bisect_t:.4f}s  ({m} queries)")
+    positions = range(0, n, max(1, n // m))
+    _, avl_t = run_and_time(lambda: [tree.select(i) for i in positions])
+    print(f"{'select':<8} avl={avl_t:.4f}s  ({len(positions)} queries)")
@@ -0,0 +1,69 @@
+# Description: BFS through queue.Queue (the original implementation) vs the
+# level-batched lists behind bfs_traversal, _search and levels().
+
+import queue
+import sys
+from time import perf_counter
+
+from traversal_bench import build_balanced
+
+
+def bfs_queue(tree):
+    if tree.root is None:
+        return []
+    result = []
+    cola = queue.Queue()
+    cola.put(tree.root)
+    while not cola.empty():
+        tmp = cola.get()
+        result.append(tmp.key)
+        if tmp.left is not None:
+            cola.put(tmp.left)
+        if tmp.right is not None:
+            cola.put(tmp.right)
+    return result
+
+
+def search_queue(tree, k):
+    if tree.root is None:
+        return None
+    cola = queue.Queue()
+    cola.put(tree.root)
+    while not cola.empty():
+        tmp = cola.get()
+        if tmp.key == k:
+            return tmp
+        if tmp.left is not None:
+            cola.put(tmp.left)
+        if tmp.right is not None:
+            cola.put(tmp.right)
+    return None
+
+
+def run_and_time(func, *args):
+    start = perf_counter()
+    result = func(*args)
+    return result, perf_counter() - start
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    # A complete tree is as wide as a binary tree gets: the last level holds ~n/2 nodes.
+    tree = build_balanced(n)
+    missing = -1
+    print(f"Benchmark: BFS on a complete tree (n={n}, width={tree.width()})")
+
+    rows = [
+        ("bfs_traversal", (bfs_queue, tree), (tree.bfs_traversal,)),
+        ("search (miss)", (search_queue, tree, missing), (tree._search, missing)),
+    ]
+    for name, old, new in rows:
+        old_out, old_t = run_and_time(*old)
+        new_out, new_t = run_and_time(*new)
+        print(f"{name:<14} queue.Queue={old_t:.4f}s  levels={new_t:.4f}s  "
+              f"speedup={old_t / new_t:5.1f}x  same={old_out == new_out}")
+
+    _, t = run_and_time(lambda: sum(1 for _ in tree.levels()))
+    _, w = run_and_time(tree.width)
+    _, d = run_and_time(tree.level_of, n - 1)
+    print(f"{'levels()':<14} {t:.4f}s  width()={w:.4f}s  level_of(last)={d:.4f}s")
@@ -1,7 +1,43 @@
 # Author: El Tigre
 # Description: Binary tree basic functions (traversals, insertion, deletion, etc.)
 
-import queue
+import gc
+import mmap
+import struct
+import sys
+from array import array
+from itertools import accumulate, chain
+
+# Text format: one character per key in pre-order, `$` for a null child.
+NULL_MARK = '$'
+CHUNK_SIZE = 1 << 20
+
+# Binary format: header, 2 structure bits per node (has left, has right) in
+# pre-order, a byte length per key (uint8 or uint32, named by the header's
+# array typecode), then the UTF-8 key bytes.
+BINARY_MAGIC = b"BTB1"
+BINARY_HEADER = struct.Struct("<4scQQ")
+HAS_LEFT = 2
+HAS_RIGHT = 1
+# Structure byte -> the four 2-bit node flags it packs, most significant first.
+_FLAGS = [(b >> 6, (b >> 4) & 3, (b >> 2) & 3, b & 3) for b in range(256)]
+
+
+class _no_gc:
+    """
+    Pause the cyclic garbage collector while a loader allocates nodes.
+
+    Trees have no reference cycles, but millions of fresh objects keep
+    triggering full collections that dominate the load time.
+    """
+
+    def __enter__(self):
+        self.enabled = gc.isenabled()
+        gc.disable()
+
+    def __exit__(self, *exc):
+        if self.enabled:
+            gc.enable()
 
 
 class Node:
@@ -43,8 +79,106 @@ class BinaryTree:
         except IOError:
             return None
 
-        self.root = self._create_from_file(handle)
-        handle.close()
+        with handle, _no_gc():
+            self.root = self._load_preorder(handle, CHUNK_SIZE)
+
+        if self.root is None:
+            return None
+        return 1
+
+    def save_to_file(self, filename):
+        """
+        Write the tree in the `$`-null pre-order format read by create_from_file.
+
+        Every key must be a single character other than `$`.
+
+        Args:
+            filename (str): Destination path.
+        """
+        parts = []
+        with open(filename, "w") as handle:
+            for key in self._iter_preorder_slots():
+                if key is None:
+                    parts.append(NULL_MARK)
+                else:
+                    key = str(key)
+                    if len(key) != 1 or key == NULL_MARK:
+                        raise ValueError(f"key {key!r} cannot be stored in the text format")
+                    parts.append(key)
+                if len(parts) >= CHUNK_SIZE:
+                    handle.write("".join(parts))
+                    parts = []
+            handle.write("".join(parts))
+
+    def save_to_binary_file(self, filename):
+        """
+        Write the tree in the compact binary format.
+
+        Keys are stored as UTF-8 text, so they load back as strings.
+
+        Args:
+            filename (str): Destination path.
+        """
+        flags = bytearray()
+        lengths = array("I")
+        blob = []
+        acc = 0
+        count = 0
+        stack = [self.root] if self.root is not None else []
+        while stack:
+            r = stack.pop()
+            data = str(r.key).encode("utf-8")
+            lengths.append(len(data))
+            blob.append(data)
+            acc = (acc << 2) | (HAS_LEFT if r.left is not None else 0) \
+                | (HAS_RIGHT if r.right is not None else 0)
+            count += 1
+            if count % 4 == 0:
+                flags.append(acc)
+                acc = 0
+            if r.right is not None:
+                stack.append(r.right)
+            if r.left is not None:
+                stack.append(r.left)
+        if count % 4:
+            flags.append(acc << 2 * (4 - count % 4))
+        if lengths and max(lengths) < 256:
+            lengths = array("B", lengths)
+        elif sys.byteorder == "big":
+            lengths.byteswap()
+
+        blob = b"".join(blob)
+        with open(filename, "wb") as handle:
+            typecode = lengths.typecode.encode("ascii")
+            handle.write(BINARY_HEADER.pack(BINARY_MAGIC, typecode, count, len(blob)))
+            handle.write(flags)
+            lengths.tofile(handle)
+            handle.write(blob)
+
+    def create_from_binary_file(self, filename):
+        """
+        Create a binary tree from a file written by save_to_binary_file.
+
+        The file is memory-mapped and rebuilt without recursion.
+
+        Args:
+            filename (str): Path to the binary serialization.
+
+        Returns:
+            int | None: 1 if tree was created successfully, None otherwise.
+        """
+        try:
+            handle = open(filename, "rb")
+        except IOError:
+            return None
+
+        with handle:
+            try:
+                data = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # empty file
+                return None
+            with data, _no_gc():
+                self.root = self._load_binary(memoryview(data))
 
         if self.root is None:
             return None
@@ -64,15 +198,99 @@ class BinaryTree:
 
     def pre_order(self):
         """Perform a pre-order traversal (root-left-right)."""
-        return self._pre_order(self.root)
+        return list(self.iter_pre_order())
 
     def in_order(self):
         """Perform an in-order traversal (left-root-right)."""
-        return self._in_order(self.root)
+        return list(self.iter_in_order())
 
     def pos_order(self):
         """Perform a post-order traversal (left-right-root)."""
-        return self._pos_order(self.root)
+        return list(self.iter_post_order())
+
+    def iter_pre_order(self):
+        """
+        Lazily yield keys in pre-order (root-left-right).
+
+        Uses an explicit stack, so it runs in O(n) time, O(height) memory
+        and does not hit the recursion limit on degenerate trees.
+        """
+        if self.root is None:
+            return
+        stack = [self.root]
+        while stack:
+            r = stack.pop()
+            yield r.key
+            if r.right is not None:
+                stack.append(r.right)
+            if r.left is not None:
+                stack.append(r.left)
+
+    def iter_in_order(self):
+        """Lazily yield keys in in-order (left-root-right) using an explicit stack."""
+        stack = []
+        r = self.root
+        while stack or r is not None:
+            while r is not None:
+                stack.append(r)
+                r = r.left
+            r = stack.pop()
+            yield r.key
+            r = r.right
+
+    def iter_post_order(self):
+        """Lazily yield keys in post-order (left-right-root) using an explicit stack."""
+        stack = []
+        last = None
+        r = self.root
+        while stack or r is not None:
+            while r is not None:
+                stack.append(r)
+                r = r.left
+            top = stack[-1]
+            if top.right is not None and top.right is not last:
+                r = top.right
+            else:
+                stack.pop()
+                yield top.key
+                last = top
+
+    def iter_level_order(self):
+        """
+        Lazily yield keys in breadth-first (level) order.
+
+        Memory is bounded by the widest level of the tree.
+        """
+        for level in self._levels():
+            for r in level:
+                yield r.key
+
+    def levels(self):
+        """
+        Lazily yield the keys of each level, root first, as one list per level.
+
+        Levels are built as plain lists, so there is no per-node locking or
+        queue bookkeeping as with queue.Queue.
+        """
+        for level in self._levels():
+            yield [r.key for r in level]
+
+    def width(self):
+        """Return the number of nodes in the widest level (0 when empty)."""
+        return max((len(level) for level in self._levels()), default=0)
+
+    def level_of(self, k):
+        """
+        Return the depth of the first node (in BFS order) whose key equals ``k``.
+
+        Returns:
+            int | None: 0 for the root, or None if ``k`` is not in the tree.
+        """
+        for depth, level in enumerate(self._levels()):
+            for r in level:
+                if r.key == k:
+                    return depth
+        return None
 
     def bfs_traversal(self):
         """Perform a breadth-first (level-order) traversal."""
@@ -84,6 +302,94 @@ class BinaryTree:
 
     # --- Internal helpers ---
 
+    def _load_preorder(self, handle, chunk_size):
+        # `pending` holds nodes whose right slot is still unread. `want_left`
+        # is the node created last, whose left slot is the next character.
+        root = None
+        want_left = None
+        pending = []
+        started = False
+        while True:
+            chunk = handle.read(chunk_size)
+            if not chunk:
+                return None  # truncated input
+            for c in chunk:
+                if not started:
+                    started = True
+                    if c == NULL_MARK:
+                        return None
+                    root = want_left = Node(c)
+                    pending.append(root)
+                    continue
+                if want_left is not None:
+                    parent = want_left
+                    want_left = None
+                    if c != NULL_MARK:
+                        tmp = parent.left = want_left = Node(c)
+                        pending.append(tmp)
+                else:
+                    parent = pending.pop()
+                    if c != NULL_MARK:
+                        tmp = parent.right = want_left = Node(c)
+                        pending.append(tmp)
+                if want_left is None and not pending:
+                    return root
+
+    def _load_binary(self, data):
+        header = BINARY_HEADER.size
+        if len(data) < header:
+            return None
+        magic, typecode, count, blob_size = BINARY_HEADER.unpack(data[:header])
+        if magic != BINARY_MAGIC or typecode not in (b"B", b"I") or count == 0:
+            return None
+        lengths = array(typecode.decode("ascii"))
+        flags_end = header + (count + 3) // 4
+        lengths_end = flags_end + lengths.itemsize * count
+        if len(data) != lengths_end + blob_size:
+            return None
+
+        blob = data[lengths_end:]
+        lengths.frombytes(data[flags_end:lengths_end])
+        if lengths.itemsize > 1 and sys.byteorder == "big":
+            lengths.byteswap()
+        if lengths.count(1) == count:
+            # Single-byte keys (the text format's case): decode in one call.
+            keys = iter(str(blob, "utf-8"))
+        else:
+            ends = accumulate(lengths)
+            keys = (str(blob[e - n:e], "utf-8") for n, e in zip(lengths, ends))
+
+        # Pre-order: a node with a left child is followed by that child,
+        # otherwise by the right child of the nearest node still waiting.
+        flags = chain.from_iterable(map(_FLAGS.__getitem__, data[header:flags_end]))
+        root = None
+        want_left = None
+        pending = []
+        for key, f in zip(keys, flags):
+            tmp = Node(key)
+            if want_left is not None:
+                want_left.left = tmp
+            elif pending:
+                pending.pop().right = tmp
+            else:
+                root = tmp
+            if f & HAS_RIGHT:
+                pending.append(tmp)
+            want_left = tmp if f & HAS_LEFT else None
+        return root
+
+    def _iter_preorder_slots(self):
+        # Pre-order keys with None for every empty child slot.
+        stack = [self.root]
+        while stack:
+            r = stack.pop()
+            if r is None:
+                yield None
+                continue
+            yield r.key
+            stack.append(r.right)
+            stack.append(r.left)
+
     def _create_from_file(self, handle):
         c = handle.read(1)
         if c == '$':
@@ -116,22 +422,24 @@ class BinaryTree:
             return []
         return self._pos_order(r.left) + self._pos_order(r.right) + [r.key]
 
-    def _bfs_traversal(self):
-        if self.root is None:
-            return []
+    def _levels(self):
+        # Yields the nodes of each level as a list; the next level is built
+        # from the current one, so no queue is needed.
+        level = [self.root] if self.root is not None else []
+        while level:
+            yield level
+            nxt = []
+            for r in level:
+                if r.left is not None:
+                    nxt.append(r.left)
+                if r.right is not None:
+                    nxt.append(r.right)
+            level = nxt
 
+    def _bfs_traversal(self):
         result = []
-        cola = queue.Queue()
-        cola.put(self.root)
-
-        while not cola.empty():
-            tmp = cola.get()
-            result.append(tmp.key)
-            if tmp.left is not None:
-                cola.put(tmp.left)
-            if tmp.right is not None:
-                cola.put(tmp.right)
-
+        for level in self._levels():
+            result.extend([r.key for r in level])
         return result
 
     def _print_tree(self, p, r, is_left):
@@ -147,20 +455,11 @@ class BinaryTree:
             self._print_tree(p + s, r.left, True)
             self._print_tree(p + s, r.right, False)
 
-    def _search(self,k):
-
-        if self.root is None:
-            return None
-        cola = queue.Queue()
-        cola.put(self.root)
-        while not cola.empty():
-            tmp = cola.get()
-            if tmp.key == k:
-                return tmp
-            if tmp.left is not None:
-                cola.put(tmp.left)
-            if tmp.right is not None:
-                cola.put(tmp.right)
+    def _search(self, k):
+        for level in self._levels():
+            for tmp in level:
+                if tmp.key == k:
+                    return tmp
         return None
 
     def _recursive_search(self, r, k):
@@ -174,7 +473,13 @@ class BinaryTree:
             return tmp
         else :
             return self._recursive_search(r.right, k)
-arbolito = BinaryTree()
-arbolito.create_from_file("tree.txt")
-tmp1 = arbolito.iterative_search('A')
-tmp2 = arbolito._recursive_search('Z')
+
+
+if __name__ == "__main__":
+    arbolito = BinaryTree()
+    if arbolito.create_from_file("tree.txt") is None:
+        print("Could not load tree.txt")
+    else:
+        arbolito.print_tree()
+        tmp1 = arbolito._search('A')
+        tmp2 = arbolito._recursive_search(arbolito.root, 'Z')
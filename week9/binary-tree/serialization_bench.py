@@ -0,0 +1,57 @@
+# Description: Load time of the recursive read(1) loader vs the buffered text
+# loader vs the binary format. Every load is checked against the source tree.
+
+import os
+import random
+import sys
+import tempfile
+from time import perf_counter
+
+from binary_tree import BinaryTree
+from traversal_bench import build_balanced
+
+
+def timed(fn):
+    t0 = perf_counter()
+    fn()
+    return perf_counter() - t0
+
+
+def load_recursive(tree, filename):
+    with open(filename, "r") as handle:
+        tree.root = tree._create_from_file(handle)
+
+
+if __name__ == "__main__":
+    # Text files take about 2 bytes per node: n=500_000_000 is ~1 GB on disk.
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+
+    source = build_balanced(n)
+    letters = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    stack = [source.root]
+    while stack:
+        r = stack.pop()
+        r.key = random.choice(letters)
+        stack.extend(c for c in (r.left, r.right) if c is not None)
+    expected = list(source._iter_preorder_slots())  # keys and shape
+
+    with tempfile.TemporaryDirectory() as tmp:
+        text_file = os.path.join(tmp, "tree.txt")
+        binary_file = os.path.join(tmp, "tree.bin")
+        source.save_to_file(text_file)
+        source.save_to_binary_file(binary_file)
+        print(f"Benchmark: tree loading (n={n})")
+        print(f"text size={os.path.getsize(text_file) / 1e6:.1f} MB  "
+              f"binary size={os.path.getsize(binary_file) / 1e6:.1f} MB")
+
+        results = []
+        for name, load in (
+            ("recursive read(1)", lambda t: load_recursive(t, text_file)),
+            ("buffered text", lambda t: t.create_from_file(text_file)),
+            ("binary (mmap)", lambda t: t.create_from_binary_file(binary_file)),
+        ):
+            tree = BinaryTree()
+            dt = timed(lambda: load(tree))
+            ok = list(tree._iter_preorder_slots()) == expected
+            results.append(dt)
+            print(f"{name:<18} time={dt:.4f}s  speedup={results[0] / dt:5.1f}x  correct={ok}")
@@ -0,0 +1,142 @@
+# Description: Round-trip tests for the `$` text format and the binary format.
+# Trees are compared by their pre-order with None for every empty child slot,
+# which fixes the shape as well as the keys.
+#
+#   python -m pytest test_serialization.py
+
+import random
+
+import pytest
+
+from binary_tree import BinaryTree, Node
+
+LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789"
+DEEP = 100_000  # far past the recursion limit
+
+
+def structure(tree):
+    return list(tree._iter_preorder_slots())
+
+
+def from_nodes(root):
+    tree = BinaryTree()
+    tree.root = root
+    return tree
+
+
+def chain_tree(n, side, keys):
+    # n nodes, each the `side` child of the previous one ("zigzag" alternates).
+    root = tail = None
+    for i in range(n):
+        tmp = Node(keys(i))
+        if tail is None:
+            root = tmp
+        elif side == "left" or (side == "zigzag" and i % 2):
+            tail.left = tmp
+        else:
+            tail.right = tmp
+        tail = tmp
+    return from_nodes(root)
+
+
+def random_tree(n, rng, keys):
+    # Grow the tree by hanging each new node on a random free slot.
+    if n == 0:
+        return BinaryTree()
+    root = Node(keys(0))
+    slots = [(root, "left"), (root, "right")]
+    for i in range(1, n):
+        parent, side = slots.pop(rng.randrange(len(slots)))
+        tmp = Node(keys(i))
+        setattr(parent, side, tmp)
+        slots += [(tmp, "left"), (tmp, "right")]
+    return from_nodes(root)
+
+
+def letter_keys(seed):
+    rng = random.Random(seed)
+    return lambda i: rng.choice(LETTERS)
+
+
+def text_keys(seed):
+    # Arbitrary-length keys, including `$`, multi-byte and empty strings.
+    rng = random.Random(seed)
+    pool = ["", "$", "ñ", "数据", "key with spaces", "x" * 300]
+    return lambda i: rng.choice(pool) if i % 3 == 0 else "".join(
+        rng.choice(LETTERS + "$€") for _ in range(rng.randrange(1, 8)))
+
+
+def trees(keys):
+    rng = random.Random(1)
+    cases = {
+        "single": from_nodes(Node(keys(0))),
+        "left chain": chain_tree(DEEP, "left", keys),
+        "right chain": chain_tree(DEEP, "right", keys),
+        "zigzag": chain_tree(DEEP, "zigzag", keys),
+    }
+    for n in (2, 3, 10, 1000, 50_000):
+        cases[f"random {n}"] = random_tree(n, rng, keys)
+    return cases
+
+
+TEXT_CASES = trees(letter_keys(0))
+BINARY_CASES = {**trees(text_keys(0)), **{f"letters {k}": t for k, t in TEXT_CASES.items()}}
+
+
+@pytest.mark.parametrize("name", TEXT_CASES)
+def test_text_round_trip(tmp_path, name):
+    source = TEXT_CASES[name]
+    path = tmp_path / "tree.txt"
+    source.save_to_file(path)
+    tree = BinaryTree()
+    assert tree.create_from_file(path) == 1
+    assert structure(tree) == structure(source)
+
+
+@pytest.mark.parametrize("name", BINARY_CASES)
+def test_binary_round_trip(tmp_path, name):
+    source = BINARY_CASES[name]
+    path = tmp_path / "tree.bin"
+    source.save_to_binary_file(path)
+    tree = BinaryTree()
+    assert tree.create_from_binary_file(path) == 1
+    assert structure(tree) == structure(source)
+
+
+def test_text_matches_recursive_loader(tmp_path):
+    source = TEXT_CASES["random 1000"]
+    path = tmp_path / "tree.txt"
+    source.save_to_file(path)
+    tree = BinaryTree()
+    with open(path) as handle:
+        tree.root = tree._create_from_file(handle)
+    assert structure(tree) == structure(source)
+
+
+def test_empty_tree(tmp_path):
+    source = BinaryTree()
+    text, binary = tmp_path / "tree.txt", tmp_path / "tree.bin"
+    source.save_to_file(text)
+    source.save_to_binary_file(binary)
+    for load, path in ((BinaryTree.create_from_file, text),
+                       (BinaryTree.create_from_binary_file, binary)):
+        tree = BinaryTree()
+        assert load(tree, path) is None
+        assert tree.is_empty()
+
+
+def test_text_rejects_unstorable_keys(tmp_path):
+    for key in ("$", "AB", ""):
+        with pytest.raises(ValueError):
+            from_nodes(Node(key)).save_to_file(tmp_path / "tree.txt")
+
+
+def test_truncated_files_do_not_load(tmp_path):
+    source = TEXT_CASES["random 1000"]
+    text, binary = tmp_path / "tree.txt", tmp_path / "tree.bin"
+    source.save_to_file(text)
+    source.save_to_binary_file(binary)
+    text.write_bytes(text.read_bytes()[:-1])
+    binary.write_bytes(binary.read_bytes()[:-1])
+    assert BinaryTree().create_from_file(text) is None
+    assert BinaryTree().create_from_binary_file(binary) is None
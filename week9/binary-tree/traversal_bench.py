@@ -0,0 +1,78 @@
+# Description: Recursive list-building traversals vs explicit-stack iterators
+# on balanced and degenerate binary trees.
+
+import sys
+from time import perf_counter
+
+from binary_tree import BinaryTree, Node
+
+
+def build_balanced(n):
+    """Build a complete tree with keys 0..n-1 laid out in heap order."""
+    tree = BinaryTree()
+    if n == 0:
+        return tree
+    nodes = [Node(i) for i in range(n)]
+    for i in range(n):
+        l = 2 * i + 1
+        r = 2 * i + 2
+        if l < n:
+            nodes[i].left = nodes[l]
+        if r < n:
+            nodes[i].right = nodes[r]
+    tree.root = nodes[0]
+    return tree
+
+
+def build_degenerate(n):
+    """Build a right-leaning chain of n nodes (height n - 1)."""
+    tree = BinaryTree()
+    tail = None
+    for i in range(n):
+        tmp = Node(i)
+        if tail is None:
+            tree.root = tmp
+        else:
+            tail.right = tmp
+        tail = tmp
+    return tree
+
+
+def time_call(fn):
+    t0 = perf_counter()
+    try:
+        fn()
+    except RecursionError:
+        return None
+    return perf_counter() - t0
+
+
+def first_k(it, k):
+    for i, _ in enumerate(it):
+        if i + 1 == k:
+            break
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+    for shape, builder in (("balanced", build_balanced), ("degenerate", build_degenerate)):
+        tree = builder(n)
+        print(f"\nShape: {shape} (n={n})")
+        cases = [
+            ("pre_order", lambda: tree._pre_order(tree.root), tree.pre_order),
+            ("in_order", lambda: tree._in_order(tree.root), tree.in_order),
+            ("pos_order", lambda: tree._pos_order(tree.root), tree.pos_order),
+        ]
+        for name, recursive, iterative in cases:
+            rec_t = time_call(recursive)
+            it_t = time_call(iterative)
+            rec = "RecursionError" if rec_t is None else f"{rec_t:.4f}s"
+            print(f"{name:<10} recursive={rec:<16} iterative={it_t:.4f}s")
+
+        bfs_t = time_call(tree.bfs_traversal)
+        level_t = time_call(lambda: list(tree.iter_level_order()))
+        print(f"{'bfs':<10} bfs_traversal={bfs_t:.4f}s  iter_level_order={level_t:.4f}s")
+
+        early_t = time_call(lambda: first_k(tree.iter_pre_order(), 10))
+        print(f"{'first 10':<10} iter_pre_order={early_t:.6f}s")